@@ -5,8 +5,18 @@ Utility for loading structured YAML configuration files used across modules
 like ETL, diagnostics, and modeling.
 """
 
+from typing import Any
+
 import yaml
 
+# libyaml's loader parses the same safe subset several times faster than the pure-Python one.
+_YAML_SAFE_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def safe_load_yaml(stream: Any) -> Any:
+    """``yaml.safe_load`` through libyaml when PyYAML was built with it."""
+    return yaml.load(stream, Loader=_YAML_SAFE_LOADER)
+
 
 def load_config(config_path: str):
     """
@@ -20,6 +30,6 @@ def load_config(config_path: str):
     """
     # Load YAML file
     with open(config_path, "r") as f:
-        config = yaml.safe_load(f)
+        config = safe_load_yaml(f)
 
     return config
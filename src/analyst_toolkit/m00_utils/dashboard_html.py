@@ -43,16 +43,19 @@ def _render_generic_dashboard(
     sections = []
     toc = []
     for section_name, value in report_tables.items():
-        body = "<div class='stack'>"
+        parts = ["<div class='stack'>"]
         if isinstance(value, pd.DataFrame):
-            body += _render_df(value)
+            parts.append(_render_df(value))
         elif isinstance(value, dict):
             for sub_key, sub_value in value.items():
                 if isinstance(sub_value, pd.DataFrame) and not sub_value.empty:
-                    body += f"<div><h3>{_display_name(sub_key)}</h3>{_render_df(sub_value)}</div>"
+                    parts.append(
+                        f"<div><h3>{_display_name(sub_key)}</h3>{_render_df(sub_value)}</div>"
+                    )
         else:
-            body += "<p class='empty'>No data available.</p>"
-        body += "</div>"
+            parts.append("<p class='empty'>No data available.</p>")
+        parts.append("</div>")
+        body = "".join(parts)
         sections.append(_render_section(_display_name(section_name), body, open_by_default=True))
         toc.append((section_name, _display_name(section_name)))
 
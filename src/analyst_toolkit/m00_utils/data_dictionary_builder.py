@@ -7,6 +7,7 @@ from typing import Any
 import pandas as pd
 import yaml
 
+from analyst_toolkit.m00_utils.config_loader import safe_load_yaml
 from analyst_toolkit.m01_diagnostics.data_diag import generate_data_profile
 
 _PROFILE_DEPTH_SETTINGS = {
@@ -33,7 +34,7 @@ def _parse_inferred_configs(configs: dict[str, Any]) -> tuple[dict[str, dict[str
             parsed[module_name] = {}
             continue
         try:
-            loaded = yaml.safe_load(payload) or {}
+            loaded = safe_load_yaml(payload) or {}
         except yaml.YAMLError as exc:
             warnings.append(f"Failed to parse inferred {module_name} config: {exc}")
             parsed[module_name] = {}
@@ -6,13 +6,18 @@ Standardized export utilities for Analyst Toolkit pipeline modules.
 
 # mypy: ignore-errors
 
+import datetime as dt
 import logging
+import numbers
 from pathlib import Path
 
 import pandas as pd
 from joblib import dump
 
 _HTML_SIZE_WARNING_THRESHOLD_MB = 25
+# Workbooks with a sheet at least this long are streamed row by row in XlsxWriter's
+# constant_memory mode instead of being held in memory by DataFrame.to_excel.
+_EXCEL_STREAM_MIN_ROWS = 50_000
 
 
 def _format_export_path(export_path: str, run_id: str | None) -> Path:
@@ -27,6 +32,72 @@ def _resolve_export_file_path(export_path: Path, run_id: str | None) -> Path:
     return export_path.with_name(f"{run_id}_{export_path.name}")
 
 
+def write_csv(df: pd.DataFrame, path, encoding: str = "utf-8", engine: str | None = None) -> None:
+    """
+    Write ``df`` to ``path`` as CSV without the index.
+
+    Args:
+        df (pd.DataFrame): The DataFrame to write.
+        path: Destination file path.
+        encoding (str): Output encoding.
+        engine (str, optional): ``"pyarrow"`` writes UTF-8 output through pyarrow's
+            multithreaded C++ writer, which is much faster on large frames. Its text
+            differs from ``DataFrame.to_csv``: strings and headers are quoted, booleans
+            are written as ``true``/``false``, and datetimes as full nanosecond
+            timestamps. Falls back to ``DataFrame.to_csv`` when pyarrow is unavailable
+            or cannot represent a column.
+    """
+    if engine == "pyarrow" and encoding.lower().replace("-", "") == "utf8":
+        try:
+            import pyarrow as pa
+            from pyarrow import csv as pa_csv
+        except ImportError:
+            pa = None
+        if pa is not None:
+            try:
+                table = pa.Table.from_pandas(df, preserve_index=False)
+                pa_csv.write_csv(table, str(path))
+                return
+            except (pa.ArrowException, ValueError, TypeError) as exc:
+                # Mixed-object or nested columns: fall back to pandas' writer.
+                logging.debug("pyarrow CSV writer unavailable for %s: %s", path, exc)
+    df.to_csv(path, index=False, encoding=encoding)
+
+
+def _stream_excel_sheet(workbook, sheet_name: str, df: pd.DataFrame) -> None:
+    """
+    Write ``df`` to a new worksheet strictly in row order.
+
+    constant_memory mode flushes each row once a later row is started, while
+    DataFrame.to_excel emits cells column by column, so streamed sheets are written here.
+    Missing values are left blank, matching DataFrame.to_excel.
+    """
+    worksheet = workbook.add_worksheet(sheet_name)
+    header_format = workbook.add_format(
+        {"bold": True, "border": 1, "align": "center", "valign": "top"}
+    )
+    date_format = workbook.add_format({"num_format": "yyyy-mm-dd"})
+    datetime_format = workbook.add_format({"num_format": "yyyy-mm-dd hh:mm:ss"})
+
+    worksheet.write_row(0, 0, [str(col) for col in df.columns], header_format)
+    for row_idx, row in enumerate(df.itertuples(index=False, name=None), start=1):
+        for col_idx, value in enumerate(row):
+            if pd.api.types.is_scalar(value) and pd.isna(value):
+                continue
+            if isinstance(value, dt.datetime):
+                if value.tzinfo is not None:
+                    value = value.replace(tzinfo=None)
+                worksheet.write_datetime(row_idx, col_idx, value, datetime_format)
+            elif isinstance(value, dt.date):
+                worksheet.write_datetime(row_idx, col_idx, value, date_format)
+            elif isinstance(value, bool):
+                worksheet.write_boolean(row_idx, col_idx, value)
+            elif isinstance(value, numbers.Real):
+                worksheet.write_number(row_idx, col_idx, value)
+            else:
+                worksheet.write_string(row_idx, col_idx, str(value))
+
+
 def export_dataframes(
     data_dict: dict[str, pd.DataFrame],
     export_path: str,
@@ -34,9 +105,14 @@ def export_dataframes(
     encoding: str = "utf-8",
     run_id: str = None,
     logging_mode: str = "on",
+    csv_engine: str | None = None,
 ):
     """
     Export a dictionary of DataFrames. (Updated to accept 'xlsx' as a valid format).
+
+    'csv' and 'parquet' write one file per DataFrame next to ``export_path``; Parquet files
+    are zstd-compressed and are far cheaper to write than the Excel workbook for large frames.
+    ``csv_engine="pyarrow"`` opts CSV files into pyarrow's writer (see ``write_csv``).
     """
     export_path = _format_export_path(export_path, run_id)
     normalized_format = file_format.lower()
@@ -54,19 +130,44 @@ def export_dataframes(
             if isinstance(df, pd.DataFrame) and not df.empty:
                 # Construct a unique filename for each dataframe
                 filename = f"{base_stem}_{name}.csv"
-                df.to_csv(base_dir / filename, index=False, encoding=encoding)
+                write_csv(df, base_dir / filename, encoding=encoding, engine=csv_engine)
         if logging_mode != "off":
             logging.info("Exported %s CSV files to directory %s", len(data_dict), base_dir)
 
+    elif normalized_format == "parquet":
+        resolved_export_path = _resolve_export_file_path(export_path, run_id)
+        base_dir = resolved_export_path.parent
+        base_stem = resolved_export_path.stem
+        for name, df in data_dict.items():
+            if isinstance(df, pd.DataFrame) and not df.empty:
+                # Parquet requires string column names; flatten MultiIndex columns as Excel does.
+                if isinstance(df.columns, pd.MultiIndex):
+                    columns = ["__".join(map(str, col)).strip() for col in df.columns.values]
+                else:
+                    columns = [str(col) for col in df.columns]
+                df.set_axis(columns, axis=1).to_parquet(
+                    base_dir / f"{base_stem}_{name}.parquet", index=False, compression="zstd"
+                )
+        if logging_mode != "off":
+            logging.info("Exported %s Parquet files to directory %s", len(data_dict), base_dir)
+
     # Accept both 'excel' and 'xlsx' as valid identifiers for an Excel file.
     elif normalized_format in ["excel", "xlsx"]:
         path_with_run_id = _resolve_export_file_path(export_path, run_id)
         # Set explicit Excel number formats so spreadsheet apps render dates consistently
+        stream = any(
+            isinstance(df, pd.DataFrame) and len(df) >= _EXCEL_STREAM_MIN_ROWS
+            for df in data_dict.values()
+        )
+        engine_kwargs = (
+            {"options": {"constant_memory": True, "nan_inf_to_errors": True}} if stream else None
+        )
         with pd.ExcelWriter(
             path_with_run_id,
             engine="xlsxwriter",
             date_format="yyyy-mm-dd",
             datetime_format="yyyy-mm-dd hh:mm:ss",
+            engine_kwargs=engine_kwargs,
         ) as writer:
             for name, df in data_dict.items():
                 if isinstance(df, pd.DataFrame) and not df.empty:
@@ -78,7 +179,10 @@ def export_dataframes(
                                 "Flattened MultiIndex columns in sheet '%s' for Excel compatibility.",
                                 name,
                             )
-                    df.to_excel(writer, sheet_name=name[:31], index=False)
+                    if stream:
+                        _stream_excel_sheet(writer.book, name[:31], df)
+                    else:
+                        df.to_excel(writer, sheet_name=name[:31], index=False)
         if logging_mode != "off":
             logging.info("Exported %s sheets to %s", len(data_dict), path_with_run_id)
     else:
@@ -8,7 +8,7 @@ Analyst Toolkit. All functions are intentionally non-transformative,
 serving as clean entry points for pipeline ingestion.
 
 Functions:
-- load_csv(path): Loads a CSV file into a pandas DataFrame.
+- load_csv(path, engine=None): Loads a CSV file into a pandas DataFrame.
 - load_joblib(path): Loads a joblib file.
 """
 
@@ -24,17 +24,27 @@ _TRUTHY_ENV_VALUES = {"1", "true", "yes", "on"}
 _ALLOW_UNSAFE_JOBLIB_ENV = "ANALYST_TOOLKIT_ALLOW_UNSAFE_JOBLIB"
 
 
-def load_csv(path: str) -> pd.DataFrame:
+def load_csv(path: str, engine: str | None = None) -> pd.DataFrame:
     """
     Loads a CSV file from a given path.
 
     Args:
         path (str): Path to the CSV file.
+        engine (str, optional): pandas parser engine. ``"pyarrow"`` tokenizes on
+            multiple threads and is much faster on large files, but infers ISO dates
+            as datetimes and leaves missing strings as None. Falls back to the
+            default parser when pyarrow is unavailable.
 
     Returns:
         pd.DataFrame: Loaded data as a pandas DataFrame.
     """
-    return pd.read_csv(path)
+    if engine == "pyarrow":
+        try:
+            return pd.read_csv(path, engine="pyarrow")
+        except ImportError:
+            logger.warning("pyarrow is unavailable; reading %s with the default CSV parser.", path)
+            engine = None
+    return pd.read_csv(path, engine=engine)
 
 
 def _unsafe_joblib_loading_enabled() -> bool:
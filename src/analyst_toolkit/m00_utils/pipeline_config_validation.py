@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from copy import deepcopy
-from typing import Any
+from typing import Any, Literal
 
 from pydantic import BaseModel, ConfigDict, Field, ValidationError
 
@@ -33,6 +33,7 @@ class PipelineRunnerConfig(BaseModel):
     run_id: str
     notebook: bool = False
     pipeline_entry_path: str
+    csv_engine: Literal["c", "python", "pyarrow"] | None = None
     modules: dict[str, PipelineModuleSelection] = Field(default_factory=dict)
 
 
@@ -40,6 +41,7 @@ class OutlierHandlingExportConfig(BaseModel):
     run: bool = False
     export_path: str | None = None
     as_csv: bool = False
+    format: Literal["excel", "xlsx", "csv", "parquet"] | None = None
     export_html: bool = False
     export_html_path: str | None = None
 
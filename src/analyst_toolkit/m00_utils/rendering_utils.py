@@ -13,20 +13,117 @@ Used across the Analyst Toolkit for consistent inline diagnostics, QA summaries,
 
 from __future__ import annotations
 
+import hashlib
+import sys
+import threading
+from collections import OrderedDict
 from typing import Any
 
 import pandas as pd
 
-
-def _display_markdown(markdown_text: str) -> None:
-    """Render Markdown in notebooks when available, otherwise fall back to stdout."""
+# Rendered tables keyed by a content fingerprint of the displayed slice, so re-rendering
+# an unchanged report (notebook re-runs, parameter sweeps) skips DataFrame.to_html.
+# Report export renders off the event loop, so lookups and evictions share a lock.
+_HTML_TABLE_CACHE_GUARD = threading.Lock()
+_HTML_TABLE_CACHE: OrderedDict[tuple[str, bool], str] = OrderedDict()
+_MAX_HTML_TABLE_CACHE = 32
+
+# Tables up to this many rows whose cells are all ints or strings are written directly;
+# DataFrame.to_html builds a full formatter pipeline that dominates these tiny renders.
+_SMALL_TABLE_MAX_ROWS = 25
+_HTML_ESCAPES = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;"})
+_CONTROL_ESCAPES = str.maketrans({"\t": "\\t", "\n": "\\n", "\r": "\\r"})
+
+# IPython's display helpers, resolved once a live shell is seen.
+_IPYTHON_DISPLAY: tuple[Any, Any] | None = None
+
+
+def _ipython_display():
+    """Return IPython's ``(display, Markdown)`` inside a live shell, else None."""
+    global _IPYTHON_DISPLAY
+    if _IPYTHON_DISPLAY is not None:
+        return _IPYTHON_DISPLAY
+    # A running kernel has always imported IPython already, so scripts and CLI runs
+    # never trigger the import themselves.
+    ipython = sys.modules.get("IPython")
+    get_ipython = getattr(ipython, "get_ipython", None)
+    if get_ipython is None or get_ipython() is None:
+        return None
     try:
         from IPython.display import Markdown, display
     except ImportError:
+        return None
+    _IPYTHON_DISPLAY = (display, Markdown)
+    return _IPYTHON_DISPLAY
+
+
+def _display_markdown(markdown_text: str) -> None:
+    """Render Markdown in notebooks when available, otherwise fall back to stdout."""
+    ipython_display = _ipython_display()
+    if ipython_display is None:
         print(markdown_text)
         return
 
-    display(Markdown(markdown_text))
+    display, markdown = ipython_display
+    display(markdown(markdown_text))
+
+
+def _frame_fingerprint(df: pd.DataFrame) -> str | None:
+    """Hash a frame's columns, dtypes, and values; None when cells are unhashable."""
+    try:
+        row_hashes = pd.util.hash_pandas_object(df, index=False).to_numpy()
+    except TypeError:
+        return None
+    digest = hashlib.sha256(row_hashes.tobytes())
+    digest.update(repr([(str(c), str(t)) for c, t in df.dtypes.items()]).encode())
+    return digest.hexdigest()
+
+
+def _small_table_html(df: pd.DataFrame, escape: bool) -> str | None:
+    """
+    Write ``df`` in the exact ``to_html(classes="table table-striped", index=False)``
+    layout, or return None when the frame needs pandas' formatter.
+
+    Only frames of at most ``_SMALL_TABLE_MAX_ROWS`` rows qualify. Their column labels
+    must be strings, and every column must be integer-typed or hold only strings, so
+    that ``str`` matches pandas' cell formatting.
+    """
+    if len(df) > _SMALL_TABLE_MAX_ROWS or isinstance(df.columns, pd.MultiIndex):
+        return None
+    if not all(isinstance(label, str) for label in df.columns):
+        return None
+    columns = []
+    for _, series in df.items():
+        kind = series.dtype.kind
+        if kind not in "iuO":
+            return None
+        values = series.tolist()
+        if kind == "O" and not all(isinstance(value, str) for value in values):
+            return None
+        columns.append(values)
+
+    def cell(value, tag: str) -> str:
+        # Body cells show control characters as escape sequences; headers keep them raw.
+        text = str(value) if tag == "th" else str(value).translate(_CONTROL_ESCAPES)
+        if escape:
+            text = text.translate(_HTML_ESCAPES)
+        return f"<{tag}>{text.strip()}</{tag}>"
+
+    lines = [
+        '<table border="1" class="dataframe table table-striped">',
+        "  <thead>",
+        '    <tr style="text-align: right;">',
+        *(f"      {cell(label, 'th')}" for label in df.columns),
+        "    </tr>",
+        "  </thead>",
+        "  <tbody>",
+    ]
+    for row in zip(*columns, strict=True):
+        lines.append("    <tr>")
+        lines.extend(f"      {cell(value, 'td')}" for value in row)
+        lines.append("    </tr>")
+    lines += ["  </tbody>", "</table>"]
+    return "\n".join(lines)
 
 
 def to_html_table(df, max_rows=25, full_preview=False, escape: bool = True):
@@ -46,7 +143,25 @@ def to_html_table(df, max_rows=25, full_preview=False, escape: bool = True):
         return "<p><em>No data available.</em></p>"
 
     display_df = df if full_preview else df.head(max_rows)
-    return display_df.to_html(classes="table table-striped", escape=escape, index=False)
+    small_html = _small_table_html(display_df, escape)
+    if small_html is not None:
+        return small_html
+    fingerprint = _frame_fingerprint(display_df)
+    key = (fingerprint, escape)
+    if fingerprint is not None:
+        with _HTML_TABLE_CACHE_GUARD:
+            cached = _HTML_TABLE_CACHE.get(key)
+            if cached is not None:
+                _HTML_TABLE_CACHE.move_to_end(key)
+                return cached
+
+    html = display_df.to_html(classes="table table-striped", escape=escape, index=False)
+    if fingerprint is not None:
+        with _HTML_TABLE_CACHE_GUARD:
+            _HTML_TABLE_CACHE[key] = html
+            if len(_HTML_TABLE_CACHE) > _MAX_HTML_TABLE_CACHE:
+                _HTML_TABLE_CACHE.popitem(last=False)
+    return html
 
 
 def display_markdown_summary(title: str, df: pd.DataFrame, max_rows: int = 10):
@@ -59,10 +174,15 @@ def display_markdown_summary(title: str, df: pd.DataFrame, max_rows: int = 10):
         max_rows (int): Maximum number of rows to show.
     """
     trimmed_df = df.head(max_rows)
-    try:
-        table_body = trimmed_df.to_markdown(index=False)
-    except ImportError:
+    # Outside a live shell the table is only printed, so skip tabulate's per-cell
+    # formatting and emit the plain-text layout the ImportError fallback already uses.
+    if _ipython_display() is None:
         table_body = trimmed_df.to_string(index=False)
+    else:
+        try:
+            table_body = trimmed_df.to_markdown(index=False)
+        except ImportError:
+            table_body = trimmed_df.to_string(index=False)
     markdown = f"### {title}\n\n{table_body}"
     _display_markdown(markdown)
 
@@ -320,8 +320,8 @@ def generate_imputation_report(
                 audit_df = pd.DataFrame(
                     {
                         "Value": all_values,
-                        "Original Count": [vc_before.get(val, 0) for val in all_values],
-                        "Imputed Count": [vc_after.get(val, 0) for val in all_values],
+                        "Original Count": vc_before.reindex(all_values, fill_value=0).to_numpy(),
+                        "Imputed Count": vc_after.reindex(all_values, fill_value=0).to_numpy(),
                     }
                 ).sort_values(by=["Original Count", "Imputed Count"], ascending=False)
                 audit_df["Change"] = audit_df["Imputed Count"] - audit_df["Original Count"]
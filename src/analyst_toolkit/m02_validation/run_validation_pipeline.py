@@ -49,11 +49,18 @@ def configure_logging(notebook: bool = True, logging_mode: str = "auto"):
 
 
 def run_validation_pipeline(
-    config: dict, notebook: bool = False, df: pd.DataFrame = None, run_id: str = None
+    config: dict,
+    notebook: bool = False,
+    df: pd.DataFrame = None,
+    run_id: str = None,
+    cache_results: bool = False,
 ):
     """
     Executes the validation pipeline with robust configuration handling
     for both standalone and master-runner execution.
+
+    ``cache_results`` keeps the suite results for ``df`` so a caller can fetch them
+    again with ``run_validation_suite(..., reuse_cached=True)``.
     """
     # --- ROBUST CONFIGURATION HANDLING ---
     # If the 'validation' key exists, it means the full config was passed (from master runner).
@@ -85,7 +92,9 @@ def run_validation_pipeline(
 
     schema_validation_cfg = module_cfg.get("schema_validation", {})
     if schema_validation_cfg.get("run", False):
-        validation_results = run_validation_suite(df, config=module_cfg)
+        validation_results = run_validation_suite(
+            df, config=module_cfg, cache_results=cache_results
+        )
 
         fail_on_error = schema_validation_cfg.get("fail_on_error", False)
         if fail_on_error:
@@ -16,8 +16,113 @@ Checks include:
 Returns structured output for downstream display or export.
 """
 
+import hashlib
+import json
+import weakref
+from typing import Callable
+
 import pandas as pd
 
+# Compiled pass/fail validators keyed by a stable hash of the rule set.
+_COMPILED_VALIDATORS: dict[str, Callable[[pd.DataFrame], dict]] = {}
+_MAX_COMPILED_VALIDATORS = 256
+
+# Suite results keyed by (id(df), schema hash). Entries hold only a weak reference to the
+# frame and are dropped as soon as it is garbage collected (e.g. on session eviction).
+_RESULT_CACHE: dict[tuple[int, str], tuple[weakref.ref, dict]] = {}
+
+
+def _schema_hash(rules: dict) -> str:
+    """Return a stable content hash for a validation rule set."""
+    payload = json.dumps(rules, sort_keys=True, default=repr)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _build_validator_source(rules: dict) -> tuple[str, list]:
+    """
+    Emit the source of a specialized validator for the given rules.
+
+    Rule constants (column names, bounds, allowed sets) are bound through a
+    ``_k`` tuple rather than spliced into the source, so arbitrary config
+    values can never be interpreted as code.
+    """
+    consts: list = []
+
+    def const(value) -> str:
+        consts.append(value)
+        return f"_k[{len(consts) - 1}]"
+
+    lines = ["def _validate(df):", "    r = {}", "    cols = df.columns"]
+
+    expected_cols = set(rules.get("expected_columns", []))
+    if expected_cols:
+        lines.append(f"    r['schema_conformity'] = set(cols) == {const(expected_cols)}")
+    else:
+        lines.append("    r['schema_conformity'] = True")
+
+    for col, expected in rules.get("expected_types", {}).items():
+        key, name = const(f"dtype_enforcement.{col}"), const(col)
+        lines.append(
+            f"    r[{key}] = {name} not in cols or str(df[{name}].dtype) == {const(expected)}"
+        )
+
+    for col, allowed in rules.get("categorical_values", {}).items():
+        key, name = const(f"categorical_values.{col}"), const(col)
+        lines.append(f"    if {name} in cols:")
+        lines.append(f"        s = df[{name}]")
+        lines.append(f"        r[{key}] = bool((s.isin({const(set(allowed))}) | s.isna()).all())")
+
+    for col, bounds in rules.get("numeric_ranges", {}).items():
+        if "min" not in bounds or "max" not in bounds:
+            continue
+        key, name = const(f"numeric_ranges.{col}"), const(col)
+        lo, hi = const(bounds["min"]), const(bounds["max"])
+        lines.append(f"    if {name} in cols:")
+        lines.append(f"        s = df[{name}]")
+        lines.append(f"        r[{key}] = bool((s.between({lo}, {hi}) | s.isna()).all())")
+
+    lines.append("    return r")
+    return "\n".join(lines), consts
+
+
+def _compiled_validator(rules: dict, key: str) -> Callable[[pd.DataFrame], dict]:
+    validator = _COMPILED_VALIDATORS.get(key)
+    if validator is None:
+        source, consts = _build_validator_source(rules)
+        namespace: dict = {"_k": tuple(consts)}
+        exec(compile(source, f"<validator:{key[:12]}>", "exec"), namespace)
+        validator = namespace["_validate"]
+        if len(_COMPILED_VALIDATORS) >= _MAX_COMPILED_VALIDATORS:
+            _COMPILED_VALIDATORS.pop(next(iter(_COMPILED_VALIDATORS)))
+        _COMPILED_VALIDATORS[key] = validator
+    return validator
+
+
+def compile_schema(schema_cfg: dict) -> Callable[[pd.DataFrame], dict]:
+    """
+    Compile a ``schema_validation`` block into a specialized pass/fail validator.
+
+    The returned function maps a DataFrame to ``{rule_key: bool}`` where keys are
+    ``schema_conformity`` or ``<check>.<column>``. Rules for absent columns are
+    omitted. Validators are cached by a hash of the rule set, so recurring
+    schemas are only compiled once per process.
+    """
+    rules = schema_cfg.get("rules", {}) or {}
+    return _compiled_validator(rules, _schema_hash(rules))
+
+
+def _get_cached_results(df: pd.DataFrame, key: tuple[int, str]) -> dict | None:
+    entry = _RESULT_CACHE.get(key)
+    if entry is None or entry[0]() is not df:
+        return None
+    # Each caller gets its own top-level dict so it can't rewrite the cached entry.
+    return dict(entry[1])
+
+
+def _cache_results(df: pd.DataFrame, key: tuple[int, str], results: dict) -> None:
+    ref = weakref.ref(df, lambda _ref, key=key: _RESULT_CACHE.pop(key, None))
+    _RESULT_CACHE[key] = (ref, results)
+
 
 def validate_categorical_values(df: pd.DataFrame, validation_plan: dict) -> dict:
     """
@@ -43,13 +148,29 @@ def validate_categorical_values(df: pd.DataFrame, validation_plan: dict) -> dict
     return invalid_details
 
 
-def run_validation_suite(df: pd.DataFrame, config: dict) -> dict:
+def run_validation_suite(
+    df: pd.DataFrame, config: dict, reuse_cached: bool = False, cache_results: bool = False
+) -> dict:
     """
     Runs a suite of validation checks and returns a structured, auditable results dictionary.
+
+    With ``cache_results=True``, the results are kept for the lifetime of ``df`` so a later
+    call with ``reuse_cached=True`` over the *same* DataFrame object and rule set can return
+    them without validating again. Only reuse when the frame has not been mutated in place
+    since that run (e.g. repeat validation of a session-held frame).
     """
     schema_validation_cfg = config.get("schema_validation", {})
     rules = schema_validation_cfg.get("rules", {})
+    schema_key = _schema_hash(rules or {})
+    cache_key = (id(df), schema_key)
+    if reuse_cached:
+        cached = _get_cached_results(df, cache_key)
+        if cached is not None:
+            return cached
+
     results = {}
+    # Cheap pass/fail sweep first; detailed violation frames are only built for failing rules.
+    rule_flags = _compiled_validator(rules or {}, schema_key)(df)
 
     # --- Schema Conformity ---
     expected_cols = set(rules.get("expected_columns", []))
@@ -85,7 +206,11 @@ def run_validation_suite(df: pd.DataFrame, config: dict) -> dict:
     }
 
     # --- Categorical Value Validation ---
-    allowed_values = rules.get("categorical_values", {})
+    allowed_values = {
+        col: allowed
+        for col, allowed in rules.get("categorical_values", {}).items()
+        if not rule_flags.get(f"categorical_values.{col}", True)
+    }
     cat_violations = validate_categorical_values(df, allowed_values)
     results["categorical_values"] = {
         "rule_description": "Verify values in categorical columns are within an allowed set.",
@@ -97,7 +222,9 @@ def run_validation_suite(df: pd.DataFrame, config: dict) -> dict:
     numeric_ranges = rules.get("numeric_ranges", {})
     range_violations = {}
     for col, bounds in numeric_ranges.items():
-        if col in df.columns and "min" in bounds and "max" in bounds:
+        if rule_flags.get(f"numeric_ranges.{col}", True):
+            continue
+        if "min" in bounds and "max" in bounds:
             min_val, max_val = bounds["min"], bounds["max"]
             violating_rows = df[~df[col].between(min_val, max_val) & df[col].notna()]
             if not violating_rows.empty:
@@ -123,4 +250,6 @@ def run_validation_suite(df: pd.DataFrame, config: dict) -> dict:
     coverage_pct = ((total_rows - failing_rows_count) / total_rows * 100) if total_rows > 0 else 100
     results["summary"] = {"row_coverage_percent": round(coverage_pct, 2)}
 
+    if cache_results:
+        _cache_results(df, cache_key, results)
     return results
@@ -64,7 +64,7 @@ def display_validation_summary(results: dict, notebook: bool = True):
     for name, check in checks.items():
         if not check["passed"]:
             title = f"⚠️ Drill-Down: {name.replace('_', ' ').title()}"
-            content = ""
+            content_parts = []
             details = check["details"]
 
             if name == "categorical_values":
@@ -84,9 +84,9 @@ def display_validation_summary(results: dict, notebook: bool = True):
                          <p><strong>Invalid Values Found:</strong></p>
                          <div style="max-height: 300px; overflow-y: auto;">{summary_table}</div>
                     </div>"""
-                    content += f"""
+                    content_parts.append(f"""
                     <div style="display: flex; gap: 20px; align-items: flex-start;">{context_html}{scrolling_table_html}</div>
-                    <hr style="border-top: 1px solid #d0d7de; margin: 18px 0;">"""
+                    <hr style="border-top: 1px solid #d0d7de; margin: 18px 0;">""")
             else:
                 if name == "schema_conformity":
                     df_details = pd.DataFrame(
@@ -102,7 +102,7 @@ def display_validation_summary(results: dict, notebook: bool = True):
                             },
                         ]
                     )
-                    content = to_html_table(df_details)
+                    content_parts.append(to_html_table(df_details))
                 elif name == "dtype_enforcement":
                     # This block is now corrected
                     df_details = pd.DataFrame.from_dict(details, orient="index")
@@ -110,13 +110,16 @@ def display_validation_summary(results: dict, notebook: bool = True):
                     df_details = df_details.rename(
                         columns={"expected": "Expected Type", "actual": "Actual Type"}
                     )
-                    content = to_html_table(df_details.reset_index(), full_preview=True)
+                    content_parts.append(to_html_table(df_details.reset_index(), full_preview=True))
                 elif name == "numeric_ranges":
                     for col, violation_info in details.items():
                         context_html = f"<p><strong>Rule:</strong> Values must be in the range {violation_info['enforced_range']}</p>"
-                        content += f"<h5>Column: <code>{col}</code></h5>{context_html}"
-                        content += to_html_table(violation_info["violating_rows"], max_rows=5)
+                        content_parts.append(f"<h5>Column: <code>{col}</code></h5>{context_html}")
+                        content_parts.append(
+                            to_html_table(violation_info["violating_rows"], max_rows=5)
+                        )
 
+            content = "".join(content_parts)
             drill_down_blocks.append(f"""
             <details><summary><strong>{title}(click to expand & scroll)</strong></summary>
                 <div style="max-height: 400px; overflow-y: auto; margin-top: 1em; padding: 10px; border-top: 1px solid #eee;">
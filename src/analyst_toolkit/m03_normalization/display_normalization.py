@@ -66,7 +66,7 @@ def display_normalization_summary(
 
     # --- REFACTORED PREVIEW SECTION ---
     preview_cols = rules.get("preview_columns", [])
-    column_analysis_html = ""
+    column_blocks = []
 
     for col in preview_cols:
         original_col_name = _get_original_col_name(changelog, col)
@@ -85,8 +85,8 @@ def display_normalization_summary(
             audit_df = pd.DataFrame(
                 {
                     "Value": all_values,
-                    "Original Count": [vc_before.get(val, 0) for val in all_values],
-                    "Normalized Count": [vc_after.get(val, 0) for val in all_values],
+                    "Original Count": vc_before.reindex(all_values, fill_value=0).to_numpy(),
+                    "Normalized Count": vc_after.reindex(all_values, fill_value=0).to_numpy(),
                 }
             ).sort_values(by=["Original Count", "Normalized Count"], ascending=False)
             audit_html = to_html_table(audit_df, max_rows=20)
@@ -107,9 +107,10 @@ def display_normalization_summary(
                 </div>
             </div>
             """
-            column_analysis_html += column_html
+            column_blocks.append(column_html)
 
-    if column_analysis_html:
+    if column_blocks:
+        column_analysis_html = "".join(column_blocks)
         # New container matches the vertical, scrollable drill-down from the validation display
         container_html = f"""
         <details>
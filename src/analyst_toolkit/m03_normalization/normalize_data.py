@@ -15,14 +15,47 @@ from thefuzz import process as fuzz_process
 
 def standardize_text(series: pd.Series) -> pd.Series:
     """Standardizes strings by trimming and lowercasing, preserving nulls."""
-    return series.apply(lambda x: x.strip().lower() if isinstance(x, str) else x)
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        # Clean the categories rather than the cells so the column stays categorical.
+        old = series.cat.categories
+        new = standardize_text(pd.Series(old, dtype=object))
+        merged = pd.Index(new).unique()
+        if len(merged) == len(old):
+            return series.cat.rename_categories(list(new))
+        # Categories that collapse onto each other ("A", "a ") merge into one.
+        dtype = pd.CategoricalDtype(merged, ordered=series.cat.ordered)
+        return series.map(dict(zip(old, new))).astype(dtype)
+    try:
+        cleaned = series.str.strip().str.lower()
+    except AttributeError:
+        # No .str accessor (numeric, datetime, ...): go element by element.
+        return series.apply(lambda x: x.strip().lower() if isinstance(x, str) else x)
+    # The .str methods turn non-string cells into NaN; put the original values back.
+    return cleaned.where(cleaned.notna(), series)
+
+
+_NORMALIZATION_STEPS = (
+    "rename_columns",
+    "standardize_text_columns",
+    "value_mappings",
+    "fuzzy_matching",
+    "parse_datetimes",
+    "coerce_dtypes",
+)
 
 
 def apply_normalization(df: pd.DataFrame, config: dict) -> tuple[pd.DataFrame, pd.DataFrame, dict]:
     """Applies all configured normalization rules in a defined, fail-safe order."""
+    rules = config.get("rules") or {}
+    if not isinstance(rules, dict):
+        logging.error(f"Normalization rules must be a mapping, got {type(rules).__name__}.")
+        return df, df, {}
+    if not any(rules.get(step) for step in _NORMALIZATION_STEPS):
+        # Nothing to apply: hand back the input itself instead of two full copies.
+        return df, df, {}
+
     df_original = df.copy()
     df_normalized = df.copy()
-    rules = config.get("rules", {})
     changelog = {}
 
     # --- 1. Rename Columns ---
@@ -10,22 +10,115 @@ a summary log of outlier boundaries and counts, and a DataFrame of affected rows
 Used by the M05 pipeline orchestrator for QA and risk flagging steps.
 """
 
-import pandas as pd
-
-
-def _detect_by_iqr(series, config):
-    q1, q3 = series.quantile(0.25), series.quantile(0.75)
-    iqr = q3 - q1
-    multiplier = config.get("iqr_multiplier", 1.5)
-    lower_bound, upper_bound = q1 - (multiplier * iqr), q3 + (multiplier * iqr)
-    return (series < lower_bound) | (series > upper_bound), lower_bound, upper_bound
-
+import os
+import warnings
 
-def _detect_by_zscore(series, config):
-    mean, std = series.mean(), series.std()
-    threshold = config.get("zscore_threshold", 3.0)
-    lower_bound, upper_bound = mean - (threshold * std), mean + (threshold * std)
-    return ((series - mean) / std).abs() > threshold, lower_bound, upper_bound
+import numpy as np
+import pandas as pd
+from joblib import Parallel, delayed
+from pandas.api.types import is_bool_dtype, is_numeric_dtype, is_timedelta64_dtype
+
+from analyst_toolkit.m05_detect_outliers.outlier_kernels import flag_outside_bounds
+
+# Method name -> (config key, default) for the per-column bound multiplier.
+_METHOD_FACTORS = {"iqr": ("iqr_multiplier", 1.5), "zscore": ("zscore_threshold", 3.0)}
+
+# Frames at least this large split bound estimation across threads by column block.
+# NumPy's partition/reduction loops release the GIL, so threads run truly in parallel.
+PARALLEL_MIN_CELLS = 2_000_000
+
+
+def _is_numeric(dtype) -> bool:
+    return (is_numeric_dtype(dtype) or is_timedelta64_dtype(dtype)) and not is_bool_dtype(dtype)
+
+
+def _numeric_columns(df: pd.DataFrame, exclude_columns) -> pd.Index:
+    """
+    Numeric column labels in frame order, minus ``exclude_columns``.
+
+    Matches ``select_dtypes(include=["number"])`` (bool excluded, timedelta included)
+    without building a sub-frame, and classifies each distinct dtype only once.
+    """
+    dtypes = df.dtypes
+    numeric_by_dtype = {dtype: _is_numeric(dtype) for dtype in set(dtypes)}
+    keep = np.fromiter((numeric_by_dtype[dtype] for dtype in dtypes), bool, len(dtypes))
+    numeric_cols = df.columns[keep]
+    if len(exclude_columns):
+        numeric_cols = numeric_cols.drop(exclude_columns, errors="ignore")
+    return numeric_cols
+
+
+def _resolve_bounds(values: np.ndarray, methods: list, factors: np.ndarray):
+    """
+    Compute per-column lower/upper bounds in one batched call per method.
+
+    Columns without a method, or with no non-null values, keep NaN bounds, which
+    never compare true and so flag nothing.
+    """
+    lower = np.full(len(methods), np.nan)
+    upper = np.full(len(methods), np.nan)
+    iqr_idx = [j for j, method in enumerate(methods) if method == "iqr"]
+    z_idx = [j for j, method in enumerate(methods) if method == "zscore"]
+    if values.shape[0] == 0:
+        return lower, upper
+    with warnings.catch_warnings():
+        # All-NaN columns and single-value std are expected here and yield NaN bounds.
+        warnings.simplefilter("ignore", RuntimeWarning)
+        if iqr_idx:
+            q1, q3 = np.nanquantile(values[:, iqr_idx], [0.25, 0.75], axis=0)
+            spread = factors[iqr_idx] * (q3 - q1)
+            lower[iqr_idx], upper[iqr_idx] = q1 - spread, q3 + spread
+        if z_idx:
+            block = values[:, z_idx]
+            mean = np.nanmean(block, axis=0)
+            spread = factors[z_idx] * np.nanstd(block, axis=0, ddof=1)
+            lower[z_idx], upper[z_idx] = mean - spread, mean + spread
+    return lower, upper
+
+
+def _varying_columns(values: np.ndarray) -> np.ndarray:
+    """
+    Boolean mask of columns holding at least two distinct non-null values.
+
+    Constant and all-NaN columns get zero-width or NaN bounds and can never flag a
+    cell, so one O(n) min/max pass lets them skip the quantile and std passes.
+    """
+    if values.shape[0] == 0:
+        return np.zeros(values.shape[1], dtype=bool)
+    with warnings.catch_warnings():
+        # All-NaN columns warn and reduce to NaN, which compares False below.
+        warnings.simplefilter("ignore", RuntimeWarning)
+        return np.nanmax(values, axis=0) > np.nanmin(values, axis=0)
+
+
+def _log_bounds(bounds: np.ndarray, columns: list, dtypes: pd.Series):
+    """
+    Bounds for the log, with timedelta columns mapped back from nanosecond floats.
+
+    The float matrix holds timedeltas as raw nanoseconds; handlers compare the logged
+    bounds against the original column, so those entries must be ``Timedelta`` again.
+    """
+    timedelta = [is_timedelta64_dtype(dtypes[col]) for col in columns]
+    if not any(timedelta):
+        return bounds
+    return [
+        pd.to_timedelta(bound, unit="ns") if is_td else bound
+        for bound, is_td in zip(bounds.tolist(), timedelta, strict=True)
+    ]
+
+
+def _resolve_bounds_parallel(values: np.ndarray, methods: list, factors: np.ndarray):
+    """Run ``_resolve_bounds`` over column blocks on a thread pool for large frames."""
+    n_blocks = min(values.shape[1], os.cpu_count() or 1)
+    if n_blocks < 2 or values.size < PARALLEL_MIN_CELLS:
+        return _resolve_bounds(values, methods, factors)
+    blocks = np.array_split(np.arange(values.shape[1]), n_blocks)
+    results = Parallel(n_jobs=n_blocks, prefer="threads")(
+        delayed(_resolve_bounds)(values[:, b], [methods[j] for j in b], factors[b]) for b in blocks
+    )
+    lower = np.concatenate([block_lower for block_lower, _ in results])
+    upper = np.concatenate([block_upper for _, block_upper in results])
+    return lower, upper
 
 
 def detect_outliers(df: pd.DataFrame, config: dict) -> dict:
@@ -35,52 +128,62 @@ def detect_outliers(df: pd.DataFrame, config: dict) -> dict:
     if exclude_columns is None:
         exclude_columns = []
 
-    outlier_log_entries = []
-    outlier_flags = pd.DataFrame(index=df.index)
-    numeric_cols = df.select_dtypes(include=["number"]).columns.drop(
-        exclude_columns, errors="ignore"
-    )
+    numeric_cols = _numeric_columns(df, exclude_columns)
 
-    for col in numeric_cols:
+    methods = [None] * len(numeric_cols)
+    factors = np.full(len(numeric_cols), np.nan)
+    for j, col in enumerate(numeric_cols):
         col_spec = detection_specs.get(col, detection_specs.get("__default__", {}))
         method = col_spec.get("method")
-        if not method:
+        if method not in _METHOD_FACTORS:
             continue
-
-        series = df[col].dropna()
-        if series.empty:
-            continue
-
-        if method == "iqr":
-            is_outlier, lower, upper = _detect_by_iqr(series, col_spec)
-        elif method == "zscore":
-            is_outlier, lower, upper = _detect_by_zscore(series, col_spec)
-        else:
-            continue
-
-        if is_outlier.any():
-            outlier_indices = series[is_outlier].index
-            outlier_values = series[outlier_indices].tolist()
-            outlier_log_entries.append(
-                {
-                    "column": col,
-                    "method": method,
-                    "outlier_count": int(is_outlier.sum()),
-                    "lower_bound": lower,
-                    "upper_bound": upper,
-                    "outlier_examples": str(outlier_values[:5]),
-                }
-            )
-            outlier_flags[f"{col}_{method}_outlier"] = is_outlier.reindex(
-                df.index, fill_value=False
-            )
-
-    outlier_log_df = pd.DataFrame(outlier_log_entries)
-
-    if not outlier_flags.empty:
-        overall_outlier_mask = outlier_flags.any(axis=1)
-        outlier_rows_df = df[overall_outlier_mask].copy()
+        factor_key, factor_default = _METHOD_FACTORS[method]
+        methods[j] = method
+        factors[j] = col_spec.get(factor_key, factor_default)
+
+    # One sweep over all numeric columns; NaN cells compare False.
+    values = df[numeric_cols].to_numpy(dtype=np.float64, na_value=np.nan)
+    methods = [
+        method if varying else None
+        for method, varying in zip(methods, _varying_columns(values), strict=True)
+    ]
+    lower, upper = _resolve_bounds_parallel(values, methods, factors)
+    mask, counts = flag_outside_bounds(values, lower, upper)
+    flagged_idx = np.flatnonzero(counts)
+
+    if len(flagged_idx):
+        # Build the log column-wise straight from the per-column arrays; only the
+        # example values need a per-column lookup into the frame.
+        flagged_cols = numeric_cols[flagged_idx].tolist()
+        dtypes = df.dtypes
+        outlier_log_df = pd.DataFrame(
+            {
+                "column": flagged_cols,
+                "method": [methods[j] for j in flagged_idx],
+                "outlier_count": counts[flagged_idx].astype(np.int64),
+                "lower_bound": _log_bounds(lower[flagged_idx], flagged_cols, dtypes),
+                "upper_bound": _log_bounds(upper[flagged_idx], flagged_cols, dtypes),
+                "outlier_examples": [
+                    str(df[numeric_cols[j]].iloc[np.flatnonzero(mask[:, j])[:5]].tolist())
+                    for j in flagged_idx
+                ],
+            }
+        )
+    else:
+        outlier_log_df = pd.DataFrame()
+
+    if len(flagged_idx):
+        # Fortran order transposes into a C-contiguous pandas block, so each flag
+        # column is one contiguous run of bytes for handling and export.
+        outlier_flags = pd.DataFrame(
+            np.asfortranarray(mask[:, flagged_idx]),
+            index=df.index,
+            columns=[f"{numeric_cols[j]}_{methods[j]}_outlier" for j in flagged_idx],
+        )
+        # take() already returns an independent frame, so no defensive copy is needed.
+        outlier_rows_df = df.take(np.flatnonzero(mask[:, flagged_idx].any(axis=1)))
     else:
+        outlier_flags = pd.DataFrame(index=df.index)
         outlier_rows_df = pd.DataFrame(columns=df.columns)
 
     return {
@@ -0,0 +1,100 @@
+"""
+⚙️ Module: outlier_kernels.py
+
+Numeric kernels for the M05 Outlier Detection module.
+
+The bound-comparison sweep is the hot loop of detection: every numeric cell is
+compared against its column's lower/upper bounds and flagged columns are counted.
+When the optional ``numba`` dependency is installed (``pip install
+analyst_toolkit[accel]``), large frames run this sweep as a single compiled pass
+that follows the array's memory layout: parallel across columns for column-major
+input and across rows for row-major input. Otherwise the NumPy implementation is
+used, which produces identical results.
+"""
+
+import numpy as np
+
+# Below this many cells the NumPy path is faster than paying for kernel dispatch.
+KERNEL_MIN_CELLS = 1_000_000
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+if njit is not None:
+    # Both kernels walk memory in storage order and use a branch-free ``|`` so LLVM can
+    # vectorize the inner loop. fastmath is deliberately off: NaN cells must compare False.
+
+    @njit(parallel=True, cache=True)
+    def _flag_kernel_columns(values, lower, upper, mask, counts):
+        # Fortran-ordered input: each column is contiguous, so parallelize across columns.
+        n_rows, n_cols = values.shape
+        for j in prange(n_cols):
+            lo = lower[j]
+            hi = upper[j]
+            count = 0
+            for i in range(n_rows):
+                v = values[i, j]
+                hit = (v < lo) | (v > hi)
+                mask[i, j] = hit
+                count += hit
+            counts[j] = count
+
+    @njit(parallel=True, cache=True)
+    def _flag_kernel_rows(values, lower, upper, mask):
+        # C-ordered input: each row is contiguous, so parallelize across rows.
+        n_rows, n_cols = values.shape
+        for i in prange(n_rows):
+            for j in range(n_cols):
+                v = values[i, j]
+                mask[i, j] = (v < lower[j]) | (v > upper[j])
+
+
+# Rows per block in the NumPy sweep; bounds the scratch buffer for the upper comparison.
+_NUMPY_BLOCK_ROWS = 65_536
+
+
+def _flag_numpy(values: np.ndarray, lower: np.ndarray, upper: np.ndarray):
+    # Comparisons write straight into the output mask; only one block-sized scratch
+    # buffer is allocated instead of two full-size temporaries per sweep.
+    n_rows = values.shape[0]
+    mask = np.empty(values.shape, dtype=np.bool_)
+    scratch = np.empty((min(n_rows, _NUMPY_BLOCK_ROWS),) + values.shape[1:], dtype=np.bool_)
+    with np.errstate(invalid="ignore"):
+        for start in range(0, n_rows, _NUMPY_BLOCK_ROWS):
+            stop = min(start + _NUMPY_BLOCK_ROWS, n_rows)
+            block, out, tmp = values[start:stop], mask[start:stop], scratch[: stop - start]
+            np.less(block, lower, out=out)
+            np.greater(block, upper, out=tmp)
+            np.logical_or(out, tmp, out=out)
+    return mask, mask.sum(axis=0)
+
+
+def flag_outside_bounds(
+    values: np.ndarray, lower: np.ndarray, upper: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Flag cells outside their column's ``[lower, upper]`` bounds.
+
+    Args:
+        values (np.ndarray): 2-D float64 array of shape (rows, columns).
+        lower (np.ndarray): Per-column lower bounds; NaN disables the check.
+        upper (np.ndarray): Per-column upper bounds; NaN disables the check.
+
+    Returns:
+        tuple:
+            - np.ndarray: Boolean mask with the same shape as ``values``.
+            - np.ndarray: Per-column count of flagged cells.
+    """
+    if njit is None or values.size < KERNEL_MIN_CELLS:
+        return _flag_numpy(values, lower, upper)
+    if values.flags.f_contiguous:
+        mask = np.empty(values.shape, dtype=np.bool_, order="F")
+        counts = np.empty(values.shape[1], dtype=np.int64)
+        _flag_kernel_columns(values, lower, upper, mask, counts)
+        return mask, counts
+    values = np.ascontiguousarray(values)
+    mask = np.empty(values.shape, dtype=np.bool_)
+    _flag_kernel_rows(values, lower, upper, mask)
+    return mask, mask.sum(axis=0)
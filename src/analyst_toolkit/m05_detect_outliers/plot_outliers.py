@@ -4,68 +4,141 @@
 Visual producer for the M05 Outlier Detection module.
 
 This module generates and saves histogram, box, and violin plots for columns
-flagged as having outliers. Plot annotations may include boundary lines and
+flagged as having outliers, either one figure per plot kind or, with
+``layout: grid``, one figure per column holding every kind side by side. Plot annotations may include boundary lines and
 groupings by a categorical 'hue' column. Results are saved to disk and paths
 returned for optional widget-based viewing or HTML inclusion.
+
+Figures are built directly on ``matplotlib.figure.Figure`` and rendered by the Agg
+canvas at save time, so plotting never goes through pyplot's figure manager or an
+interactive/inline backend.
 """
 
 import logging
 from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pandas as pd
 
 from analyst_toolkit.m00_utils.plot_runtime import configure_plot_runtime_env
 
-# Configure writable matplotlib/fontconfig cache paths before pyplot import.
-# This call is idempotent and does not change plot styles or RNG state.
-configure_plot_runtime_env()
+if TYPE_CHECKING:
+    from matplotlib.figure import Figure
 
-import matplotlib.pyplot as plt
-import pandas as pd
-import seaborn as sns
+# Violin plots fit a KDE per group; beyond this many rows a fixed-seed sample draws the
+# same shape at a fraction of the cost. Box plots and histograms always use every row.
+VIOLIN_SAMPLE_ROWS = 20_000
+
+
+def _import_plotting():
+    """
+    Import pyplot and seaborn on first use rather than at module import.
+
+    Detection pipelines import this module even when plotting is disabled, and the
+    plotting stack dominates their import time.
+    """
+    # Configure writable matplotlib/fontconfig cache paths before pyplot import.
+    # This call is idempotent and does not change plot styles or RNG state.
+    configure_plot_runtime_env()
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+
+    return plt, sns
+
+
+def _new_figure() -> tuple["Figure", object]:
+    """Create an unmanaged figure; it is garbage collected rather than closed."""
+    from matplotlib.figure import Figure
+
+    fig = Figure(figsize=(12, 7))
+    return fig, fig.subplots()
+
+
+def _plottable_columns(df: pd.DataFrame, outlier_log: pd.DataFrame) -> set:
+    """Logged columns that exist in ``df`` and hold at least one non-null value."""
+    if "column" not in outlier_log.columns:
+        return set()
+    logged = [col for col in dict.fromkeys(outlier_log["column"]) if col in df.columns]
+    if not logged:
+        return set()
+    has_values = df[logged].notna().any()
+    return set(has_values.index[has_values.to_numpy()])
+
+
+def _draw_histogram(ax, sns, data: pd.DataFrame, col: str, hue_col: str, log_row) -> None:
+    """Draw a count histogram of ``col`` with the detection bounds as vertical lines."""
+    sns.histplot(data=data, x=col, hue=hue_col, bins=30, stat="count", element="bars", ax=ax)
+    ax.set_ylabel("Count")
+
+    lower, upper = log_row.get("lower_bound"), log_row.get("upper_bound")
+    if pd.notna(lower):
+        ax.axvline(lower, color="r", linestyle="--", label="Bounds")
+    if pd.notna(upper):
+        ax.axvline(upper, color="r", linestyle="--")
+
+    if pd.notna(lower) or pd.notna(upper) or hue_col:
+        if ax.get_legend():
+            sns.move_legend(ax, "upper left", bbox_to_anchor=(1, 1))
+
+
+def _draw_box_violin(ax, plot_func, data: pd.DataFrame, col: str, hue_col: str, log_row) -> None:
+    """Draw a box or violin plot of ``col`` with the detection bounds as horizontal lines."""
+    # --- THIS IS THE FINAL FIX ---
+    if hue_col:
+        plot_func(data=data, x=hue_col, y=col, hue=hue_col, ax=ax)
+        if ax.get_legend():
+            ax.get_legend().remove()
+    else:
+        plot_func(data=data, y=col, ax=ax)
+
+    lower, upper = log_row.get("lower_bound"), log_row.get("upper_bound")
+    if pd.notna(lower):
+        ax.axhline(lower, color="r", linestyle="--", label="Bounds")
+    if pd.notna(upper):
+        ax.axhline(upper, color="r", linestyle="--")
+    if (pd.notna(lower) or pd.notna(upper)) and not hue_col:
+        ax.legend()
+
+
+def _violin_frame(df: pd.DataFrame, plot_types: list) -> pd.DataFrame:
+    if "violin" in plot_types and len(df) > VIOLIN_SAMPLE_ROWS:
+        return df.sample(n=VIOLIN_SAMPLE_ROWS, random_state=0)
+    return df
 
 
 def _generate_histograms(
-    df: pd.DataFrame, outlier_log: pd.DataFrame, hue_col: str, save_dir: Path, run_id: str
+    df: pd.DataFrame,
+    outlier_log: pd.DataFrame,
+    hue_col: str,
+    save_dir: Path,
+    run_id: str,
+    plottable: set,
 ) -> dict:
     """Helper function to generate only histogram plots."""
+    _, sns = _import_plotting()
     plot_paths: dict[str, list[str]] = {}
     for _, log_row in outlier_log.iterrows():
         col = log_row["column"]
-        if col not in df.columns or df[col].dropna().empty:
+        if col not in plottable:
             continue
         plot_paths.setdefault(col, [])
         try:
-            plt.style.use("seaborn-v0_8-whitegrid")
-            fig, ax = plt.subplots(figsize=(12, 7))
+            fig, ax = _new_figure()
             title = f"Distribution of {col}{f' by {hue_col}' if hue_col else ''}"
             ax.set_title(title, fontsize=16)
+            _draw_histogram(ax, sns, df, col, hue_col, log_row)
 
-            sns.histplot(data=df, x=col, hue=hue_col, bins=30, stat="count", element="bars", ax=ax)
-            ax.set_ylabel("Count")
-
-            lower, upper = log_row.get("lower_bound"), log_row.get("upper_bound")
-            if pd.notna(lower):
-                ax.axvline(lower, color="r", linestyle="--", label="Bounds")
-            if pd.notna(upper):
-                ax.axvline(upper, color="r", linestyle="--")
-
-            if pd.notna(lower) or pd.notna(upper) or hue_col:
-                if ax.get_legend():
-                    sns.move_legend(ax, "upper left", bbox_to_anchor=(1, 1))
-
-            plt.tight_layout()
+            fig.tight_layout()
             if hue_col:
-                plt.subplots_adjust(right=0.85)
+                fig.subplots_adjust(right=0.85)
 
             plot_path = (
                 save_dir / f"plot_{col}{f'_by_{hue_col}' if hue_col else ''}_hist_{run_id}.png"
             )
-            plt.savefig(plot_path, bbox_inches="tight")
+            fig.savefig(plot_path, bbox_inches="tight")
             plot_paths[col].append(str(plot_path))
         except Exception as e:
             logging.error(f"Failed to generate histogram for column '{col}': {e}")
-        finally:
-            if "fig" in locals():
-                plt.close(fig)
 
     return plot_paths
 
@@ -77,59 +150,103 @@ def _generate_box_violin_plots(
     hue_col: str,
     save_dir: Path,
     run_id: str,
+    plottable: set,
 ) -> dict:
     """Helper function to generate only box and violin plots."""
+    _, sns = _import_plotting()
+    # Resolve the requested kinds once rather than re-filtering plot_types per column.
+    kinds = [kind for kind in plot_types if kind in ("box", "violin")]
     plot_paths: dict[str, list[str]] = {}
+    df_violin = _violin_frame(df, kinds)
     for _, log_row in outlier_log.iterrows():
         col = log_row["column"]
-        if col not in df.columns or df[col].dropna().empty:
+        if col not in plottable:
             continue
         plot_paths.setdefault(col, [])
-        for plot_kind in plot_types:
-            if plot_kind not in ["box", "violin"]:
-                continue
+        for plot_kind in kinds:
             try:
-                plt.style.use("seaborn-v0_8-whitegrid")
-                fig, ax = plt.subplots(figsize=(12, 7))
+                fig, ax = _new_figure()
                 ax.set_title(
                     f"{plot_kind.title()} of {col}{f' by {hue_col}' if hue_col else ''}",
                     fontsize=16,
                 )
 
-                plot_func = sns.boxplot if plot_kind == "box" else sns.violinplot
-
-                # --- THIS IS THE FINAL FIX ---
-                if hue_col:
-                    plot_func(data=df, x=hue_col, y=col, hue=hue_col, ax=ax)
-                    if ax.get_legend():
-                        ax.get_legend().remove()
+                if plot_kind == "box":
+                    plot_func, plot_df = sns.boxplot, df
                 else:
-                    plot_func(data=df, y=col, ax=ax)
-
-                lower, upper = log_row.get("lower_bound"), log_row.get("upper_bound")
-                if pd.notna(lower):
-                    ax.axhline(lower, color="r", linestyle="--", label="Bounds")
-                if pd.notna(upper):
-                    ax.axhline(upper, color="r", linestyle="--")
-                if (pd.notna(lower) or pd.notna(upper)) and not hue_col:
-                    ax.legend()
+                    plot_func, plot_df = sns.violinplot, df_violin
+                _draw_box_violin(ax, plot_func, plot_df, col, hue_col, log_row)
 
-                plt.tight_layout()
+                fig.tight_layout()
                 plot_path = (
                     save_dir
                     / f"plot_{col}{f'_by_{hue_col}' if hue_col else ''}_{plot_kind}_{run_id}.png"
                 )
-                plt.savefig(plot_path, bbox_inches="tight")
+                fig.savefig(plot_path, bbox_inches="tight")
                 plot_paths[col].append(str(plot_path))
             except Exception as e:
                 logging.error(f"Failed to generate {plot_kind} plot for column '{col}': {e}")
-            finally:
-                if "fig" in locals():
-                    plt.close(fig)
 
     return plot_paths
 
 
+def _generate_grid_plots(
+    df: pd.DataFrame,
+    outlier_log: pd.DataFrame,
+    plot_types: list,
+    hue_col: str,
+    save_dir: Path,
+    run_id: str,
+    plottable: set,
+) -> dict:
+    """Helper function to draw every requested plot kind for a column into one figure."""
+    from matplotlib.figure import Figure
+
+    _, sns = _import_plotting()
+    kinds = [kind for kind in plot_types if kind in ("hist", "box", "violin")]
+    plot_paths: dict[str, list[str]] = {}
+    if not kinds:
+        return plot_paths
+    subset_cols = [hue_col] if hue_col else []
+    df_violin = _violin_frame(df, kinds)
+    for _, log_row in outlier_log.iterrows():
+        col = log_row["column"]
+        if col not in plottable or col in plot_paths:
+            continue
+        plot_paths[col] = []
+        # Only the plotted column (and hue) are handed to seaborn for every panel.
+        data = df[[col, *subset_cols]]
+        try:
+            fig = Figure(figsize=(8 * len(kinds), 7))
+            axes = fig.subplots(1, len(kinds), squeeze=False)[0]
+            fig.suptitle(f"{col}{f' by {hue_col}' if hue_col else ''}", fontsize=16)
+            for ax, plot_kind in zip(axes, kinds):
+                ax.set_title(plot_kind.title(), fontsize=13)
+                if plot_kind == "hist":
+                    _draw_histogram(ax, sns, data, col, hue_col, log_row)
+                elif plot_kind == "box":
+                    _draw_box_violin(ax, sns.boxplot, data, col, hue_col, log_row)
+                else:
+                    violin_data = data if df_violin is df else df_violin[[col, *subset_cols]]
+                    _draw_box_violin(ax, sns.violinplot, violin_data, col, hue_col, log_row)
+
+            fig.tight_layout()
+            plot_path = (
+                save_dir / f"plot_{col}{f'_by_{hue_col}' if hue_col else ''}_grid_{run_id}.png"
+            )
+            fig.savefig(plot_path, bbox_inches="tight")
+            plot_paths[col].append(str(plot_path))
+        except Exception as e:
+            logging.error(f"Failed to generate plot grid for column '{col}': {e}")
+
+    return plot_paths
+
+
+def plot_outlier_grid(df: pd.DataFrame, outlier_log: pd.DataFrame, plot_config: dict) -> dict:
+    """Generate one figure per flagged column with each requested plot kind side by side."""
+    return generate_outlier_plots(df, outlier_log, {**plot_config, "layout": "grid"})
+
+
 def generate_outlier_plots(df: pd.DataFrame, outlier_log: pd.DataFrame, plot_config: dict) -> dict:
     """Main orchestrator function that generates all requested outlier plots by calling specialized helpers."""
     plot_save_dir = Path(plot_config.get("plot_save_dir", "exports/plots/outliers/"))
@@ -144,15 +261,27 @@ def generate_outlier_plots(df: pd.DataFrame, outlier_log: pd.DataFrame, plot_con
         hue_col = None
 
     all_plot_paths: dict[str, list[str]] = {}
+    plottable = _plottable_columns(df, outlier_log)
+    if not plottable:
+        return all_plot_paths
+    plt, _ = _import_plotting()
+    plt.style.use("seaborn-v0_8-whitegrid")
+
+    if plot_config.get("layout") == "grid":
+        return _generate_grid_plots(
+            df, outlier_log, plot_types, hue_col, plot_save_dir, run_id, plottable
+        )
 
     if "hist" in plot_types:
-        hist_paths = _generate_histograms(df, outlier_log, hue_col, plot_save_dir, run_id)
+        hist_paths = _generate_histograms(
+            df, outlier_log, hue_col, plot_save_dir, run_id, plottable
+        )
         for col, paths in hist_paths.items():
             all_plot_paths.setdefault(col, []).extend(paths)
 
     if "box" in plot_types or "violin" in plot_types:
         bv_paths = _generate_box_violin_plots(
-            df, outlier_log, plot_types, hue_col, plot_save_dir, run_id
+            df, outlier_log, plot_types, hue_col, plot_save_dir, run_id, plottable
         )
         for col, paths in bv_paths.items():
             all_plot_paths.setdefault(col, []).extend(paths)
@@ -80,11 +80,12 @@ def run_outlier_detection_pipeline(
 
     outlier_report = generate_outlier_report(detection_results)
 
-    df_out = df.copy()
+    # Detection never mutates df; only appending flags needs a new frame, and concat builds it.
+    df_out = df
     if module_cfg.get("append_flags", False):
         outlier_flags_df = detection_results.get("outlier_flags")
         if outlier_flags_df is not None:
-            df_out = pd.concat([df_out, outlier_flags_df], axis=1)
+            df_out = pd.concat([df, outlier_flags_df], axis=1)
 
     export_cfg = module_cfg.get("export", {})
     if export_cfg.get("run") and outlier_report:
@@ -15,9 +15,42 @@ Returns the cleaned DataFrame and a summary log of applied transformations.
 
 import logging
 
+import numpy as np
 import pandas as pd
 
 
+def _assign_masked(df: pd.DataFrame, col: str, mask, value) -> None:
+    """
+    Write ``value`` (a scalar or a Series aligned to ``df``) into ``df[col]`` where ``mask`` is set.
+
+    ``mask`` is either a boolean Series or a positional boolean ndarray already aligned to
+    ``df``. Numeric NumPy columns take a single ndarray write. Extension dtypes, misaligned
+    masks, and fills that would force a dtype change fall back to ``.loc`` so pandas'
+    upcasting and index alignment rules still apply. Either way the column is replaced rather
+    than written through, so ``df`` may be a shallow copy sharing buffers with its source.
+    """
+    column = df[col]
+    dtype = column.dtype
+    fill = value.to_numpy() if isinstance(value, pd.Series) else np.asarray(value)
+    aligned = not isinstance(mask, pd.Series) or mask.index.equals(df.index)
+    fast_path = (
+        aligned
+        and isinstance(dtype, np.dtype)
+        and dtype.kind in "iuf"
+        and fill.dtype.kind in "iuf"
+        and np.can_cast(fill.dtype, dtype, casting="same_kind")
+    )
+    if not fast_path:
+        df[col] = column.copy()
+        df.loc[mask, col] = value
+        return
+    if isinstance(mask, pd.Series):
+        mask = mask.to_numpy(dtype=bool, na_value=False)
+    out = column.to_numpy(copy=True)
+    np.copyto(out, fill, where=mask)
+    df[col] = out
+
+
 def handle_outliers(
     df: pd.DataFrame, detection_results: dict, config: dict
 ) -> tuple[pd.DataFrame, pd.DataFrame]:
@@ -34,24 +67,31 @@ def handle_outliers(
         tuple:
             - pd.DataFrame: DataFrame with handled outliers
             - pd.DataFrame: Summary log of all transformations applied
+
+    The input frame is never modified. When there is nothing to handle it is returned
+    as-is; otherwise only the columns a strategy rewrites are copied.
     """
-    df_handled = df.copy()
     handling_specs = config.get("handling_specs", {})
     outlier_flags = detection_results.get("outlier_flags")
     outlier_log = detection_results.get("outlier_log")
 
     if outlier_flags is None or outlier_log is None or outlier_flags.empty:
         logging.warning("Outlier detection results not found or empty. Skipping handling.")
-        return df_handled, pd.DataFrame()
+        return df, pd.DataFrame()
 
     summary_log_rows = []
 
     global_strategy = handling_specs.get("__global__", {}).get("strategy", "none").lower()
 
     if global_strategy == "drop":
-        rows_before = len(df_handled)
-        combined_mask = (outlier_flags.any(axis=1)).fillna(False)
-        df_handled = df_handled[~combined_mask]
+        rows_before = len(df)
+        if outlier_flags.index.equals(df.index):
+            # Aligned flags: reduce the bool matrix in NumPy and filter positionally.
+            flagged = outlier_flags.to_numpy(dtype=bool, na_value=False).any(axis=1)
+            df_handled = df[~flagged]
+        else:
+            combined_mask = (outlier_flags.any(axis=1)).fillna(False)
+            df_handled = df[~combined_mask]
         rows_removed = rows_before - len(df_handled)
         if rows_removed > 0:
             summary_log_rows.append(
@@ -65,41 +105,63 @@ def handle_outliers(
         return df_handled, pd.DataFrame(summary_log_rows)
 
     default_spec = handling_specs.get("__default__", {})
-
-    for col in outlier_log["column"].unique():
+    # Columns are replaced wholesale below, so a shallow copy keeps the input intact.
+    df_handled = df.copy(deep=False)
+
+    # Index the detection log once; the first entry per column wins, as before.
+    log_by_column: dict = {}
+    for entry in outlier_log.to_dict("records"):
+        log_by_column.setdefault(entry["column"], entry)
+
+    # Count every flag column in one reduction instead of one Series.sum() per column.
+    flag_counts = dict(zip(outlier_flags.columns, outlier_flags.sum(axis=0).astype(int).tolist()))
+    flag_positions = {name: j for j, name in enumerate(outlier_flags.columns)}
+    # Flags aligned to the frame are sliced positionally from one bool matrix.
+    flag_matrix = (
+        outlier_flags.to_numpy(dtype=bool, na_value=False)
+        if outlier_flags.index.equals(df.index) and outlier_flags.columns.is_unique
+        else None
+    )
+
+    for col, log_entry in log_by_column.items():
         col_spec = handling_specs.get(col, default_spec)
         strategy = col_spec.get("strategy")
         if not strategy or strategy == "none":
             continue
 
-        log_entry = outlier_log[outlier_log["column"] == col].iloc[0]
         method = log_entry["method"]
         flag_col_name = f"{col}_{method}_outlier"
 
-        if flag_col_name not in outlier_flags.columns:
-            continue
-
-        outlier_mask = outlier_flags[flag_col_name]
-        outlier_count = int(outlier_mask.sum())
+        outlier_count = flag_counts.get(flag_col_name, 0)
         if outlier_count == 0:
             continue
+        if flag_matrix is not None:
+            outlier_mask = flag_matrix[:, flag_positions[flag_col_name]]
+        else:
+            outlier_mask = outlier_flags[flag_col_name]
+        column = df_handled[col]
 
         details = ""
         if strategy == "clip":
-            bounds = log_entry
-            df_handled.loc[outlier_mask, col] = df_handled.loc[outlier_mask, col].clip(
-                lower=bounds.get("lower_bound"), upper=bounds.get("upper_bound")
-            )
+            lower, upper = log_entry.get("lower_bound"), log_entry.get("upper_bound")
+            values = column.to_numpy()
+            if values.dtype.kind == "f":
+                lo = -np.inf if pd.isna(lower) else lower
+                hi = np.inf if pd.isna(upper) else upper
+                clipped = pd.Series(np.clip(values, lo, hi), index=df_handled.index)
+            else:
+                clipped = column.clip(lower=lower, upper=upper)
+            _assign_masked(df_handled, col, outlier_mask, clipped)
             details = f"Clipped {outlier_count} values to bounds."
         elif strategy in ["median", "mean"]:
-            replacement = df_handled[col].agg(strategy)
-            df_handled.loc[outlier_mask, col] = replacement
+            replacement = column.agg(strategy)
+            _assign_masked(df_handled, col, outlier_mask, replacement)
             details = f"Imputed {outlier_count} values with {strategy} ({replacement:.2f})."
         elif strategy == "constant":
             fill_value = col_spec.get("fill_value")
             if fill_value is None:
                 continue
-            df_handled.loc[outlier_mask, col] = fill_value
+            _assign_masked(df_handled, col, outlier_mask, fill_value)
             details = f"Replaced {outlier_count} values with constant ({fill_value})."
 
         summary_log_rows.append(
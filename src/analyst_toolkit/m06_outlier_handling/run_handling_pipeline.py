@@ -67,7 +67,8 @@ def run_outlier_handling_pipeline(
     if detection_results is None:
         detection_results = load_joblib(module_cfg["detection_results_path"].format(run_id=run_id))
 
-    df_original = df.copy()
+    # handle_outliers leaves its input untouched, so the original frame doubles as the baseline.
+    df_original = df
     df_handled, handling_summary_log = handle_outliers(df, detection_results, module_cfg)
 
     # 2. Generate the detailed, evidence-based report
@@ -90,7 +91,9 @@ def run_outlier_handling_pipeline(
             "export_path",
             f"exports/reports/outliers/handling/{run_id}_outlier_handling_report.xlsx",
         ).format(run_id=run_id)
-        file_format = "csv" if export_cfg.get("as_csv", False) else "excel"
+        file_format = export_cfg.get("format") or (
+            "csv" if export_cfg.get("as_csv", False) else "excel"
+        )
         export_dataframes(
             data_dict=handling_report,
             export_path=export_path,
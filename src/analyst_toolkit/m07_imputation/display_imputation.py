@@ -74,7 +74,7 @@ def display_imputation_summary(report: dict, plot_paths: dict = None):
     # --- 3. Categorical Shift Analysis (Your working layout) ---
     categorical_shift_report = report.get("categorical_shift", {})
     if categorical_shift_report:
-        column_analysis_html = ""
+        column_blocks = []
         for i, (col, audit_df) in enumerate(categorical_shift_report.items()):
             vc_after = audit_df.set_index("Value")["Imputed Count"]
             norm_vals_df = pd.DataFrame(
@@ -92,12 +92,12 @@ def display_imputation_summary(report: dict, plot_paths: dict = None):
                     <div style="flex: 1; min-width: 0;"><strong>Value Audit (Before vs. After)</strong>{audit_html}</div>
                 </div>
             </div>"""
-            column_analysis_html += column_html
+            column_blocks.append(column_html)
 
         container_html = f"""
         <details>
             <summary><strong>📊 Categorical Shift Analysis (click to expand & scroll)</strong></summary>
-            <div style="max-height: 500px; overflow-y: auto; margin-top: 1em; padding: 10px;">{column_analysis_html}</div>
+            <div style="max-height: 500px; overflow-y: auto; margin-top: 1em; padding: 10px;">{"".join(column_blocks)}</div>
         </details>"""
         display(HTML(container_html))
 
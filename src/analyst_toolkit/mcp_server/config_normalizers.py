@@ -4,6 +4,7 @@ config_normalizers.py — Shared config normalization helpers for MCP tools.
 
 import re
 from copy import deepcopy
+from functools import lru_cache
 from typing import Any
 
 INFER_CONFIG_REQUIRED_WARNING = (
@@ -13,21 +14,27 @@ INFER_CONFIG_REQUIRED_WARNING = (
 _GENERATED_FLAG_SUFFIXES = ("_iqr_outlier", "_zscore_outlier")
 _NUMERIC_TYPE_MARKERS = ("int", "float", "double", "decimal", "number")
 _TEMPORAL_TYPE_MARKERS = ("datetime", "timestamp", "date")
+_NON_TEXT_TYPE_MARKERS = (*_NUMERIC_TYPE_MARKERS, *_TEMPORAL_TYPE_MARKERS)
+_TYPE_TOKEN_SPLIT = re.compile(r"[^a-z0-9]+")
 
 
-def _is_non_text_expected_type(expected_type: Any) -> bool:
-    if not isinstance(expected_type, str):
-        return False
-    normalized = expected_type.strip().lower()
-    tokens = [token for token in re.split(r"[^a-z0-9]+", normalized) if token]
-    markers = (*_NUMERIC_TYPE_MARKERS, *_TEMPORAL_TYPE_MARKERS)
+@lru_cache(maxsize=256)
+def _is_non_text_type_name(type_name: str) -> bool:
+    # Wide frames repeat a handful of dtype names, so each is tokenized only once.
+    tokens = [token for token in _TYPE_TOKEN_SPLIT.split(type_name.strip().lower()) if token]
     return any(
         token == marker or (token.startswith(marker) and token[len(marker) :].isdigit())
         for token in tokens
-        for marker in markers
+        for marker in _NON_TEXT_TYPE_MARKERS
     )
 
 
+def _is_non_text_expected_type(expected_type: Any) -> bool:
+    if not isinstance(expected_type, str):
+        return False
+    return _is_non_text_type_name(expected_type)
+
+
 def _is_non_text_observed_dtype(dtype: Any) -> bool:
     if dtype is None:
         return False
@@ -94,11 +101,12 @@ def _normalize_rule_contract(
     expected_columns = normalized_rules.get("expected_columns", [])
     if isinstance(expected_columns, list) and observed_df is not None:
         missing_generated_columns: list[str] = []
+        expected_lookup = {column for column in expected_columns if isinstance(column, str)}
         for column in observed_columns:
             if (
                 isinstance(column, str)
                 and column.endswith(_GENERATED_FLAG_SUFFIXES)
-                and column not in expected_columns
+                and column not in expected_lookup
             ):
                 missing_generated_columns.append(column)
         if missing_generated_columns:
@@ -147,11 +155,10 @@ def normalize_validation_config(config: dict[str, Any]) -> dict[str, Any]:
     if not isinstance(base_cfg, dict):
         base_cfg = {}
 
+    # base_cfg is already a private deep copy, so nested sections can be edited in place.
     schema_cfg = base_cfg.get("schema_validation", {})
     if not isinstance(schema_cfg, dict):
         schema_cfg = {}
-    else:
-        schema_cfg = deepcopy(schema_cfg)
 
     nested_rules = schema_cfg.get("rules", {})
     if not isinstance(nested_rules, dict):
@@ -187,17 +194,14 @@ def normalize_final_audit_config(config: dict[str, Any]) -> dict[str, Any]:
     if not isinstance(base_cfg, dict):
         base_cfg = {}
 
+    # base_cfg is already a private deep copy, so nested sections can be edited in place.
     cert_cfg = base_cfg.get("certification", {})
     if not isinstance(cert_cfg, dict):
         cert_cfg = {}
-    else:
-        cert_cfg = deepcopy(cert_cfg)
 
     schema_cfg = cert_cfg.get("schema_validation", {})
     if not isinstance(schema_cfg, dict):
         schema_cfg = {}
-    else:
-        schema_cfg = deepcopy(schema_cfg)
 
     nested_rules = schema_cfg.get("rules", {})
     if not isinstance(nested_rules, dict):
@@ -238,8 +242,8 @@ def normalize_final_audit_config(config: dict[str, Any]) -> dict[str, Any]:
 def sanitize_inferred_validation_config(config: dict[str, Any]) -> dict[str, Any]:
     """Remove categorical rules that do not make sense for numeric/datetime fields."""
     base_cfg = normalize_validation_config(config)
-    schema_cfg = deepcopy(base_cfg.get("schema_validation", {}))
-    rules = deepcopy(schema_cfg.get("rules", {}))
+    schema_cfg = base_cfg.get("schema_validation", {})
+    rules = schema_cfg.get("rules", {})
     expected_types = rules.get("expected_types", {})
     if not isinstance(expected_types, dict):
         expected_types = {}
@@ -251,9 +255,9 @@ def sanitize_inferred_validation_config(config: dict[str, Any]) -> dict[str, Any
 def sanitize_inferred_final_audit_config(config: dict[str, Any]) -> dict[str, Any]:
     """Remove categorical rules that do not make sense for numeric/datetime fields."""
     base_cfg = normalize_final_audit_config(config)
-    cert_cfg = deepcopy(base_cfg.get("certification", {}))
-    schema_cfg = deepcopy(cert_cfg.get("schema_validation", {}))
-    rules = deepcopy(schema_cfg.get("rules", {}))
+    cert_cfg = base_cfg.get("certification", {})
+    schema_cfg = cert_cfg.get("schema_validation", {})
+    rules = schema_cfg.get("rules", {})
     expected_types = rules.get("expected_types", {})
     if not isinstance(expected_types, dict):
         expected_types = {}
@@ -266,8 +270,8 @@ def sanitize_inferred_final_audit_config(config: dict[str, Any]) -> dict[str, An
 def adapt_validation_config_to_dataframe(config: dict[str, Any], df: Any) -> dict[str, Any]:
     """Align inferred validation rules to the transformed session dataframe."""
     base_cfg = normalize_validation_config(config)
-    schema_cfg = deepcopy(base_cfg.get("schema_validation", {}))
-    rules = deepcopy(schema_cfg.get("rules", {}))
+    schema_cfg = base_cfg.get("schema_validation", {})
+    rules = schema_cfg.get("rules", {})
     expected_types = rules.get("expected_types", {})
     if not isinstance(expected_types, dict):
         expected_types = {}
@@ -283,9 +287,9 @@ def adapt_validation_config_to_dataframe(config: dict[str, Any], df: Any) -> dic
 def adapt_final_audit_config_to_dataframe(config: dict[str, Any], df: Any) -> dict[str, Any]:
     """Align inferred certification rules to the transformed session dataframe."""
     base_cfg = normalize_final_audit_config(config)
-    cert_cfg = deepcopy(base_cfg.get("certification", {}))
-    schema_cfg = deepcopy(cert_cfg.get("schema_validation", {}))
-    rules = deepcopy(schema_cfg.get("rules", {}))
+    cert_cfg = base_cfg.get("certification", {})
+    schema_cfg = cert_cfg.get("schema_validation", {})
+    rules = schema_cfg.get("rules", {})
     expected_types = rules.get("expected_types", {})
     if not isinstance(expected_types, dict):
         expected_types = {}
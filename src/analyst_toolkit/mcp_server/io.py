@@ -7,14 +7,18 @@ import logging
 import os
 import threading
 from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
+from copy import deepcopy
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Callable, Optional
 
 import pandas as pd
 import yaml
 
+from analyst_toolkit.m00_utils.config_loader import safe_load_yaml as _safe_load_yaml
 from analyst_toolkit.mcp_server.destination_routing import (
     compact_destination_metadata as _compact_destination_metadata,
 )
@@ -25,6 +29,12 @@ from analyst_toolkit.mcp_server.destination_routing import (
     split_artifact_reference as _split_artifact_reference,
 )
 from analyst_toolkit.mcp_server.input.ingest import load_dataframe as _load_input_dataframe
+from analyst_toolkit.mcp_server.io_history_files import (
+    append_json_array_entries as _append_json_array_entries,
+)
+from analyst_toolkit.mcp_server.io_history_files import (
+    create_json_file as _create_json_file,
+)
 from analyst_toolkit.mcp_server.io_history_files import (
     read_history_file_safe as _read_history_file_safe,
 )
@@ -65,9 +75,29 @@ _LIFECYCLE_WARNINGS_GUARD = threading.Lock()
 _MAX_LIFECYCLE_WARNING_KEYS = 512
 _SEEN_LIFECYCLE_WARNING_KEYS: set[tuple[str, str]] = set()
 ALLOW_EMPTY_CERT_RULES = _env_bool("ANALYST_MCP_ALLOW_EMPTY_CERT_RULES", False)
+# Artifact uploads are network-bound, so a few threads overlap their round trips.
+_DELIVERY_WORKERS = 8
+_PATH_ROOTS_GUARD = threading.Lock()
+_MAX_PATH_ROOTS = 1024
+_PATH_ROOTS: OrderedDict[tuple[str, str], str] = OrderedDict()
 _HISTORY_READ_META_GUARD = threading.Lock()
 _MAX_HISTORY_READ_META = 256
 _LAST_HISTORY_READ_META: OrderedDict[tuple[str, Optional[str]], dict[str, Any]] = OrderedDict()
+# History entries waiting for their file's lock, keyed by resolved history path.
+_PENDING_HISTORY_GUARD = threading.Lock()
+_PENDING_HISTORY: dict[str, list[dict[str, Any]]] = {}
+
+
+@lru_cache(maxsize=256)
+def _parse_yaml_text(text: str) -> Any:
+    # Agents resend the same YAML across tool calls and sessions replay their stored
+    # inferred configs on every call, so each distinct document is parsed once.
+    return _safe_load_yaml(text)
+
+
+def _load_yaml_text(text: str) -> Any:
+    """Parse YAML text through the parse cache; callers get a private copy to mutate."""
+    return deepcopy(_parse_yaml_text(text))
 
 
 def coerce_config(config: Optional[dict], module: str) -> dict:
@@ -93,7 +123,7 @@ def coerce_config(config: Optional[dict], module: str) -> dict:
             "Pass a parsed dict to avoid this."
         )
         try:
-            config = yaml.safe_load(config)
+            config = _load_yaml_text(config)
         except yaml.YAMLError as e:
             logger.error(f"[{module}] Failed to parse YAML string config: {e}")
             return {}
@@ -108,7 +138,7 @@ def coerce_config(config: Optional[dict], module: str) -> dict:
             "Pass a parsed dict to avoid this."
         )
         try:
-            config = {module: yaml.safe_load(config[module])}
+            config = {module: _load_yaml_text(config[module])}
         except yaml.YAMLError as e:
             logger.error(f"[{module}] Failed to parse YAML string in config: {e}")
             return {}
@@ -245,7 +275,7 @@ def get_inferred_config(session_id: str | None, module: str) -> dict:
     if not raw_yaml:
         return {}
     try:
-        parsed = yaml.safe_load(raw_yaml)
+        parsed = _load_yaml_text(raw_yaml)
     except yaml.YAMLError:
         logger.warning("Failed to parse stored %s config for session %s", module, session_id)
         return {}
@@ -287,17 +317,36 @@ def _resolve_path_root(run_id: str, session_id: Optional[str] = None) -> str:
 
     Non-session layout:
       <current_timestamp>/<run_id>
+
+    A session's start time never changes, so session-aware roots are memoized per
+    (run_id, session_id) once the start time is known.
     """
     if session_id:
-        session_ts = get_session_start(session_id) or datetime.now(timezone.utc).strftime(
-            "%Y%m%d_%H%M%S"
-        )
-        return f"{session_ts}/{session_id}/{run_id}"
+        key = (run_id, session_id)
+        with _PATH_ROOTS_GUARD:
+            cached = _PATH_ROOTS.get(key)
+            if cached is not None:
+                _PATH_ROOTS.move_to_end(key)
+                return cached
+        session_start = get_session_start(session_id)
+        session_ts = session_start or datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
+        path_root = f"{session_ts}/{session_id}/{run_id}"
+        if session_start:
+            with _PATH_ROOTS_GUARD:
+                _PATH_ROOTS[key] = path_root
+                if len(_PATH_ROOTS) > _MAX_PATH_ROOTS:
+                    _PATH_ROOTS.popitem(last=False)
+        return path_root
 
     current_ts = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
     return f"{current_ts}/{run_id}"
 
 
+def _reset_path_roots_for_tests() -> None:
+    with _PATH_ROOTS_GUARD:
+        _PATH_ROOTS.clear()
+
+
 def generate_default_export_path(
     run_id: str, module: str, extension: str = "csv", session_id: Optional[str] = None
 ) -> str:
@@ -351,6 +400,57 @@ def deliver_artifact(
     )
 
 
+def deliver_many(
+    deliver: Callable[[Any], dict[str, Any]], items: list[Any]
+) -> list[dict[str, Any]]:
+    """
+    Apply ``deliver`` to each item, overlapping the uploads on a small thread pool.
+
+    Results are returned in ``items`` order; a single item is delivered inline.
+    """
+    if len(items) <= 1:
+        return [deliver(item) for item in items]
+    with ThreadPoolExecutor(max_workers=min(_DELIVERY_WORKERS, len(items))) as pool:
+        return list(pool.map(deliver, items))
+
+
+def deliver_report_artifacts(
+    run_id: str,
+    module: str,
+    *,
+    html_path: str,
+    xlsx_path: str,
+    plot_dirs: list[Path],
+    deliver: Callable[..., dict[str, Any]] = deliver_artifact,
+    config: Optional[dict] = None,
+    session_id: Optional[str] = None,
+) -> tuple[dict[str, Any], dict[str, Any], dict[str, dict[str, Any]]]:
+    """
+    Deliver a module's HTML and XLSX reports and its run plots as one batch.
+
+    Plots are the ``*<run_id>*.png`` files in whichever ``plot_dirs`` exist and go to
+    ``<module>/plots``. Returns ``(html_delivery, xlsx_delivery, plot_deliveries)``
+    with the plot deliveries keyed by file name. ``deliver`` defaults to
+    ``deliver_artifact``; tools pass their own reference so it can be stubbed per tool.
+    """
+    plot_files = [
+        plot_file
+        for plot_dir in plot_dirs
+        if plot_dir.exists()
+        for plot_file in plot_dir.glob(f"*{run_id}*.png")
+    ]
+    targets = [(html_path, module), (xlsx_path, module)]
+    targets.extend((str(plot_file), f"{module}/plots") for plot_file in plot_files)
+    html_delivery, xlsx_delivery, *plot_deliveries = deliver_many(
+        lambda target: deliver(target[0], run_id, target[1], config=config, session_id=session_id),
+        targets,
+    )
+    by_name = {
+        plot_file.name: delivered for plot_file, delivered in zip(plot_files, plot_deliveries)
+    }
+    return html_delivery, xlsx_delivery, by_name
+
+
 def split_artifact_reference(reference: str) -> tuple[str, str]:
     return _split_artifact_reference(reference)
 
@@ -382,7 +482,39 @@ def append_to_run_history(run_id: str, entry: dict, session_id: Optional[str] =
     history_dir.mkdir(parents=True, exist_ok=True)
 
     history_file = history_dir / f"{run_id}_history.json"
+    safe_entry = make_json_safe(entry)
+    if not isinstance(safe_entry, dict):
+        safe_entry = {"entry": safe_entry}
+
+    # Group commit: queue the entry, then whichever writer holds the file lock drains
+    # every queued entry in one write. Once this thread gets the lock, its entry is on
+    # disk, either written here or by the holder that drained it.
+    ticket: dict[str, Any] = {"entry": safe_entry, "error": None}
+    key = str(history_file.resolve())
+    with _PENDING_HISTORY_GUARD:
+        safe_entry["timestamp"] = datetime.now(timezone.utc).isoformat()
+        _PENDING_HISTORY.setdefault(key, []).append(ticket)
     with _history_lock(history_file):
+        with _PENDING_HISTORY_GUARD:
+            batch = _PENDING_HISTORY.pop(key, [])
+        if batch:
+            _write_history_batch(history_file, batch)
+    if ticket["error"] is not None:
+        raise ticket["error"]
+
+    upload_artifact(str(history_file), run_id, "history", session_id=session_id)
+
+
+def _write_history_batch(history_file: Path, batch: list[dict[str, Any]]) -> None:
+    """Write queued history tickets; the caller holds the file's history lock."""
+    entries = [ticket["entry"] for ticket in batch]
+    try:
+        # Well-formed histories take an in-place append and new ones are written
+        # directly; only empty or damaged files are recovered and rewritten atomically.
+        if _append_json_array_entries(history_file, entries) or _create_json_file(
+            history_file, entries
+        ):
+            return
         history, parse_meta = _read_history_file_safe(history_file)
         if parse_meta["parse_errors"]:
             logger.warning(
@@ -390,15 +522,11 @@ def append_to_run_history(run_id: str, entry: dict, session_id: Optional[str] =
                 history_file,
                 parse_meta["parse_errors"],
             )
-
-        safe_entry = make_json_safe(entry)
-        if not isinstance(safe_entry, dict):
-            safe_entry = {"entry": safe_entry}
-        safe_entry["timestamp"] = datetime.now(timezone.utc).isoformat()
-        history.append(safe_entry)
+        history.extend(entries)
         _write_json_atomic(history_file, history)
-
-    upload_artifact(str(history_file), run_id, "history", session_id=session_id)
+    except Exception as exc:
+        for ticket in batch:
+            ticket["error"] = exc
 
 
 def get_run_history(run_id: str, session_id: Optional[str] = None) -> list:
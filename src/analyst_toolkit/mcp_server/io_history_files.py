@@ -8,14 +8,73 @@ from typing import Any, cast
 
 from analyst_toolkit.mcp_server.io_serialization import make_json_safe
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _dumps_indented(payload: Any) -> bytes:
+    # orjson (from the ``accel`` extra) emits the same two-space layout; payloads have
+    # already been through make_json_safe, so its null-for-NaN handling never applies.
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_INDENT_2)
+    return json.dumps(payload, indent=2, allow_nan=False).encode("utf-8")
+
 
 def write_json_atomic(path: Path, payload: Any) -> None:
     tmp_path = path.with_suffix(f"{path.suffix}.tmp")
-    with open(tmp_path, "w", encoding="utf-8") as f:
-        json.dump(payload, f, indent=2, allow_nan=False)
+    with open(tmp_path, "wb") as f:
+        f.write(_dumps_indented(payload))
     os.replace(tmp_path, path)
 
 
+def create_json_file(path: Path, payload: Any) -> bool:
+    """
+    Write ``payload`` to a new file at ``path`` with the ``write_json_atomic`` layout.
+
+    There is nothing to protect when the file does not exist yet, so this skips the
+    temp-file-and-rename step. Returns False without touching anything when ``path``
+    already exists.
+    """
+    encoded = _dumps_indented(payload)
+    try:
+        f = open(path, "xb")
+    except FileExistsError:
+        return False
+    with f:
+        f.write(encoded)
+    return True
+
+
+def append_json_array_entries(path: Path, entries: list[Any]) -> bool:
+    """
+    Append ``entries`` in place to a JSON array written by ``write_json_atomic``.
+
+    Only the closing ``\n]`` is overwritten, so an append costs the size of the new entries
+    rather than a parse and rewrite of the whole file. The bytes on disk match what
+    ``write_json_atomic`` would produce for the extended list. Returns False without
+    touching the file when it is missing, empty, or not terminated the way
+    ``write_json_atomic`` leaves it, so callers can fall back to a full rewrite.
+    """
+    # Serialize first: an unserializable entry must not leave a half-written file.
+    encoded = b"," + _dumps_indented(list(entries))[1:]
+    try:
+        f = open(path, "r+b")
+    except FileNotFoundError:
+        return False
+    with f:
+        size = f.seek(0, os.SEEK_END)
+        if size < 4:
+            return False
+        f.seek(size - 2)
+        if f.read(2) != b"\n]":
+            return False
+        f.seek(size - 2)
+        f.write(encoded)
+    return True
+
+
 def read_history_file_safe(path: Path) -> tuple[list, dict[str, Any]]:
     meta: dict[str, Any] = {"parse_errors": [], "skipped_records": 0}
     parse_errors = cast(list[str], meta["parse_errors"])
@@ -3,11 +3,13 @@
 import logging
 import os
 import tempfile
+import threading
 from pathlib import Path
-from typing import Callable
+from typing import Any, Callable
 
 import pandas as pd
 
+from analyst_toolkit.m00_utils.export_utils import write_csv
 from analyst_toolkit.mcp_server.input.errors import InputNotFoundError
 from analyst_toolkit.mcp_server.input.limits import (
     enforce_dataframe_limits,
@@ -27,6 +29,27 @@ _CONTENT_TYPES = {
 }
 
 
+# One storage client per process and client class. Building a client runs credential
+# discovery, and a client is safe to share across upload threads.
+_STORAGE_CLIENTS: dict[tuple[int, type], Any] = {}
+_STORAGE_CLIENTS_GUARD = threading.Lock()
+
+
+def _storage_client(storage: Any) -> Any:
+    key = (os.getpid(), storage.Client)
+    with _STORAGE_CLIENTS_GUARD:
+        client = _STORAGE_CLIENTS.get(key)
+        if client is None:
+            client = storage.Client()
+            _STORAGE_CLIENTS[key] = client
+    return client
+
+
+def _reset_storage_clients_for_tests() -> None:
+    with _STORAGE_CLIENTS_GUARD:
+        _STORAGE_CLIENTS.clear()
+
+
 def _gcs_url(bucket_name: str, blob_path: str) -> str:
     return f"https://storage.googleapis.com/{bucket_name}/{blob_path}"
 
@@ -86,7 +109,7 @@ def load_from_gcs(gcs_path: str) -> pd.DataFrame:
     bucket_name, _, prefix = stripped.partition("/")
     from google.cloud import storage
 
-    client = storage.Client()
+    client = _storage_client(storage)
     bucket = client.bucket(bucket_name)
 
     # Direct file path — download and read without listing
@@ -234,7 +257,7 @@ def save_output(df: pd.DataFrame, path: str) -> str:
             if suffix == ".parquet":
                 df.to_parquet(tmp_path, index=False)
             else:
-                df.to_csv(tmp_path, index=False)
+                write_csv(df, tmp_path)
 
             try:
                 from google.cloud import storage
@@ -244,7 +267,7 @@ def save_output(df: pd.DataFrame, path: str) -> str:
                 if not bucket_name or not blob_path:
                     raise ValueError(f"Invalid GCS path: {path}")
 
-                client = storage.Client()
+                client = _storage_client(storage)
                 bucket = client.bucket(bucket_name)
                 blob = bucket.blob(blob_path)
                 try:
@@ -271,7 +294,7 @@ def save_output(df: pd.DataFrame, path: str) -> str:
     if path.endswith(".parquet"):
         df.to_parquet(path, index=False)
     else:
-        df.to_csv(path, index=False)
+        write_csv(df, path)
     if not p.exists():
         raise FileNotFoundError(f"Local export write failed: '{p}'")
     return str(p.absolute())
@@ -312,7 +335,7 @@ def upload_artifact(
     bucket_name = bucket_uri.removeprefix("gs://")
     blob_path = f"{prefix}/{path_root}/{module}/{p.name}"
 
-    client = storage.Client()
+    client = _storage_client(storage)
     bucket = client.bucket(bucket_name)
 
     def _upload(path: str) -> str:
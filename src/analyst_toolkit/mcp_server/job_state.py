@@ -39,6 +39,12 @@ def _env_float(name: str, default: float) -> float:
     return parsed if parsed >= 0 else default
 
 
+_TERMINAL_STATES = frozenset({"succeeded", "failed"})
+# The journal is folded into the snapshot once it holds this many lines, or ten per
+# retained job if that is more.
+_COMPACT_MIN_LINES = 256
+
+
 class JobStore:
     """
     Thread-safe job store with best-effort local persistence.
@@ -46,11 +52,16 @@ class JobStore:
     Persistence default path:
       exports/reports/jobs/job_state.json
     Override with ANALYST_MCP_JOB_STATE_PATH.
+
+    Each mutation appends the job's new state as one line to a ``.jsonl`` journal next
+    to that snapshot; loading replays the journal over the snapshot, and compaction
+    rewrites the snapshot and empties the journal.
     """
 
     _lock: threading.Lock = threading.Lock()
     _jobs: dict[str, dict[str, Any]] = {}
     _loaded: bool = False
+    _journal_lines: int = 0
     _max_jobs: int = _env_int("ANALYST_MCP_MAX_JOBS", 512)
     _job_ttl_sec: float = _env_float("ANALYST_MCP_JOB_TTL_SEC", 86400.0)
 
@@ -61,6 +72,12 @@ class JobStore:
             return Path(raw)
         return Path("exports/reports/jobs/job_state.json")
 
+    @classmethod
+    def _journal_path(cls) -> Path:
+        path = cls._state_path()
+        journal = path.with_suffix(".jsonl")
+        return journal if journal != path else path.with_suffix(".journal.jsonl")
+
     @classmethod
     def _to_json_safe(cls, value: Any) -> Any:
         # Roundtrip through JSON with default=str to ensure persistence never crashes on
@@ -72,28 +89,79 @@ class JobStore:
         if cls._loaded:
             return
         path = cls._state_path()
-        if not path.exists():
-            cls._loaded = True
-            return
-        try:
-            loaded = json.loads(path.read_text(encoding="utf-8"))
-            if isinstance(loaded, dict):
-                cls._jobs = loaded
-            else:
+        if path.exists():
+            try:
+                loaded = json.loads(path.read_text(encoding="utf-8"))
+                if isinstance(loaded, dict):
+                    cls._jobs = loaded
+                else:
+                    cls._jobs = {}
+            except Exception as exc:
+                logger.warning("Failed to load job state from %s: %s", path, exc)
                 cls._jobs = {}
-        except Exception as exc:
-            logger.warning("Failed to load job state from %s: %s", path, exc)
-            cls._jobs = {}
+        cls._journal_lines, damaged = cls._replay_journal_unsafe()
         cls._loaded = True
+        if damaged:
+            # The next append would otherwise continue the torn line, and the merged
+            # line would be dropped on the following replay along with its update.
+            try:
+                cls._compact_unsafe()
+            except OSError as exc:
+                logger.warning("Failed to compact damaged job journal: %s", exc)
+
+    @classmethod
+    def _replay_journal_unsafe(cls) -> tuple[int, bool]:
+        """Replay the journal over ``_jobs``; return its line count and whether it is torn."""
+        journal = cls._journal_path()
+        try:
+            text = journal.read_text(encoding="utf-8")
+        except FileNotFoundError:
+            return 0, False
+        except Exception as exc:
+            logger.warning("Failed to read job journal %s: %s", journal, exc)
+            return 0, False
+        lines = text.splitlines()
+        # Every complete append ends in a newline, so anything else is a torn tail.
+        damaged = bool(text) and not text.endswith("\n")
+        for line in lines:
+            try:
+                job = json.loads(line)
+            except ValueError:
+                # A crash mid-append can leave a torn last line; earlier records still apply.
+                logger.warning("Skipping unreadable job journal line in %s", journal)
+                damaged = True
+                continue
+            if isinstance(job, dict) and job.get("job_id"):
+                cls._jobs[str(job["job_id"])] = job
+        return len(lines), damaged
+
+    @classmethod
+    def _append_unsafe(cls, job: dict[str, Any]) -> None:
+        journal = cls._journal_path()
+        journal.parent.mkdir(parents=True, exist_ok=True)
+        # Payloads enter the store through _to_json_safe, so jobs serialize as-is;
+        # default=str only guards scalar fields set by callers.
+        line = json.dumps(job, default=str)
+        with open(journal, "a", encoding="utf-8") as f:
+            f.write(f"{line}\n")
+            if job.get("state") in _TERMINAL_STATES:
+                f.flush()
+                os.fsync(f.fileno())
+        cls._journal_lines += 1
+        if cls._journal_lines > max(_COMPACT_MIN_LINES, 10 * len(cls._jobs)):
+            cls._compact_unsafe()
 
     @classmethod
-    def _persist_unsafe(cls):
+    def _compact_unsafe(cls):
         path = cls._state_path()
         path.parent.mkdir(parents=True, exist_ok=True)
-        payload = cls._to_json_safe(cls._jobs)
         tmp = path.with_suffix(f"{path.suffix}.tmp")
-        tmp.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+        tmp.write_text(json.dumps(cls._jobs, indent=2, default=str), encoding="utf-8")
         tmp.replace(path)
+        # Journal records are whole job states, so replaying a journal that survived a
+        # crash right here over the new snapshot still lands on the same jobs.
+        cls._journal_path().unlink(missing_ok=True)
+        cls._journal_lines = 0
 
     @classmethod
     def _prune_unsafe(cls, now: float) -> None:
@@ -101,7 +169,7 @@ class JobStore:
         if ttl > 0:
             expired = []
             for job_id, job in list(cls._jobs.items()):
-                if str(job.get("state")) not in {"succeeded", "failed"}:
+                if str(job.get("state")) not in _TERMINAL_STATES:
                     continue
                 anchor = float(job.get("finished_at") or job.get("updated_at") or 0)
                 if anchor and now - anchor > ttl:
@@ -112,7 +180,7 @@ class JobStore:
         terminal_jobs = [
             (job_id, job)
             for job_id, job in cls._jobs.items()
-            if str(job.get("state")) in {"succeeded", "failed"}
+            if str(job.get("state")) in _TERMINAL_STATES
         ]
         overflow = len(terminal_jobs) - cls._max_jobs
         if overflow <= 0:
@@ -135,6 +203,9 @@ class JobStore:
     ) -> str:
         now = time.time()
         job_id = f"job_{uuid.uuid4().hex[:12]}"
+        # The JSON round trip already yields a private copy, and running it before the
+        # lock keeps large payloads from stalling other job updates.
+        safe_inputs = cls._to_json_safe(inputs or {})
         with cls._lock:
             cls._ensure_loaded_unsafe()
             cls._prune_unsafe(now)
@@ -147,11 +218,11 @@ class JobStore:
                 "updated_at": now,
                 "started_at": None,
                 "finished_at": None,
-                "inputs": cls._to_json_safe(deepcopy(inputs or {})),
+                "inputs": safe_inputs,
                 "result": None,
                 "error": None,
             }
-            cls._persist_unsafe()
+            cls._append_unsafe(cls._jobs[job_id])
         return job_id
 
     @classmethod
@@ -166,11 +237,12 @@ class JobStore:
             job["state"] = "running"
             job["started_at"] = now
             job["updated_at"] = now
-            cls._persist_unsafe()
+            cls._append_unsafe(job)
 
     @classmethod
     def mark_succeeded(cls, job_id: str, result: dict[str, Any] | None = None):
         now = time.time()
+        safe_result = cls._to_json_safe(result or {})
         with cls._lock:
             cls._ensure_loaded_unsafe()
             cls._prune_unsafe(now)
@@ -180,14 +252,15 @@ class JobStore:
             job["state"] = "succeeded"
             job["finished_at"] = now
             job["updated_at"] = now
-            job["result"] = cls._to_json_safe(deepcopy(result or {}))
+            job["result"] = safe_result
             job["error"] = None
             cls._prune_unsafe(now)
-            cls._persist_unsafe()
+            cls._append_unsafe(job)
 
     @classmethod
     def mark_failed(cls, job_id: str, error: dict[str, Any]):
         now = time.time()
+        safe_error = cls._to_json_safe(error)
         with cls._lock:
             cls._ensure_loaded_unsafe()
             cls._prune_unsafe(now)
@@ -197,9 +270,9 @@ class JobStore:
             job["state"] = "failed"
             job["finished_at"] = now
             job["updated_at"] = now
-            job["error"] = cls._to_json_safe(deepcopy(error))
+            job["error"] = safe_error
             cls._prune_unsafe(now)
-            cls._persist_unsafe()
+            cls._append_unsafe(job)
 
     @classmethod
     def get(cls, job_id: str) -> dict[str, Any] | None:
@@ -225,4 +298,4 @@ class JobStore:
         with cls._lock:
             cls._ensure_loaded_unsafe()
             cls._jobs.clear()
-            cls._persist_unsafe()
+            cls._compact_unsafe()
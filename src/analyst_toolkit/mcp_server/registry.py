@@ -18,6 +18,10 @@ logger = logging.getLogger("analyst_toolkit.mcp_server.registry")
 # Tool registry: tool_name → {fn, description, inputSchema}
 TOOL_REGISTRY: dict[str, dict[str, Any]] = {}
 
+# Last tools/list build: (registry, its (name, meta) entries, descriptors). Rebuilt when
+# the registry's entries differ, however they were changed.
+_TOOL_DESCRIPTORS: tuple[dict, list[tuple[str, dict]], list[dict[str, Any]]] | None = None
+
 
 def _input_error_remediation(code: str) -> str:
     if code == "INPUT_PAYLOAD_TOO_LARGE":
@@ -102,3 +106,41 @@ def register_tool(name: str, fn, description: str, input_schema: dict) -> None:
         "inputSchema": input_schema,
     }
     logger.info(f"Registered tool: {name}")
+
+
+def tool_descriptors(
+    tool_registry: dict[str, dict[str, Any]] | None = None,
+) -> list[dict[str, Any]]:
+    """
+    Return the ``tools/list`` entries (name, description, inputSchema) for every tool.
+
+    Entries come from ``tool_registry`` (``TOOL_REGISTRY`` by default), the same mapping
+    ``tools/call`` dispatches through. The list is reused while that mapping holds the
+    same tools and rebuilt as soon as one is added, replaced or removed. Callers share
+    it, so treat it as read-only.
+    """
+    global _TOOL_DESCRIPTORS
+    if tool_registry is None:
+        tool_registry = TOOL_REGISTRY
+    entries = list(tool_registry.items())
+    cached = _TOOL_DESCRIPTORS
+    if (
+        cached is not None
+        and cached[0] is tool_registry
+        and len(cached[1]) == len(entries)
+        and all(
+            name == cached_name and meta is cached_meta
+            for (name, meta), (cached_name, cached_meta) in zip(entries, cached[1])
+        )
+    ):
+        return cached[2]
+    descriptors = [
+        {
+            "name": name,
+            "description": meta["description"],
+            "inputSchema": meta["inputSchema"],
+        }
+        for name, meta in entries
+    ]
+    _TOOL_DESCRIPTORS = (tool_registry, entries, descriptors)
+    return descriptors
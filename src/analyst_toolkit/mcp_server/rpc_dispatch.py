@@ -7,6 +7,7 @@ from typing import Any, Awaitable, Callable
 
 import mcp.types as types
 
+from analyst_toolkit.mcp_server.registry import tool_descriptors
 from analyst_toolkit.mcp_server.resources import ResourceNotFoundError, ResourcePayloadError
 from analyst_toolkit.mcp_server.response_utils import (
     attach_trace_id,
@@ -69,15 +70,9 @@ async def dispatch_rpc_method(
         return RpcDispatchResult(payload=rpc_ok(req_id, server_info), ok=True)
 
     if method == "tools/list":
-        tools = [
-            {
-                "name": name,
-                "description": meta["description"],
-                "inputSchema": meta["inputSchema"],
-            }
-            for name, meta in tool_registry.items()
-        ]
-        return RpcDispatchResult(payload=rpc_ok(req_id, {"tools": tools}), ok=True)
+        return RpcDispatchResult(
+            payload=rpc_ok(req_id, {"tools": tool_descriptors(tool_registry)}), ok=True
+        )
 
     if method == "tools/call":
         tool_name = params.get("name")
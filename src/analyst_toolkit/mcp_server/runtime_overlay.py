@@ -9,6 +9,7 @@ from typing import Any
 import yaml
 from pydantic import ValidationError
 
+from analyst_toolkit.m00_utils.config_loader import safe_load_yaml
 from analyst_toolkit.mcp_server.config_models import RuntimeOverlayConfig
 
 logger = logging.getLogger(__name__)
@@ -76,7 +77,7 @@ def _coerce_runtime_overlay_input(runtime: Any) -> dict[str, Any]:
             raise RuntimeOverlayError(
                 f"Runtime overlay string exceeds maximum line count of {MAX_RUNTIME_YAML_LINES}."
             )
-        loaded = yaml.safe_load(runtime)
+        loaded = safe_load_yaml(runtime)
         runtime = loaded if isinstance(loaded, dict) else {}
     if not isinstance(runtime, dict):
         raise RuntimeOverlayError("Runtime overlay must be a dict, YAML string, or None.")
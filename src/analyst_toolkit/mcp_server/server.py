@@ -49,7 +49,7 @@ from analyst_toolkit.mcp_server.input.ingest import (
 )
 from analyst_toolkit.mcp_server.input.models import InputSourceType
 from analyst_toolkit.mcp_server.observability import RuntimeMetrics, log_rpc_event
-from analyst_toolkit.mcp_server.registry import TOOL_REGISTRY
+from analyst_toolkit.mcp_server.registry import TOOL_REGISTRY, tool_descriptors
 from analyst_toolkit.mcp_server.resources import list_mcp_resources, read_mcp_resource
 from analyst_toolkit.mcp_server.response_utils import new_trace_id
 from analyst_toolkit.mcp_server.rpc_dispatch import dispatch_rpc_method, rpc_error
@@ -80,6 +80,17 @@ def _env_float(name: str, default: float) -> float:
     return parsed if parsed > 0 else default
 
 
+def _env_int(name: str, default: int) -> int:
+    value = os.environ.get(name)
+    if value is None:
+        return default
+    try:
+        parsed = int(value)
+    except ValueError:
+        return default
+    return parsed if parsed > 0 else default
+
+
 def _env_bool(name: str, default: bool) -> bool:
     value = os.environ.get(name)
     if value is None:
@@ -110,6 +121,8 @@ def _log_http_auth_posture(host: str, auth_token: str) -> None:
 
 RESOURCE_IO_TIMEOUT_SEC = _env_float("ANALYST_MCP_RESOURCE_TIMEOUT_SEC", 8.0)
 ADVERTISE_RESOURCE_TEMPLATES = _env_bool("ANALYST_MCP_ADVERTISE_RESOURCE_TEMPLATES", True)
+# Batch members are dispatched one after another inside a single HTTP request.
+MAX_RPC_BATCH_SIZE = _env_int("ANALYST_MCP_MAX_RPC_BATCH", 32)
 STRUCTURED_LOGS = _env_bool("ANALYST_MCP_STRUCTURED_LOGS", False)
 AUTH_TOKEN = os.environ.get("ANALYST_MCP_AUTH_TOKEN", "").strip()
 SERVER_STARTED_AT = time.time()
@@ -180,14 +193,7 @@ def _require_http_auth(request: Request) -> str:
 @mcp_server.list_tools()
 async def list_tools() -> list[types.Tool]:
     """Standard MCP tools/list handler."""
-    return [
-        types.Tool(
-            name=name,
-            description=meta["description"],
-            inputSchema=meta["inputSchema"],
-        )
-        for name, meta in TOOL_REGISTRY.items()
-    ]
+    return [types.Tool(**descriptor) for descriptor in tool_descriptors()]
 
 
 @mcp_server.call_tool()
@@ -273,16 +279,44 @@ async def read_resource(uri: Any) -> list[ReadResourceContents]:
 # --- HTTP /rpc JSON-RPC Handlers (FridAI Legacy/Native) ---
 
 
-@app.post("/rpc")
-async def rpc_handler(request: Request) -> JSONResponse:
-    """HTTP JSON-RPC 2.0 dispatcher for FridAI."""
+def _record_rpc_completion(
+    start: float,
+    *,
+    trace_id: str,
+    req_id: Any,
+    method: str,
+    tool_name: str | None,
+    ok: bool,
+    level: int = logging.INFO,
+    error_code: int | None = None,
+    run_id: str | None = None,
+    session_id: str | None = None,
+) -> None:
+    duration_ms = round((time.perf_counter() - start) * 1000, 2)
+    METRICS.record_rpc(method=method, duration_ms=duration_ms, ok=ok, tool_name=tool_name)
+    _log_rpc_event(
+        level,
+        "rpc_request_completed",
+        trace_id=trace_id,
+        req_id=req_id,
+        method=method,
+        tool=tool_name,
+        ok=ok,
+        error_code=error_code,
+        duration_ms=duration_ms,
+        run_id=run_id,
+        session_id=session_id,
+    )
+
+
+async def _handle_rpc_message(body: Any, trace_id: str) -> dict[str, Any]:
+    """Dispatch one JSON-RPC message, recording metrics and logs for it."""
     start = time.perf_counter()
-    trace_id = new_trace_id()
     req_id: Any = None
     method = "unknown"
     tool_name: str | None = None
 
-    def _respond(
+    def _complete(
         payload: dict[str, Any],
         *,
         ok: bool,
@@ -290,49 +324,28 @@ async def rpc_handler(request: Request) -> JSONResponse:
         error_code: int | None = None,
         run_id: str | None = None,
         session_id: str | None = None,
-    ) -> JSONResponse:
-        duration_ms = round((time.perf_counter() - start) * 1000, 2)
-        METRICS.record_rpc(method=method, duration_ms=duration_ms, ok=ok, tool_name=tool_name)
-        _log_rpc_event(
-            level,
-            "rpc_request_completed",
+    ) -> dict[str, Any]:
+        _record_rpc_completion(
+            start,
             trace_id=trace_id,
             req_id=req_id,
             method=method,
-            tool=tool_name,
+            tool_name=tool_name,
             ok=ok,
+            level=level,
             error_code=error_code,
-            duration_ms=duration_ms,
             run_id=run_id,
             session_id=session_id,
         )
-        return JSONResponse(payload, status_code=200)
+        return payload
 
-    if not _is_authorized(request):
-        duration_ms = round((time.perf_counter() - start) * 1000, 2)
-        METRICS.record_rpc(
-            method="tools/call_auth_rejected",
-            duration_ms=duration_ms,
+    if not isinstance(body, dict):
+        return _complete(
+            rpc_error(None, -32600, "Invalid Request"),
             ok=False,
-            tool_name=None,
-        )
-        _log_rpc_event(
-            logging.WARNING,
-            "rpc_request_rejected_auth",
-            trace_id=trace_id,
-            req_id=req_id,
-            method=method,
-            duration_ms=duration_ms,
+            level=logging.WARNING,
+            error_code=-32600,
         )
-        return JSONResponse(
-            {"error": "Unauthorized", "trace_id": trace_id},
-            status_code=401,
-        )
-
-    try:
-        body = await request.json()
-    except Exception:
-        return _respond(rpc_error(None, -32700, "Parse error"), ok=False, level=logging.WARNING)
 
     req_id = body.get("id")
     method = body.get("method", "")
@@ -363,7 +376,7 @@ async def rpc_handler(request: Request) -> JSONResponse:
         trace_id=trace_id,
         logger=logger,
     )
-    return _respond(
+    return _complete(
         outcome.payload,
         ok=outcome.ok,
         level=outcome.level,
@@ -373,6 +386,78 @@ async def rpc_handler(request: Request) -> JSONResponse:
     )
 
 
+@app.post("/rpc")
+async def rpc_handler(request: Request) -> JSONResponse:
+    """HTTP JSON-RPC 2.0 dispatcher for FridAI.
+
+    Accepts a single request object or a JSON-RPC batch (array of request objects);
+    batch members are dispatched in order and answered with an array of responses.
+    Batches longer than ``MAX_RPC_BATCH_SIZE`` are rejected whole as an invalid request.
+    """
+    start = time.perf_counter()
+    trace_id = new_trace_id()
+
+    if not _is_authorized(request):
+        duration_ms = round((time.perf_counter() - start) * 1000, 2)
+        METRICS.record_rpc(
+            method="tools/call_auth_rejected",
+            duration_ms=duration_ms,
+            ok=False,
+            tool_name=None,
+        )
+        _log_rpc_event(
+            logging.WARNING,
+            "rpc_request_rejected_auth",
+            trace_id=trace_id,
+            req_id=None,
+            method="unknown",
+            duration_ms=duration_ms,
+        )
+        return JSONResponse(
+            {"error": "Unauthorized", "trace_id": trace_id},
+            status_code=401,
+        )
+
+    try:
+        body = await request.json()
+    except Exception:
+        _record_rpc_completion(
+            start,
+            trace_id=trace_id,
+            req_id=None,
+            method="unknown",
+            tool_name=None,
+            ok=False,
+            level=logging.WARNING,
+        )
+        return JSONResponse(rpc_error(None, -32700, "Parse error"), status_code=200)
+
+    if isinstance(body, list) and len(body) > MAX_RPC_BATCH_SIZE:
+        _record_rpc_completion(
+            start,
+            trace_id=trace_id,
+            req_id=None,
+            method="unknown",
+            tool_name=None,
+            ok=False,
+            level=logging.WARNING,
+            error_code=-32600,
+        )
+        return JSONResponse(
+            rpc_error(
+                None,
+                -32600,
+                "Invalid Request",
+                {"batch_size": len(body), "max_batch_size": MAX_RPC_BATCH_SIZE},
+            ),
+            status_code=200,
+        )
+    if isinstance(body, list) and body:
+        payloads = [await _handle_rpc_message(message, trace_id) for message in body]
+        return JSONResponse(payloads, status_code=200)
+    return JSONResponse(await _handle_rpc_message(body, trace_id), status_code=200)
+
+
 @app.post("/inputs/upload")
 async def upload_input(
     request: Request,
@@ -1,5 +1,7 @@
 """state.py — Session state management for MCP tool pipelines."""
 
+import heapq
+import itertools
 import json
 import logging
 import os
@@ -19,6 +21,8 @@ logger = logging.getLogger(__name__)
 SESSION_TTL_SECONDS = int(os.environ.get("ANALYST_MCP_SESSION_TTL_SEC", 3600))
 SESSION_MAX_ENTRIES = int(os.environ.get("ANALYST_MCP_SESSION_MAX_ENTRIES", 32))
 SESSION_SQLITE_PATH_DEFAULT = "analyst_toolkit/session_store.db"
+# Wall clock for TTL bookkeeping; tests swap it out rather than backdating entries.
+_clock = time.time
 
 
 def _session_state_home() -> Path:
@@ -76,6 +80,10 @@ class StateStore:
     _sessions: Dict[str, pd.DataFrame] = {}
     _metadata: Dict[str, dict] = {}
     _last_accessed: Dict[str, float] = {}
+    # Min-heap of (last_accessed, seq, sid) pushed on every touch. Entries whose timestamp
+    # no longer matches _last_accessed are stale and skipped when they reach the head.
+    _access_heap: list[tuple[float, int, str]] = []
+    _access_seq = itertools.count()
     _session_run_ids: Dict[str, str] = {}
     _session_start_times: Dict[str, str] = {}
     _session_configs: Dict[str, Dict[str, str]] = {}
@@ -146,6 +154,16 @@ class StateStore:
         )
         return cursor.fetchone()
 
+    @classmethod
+    def _sqlite_fetch_scalar_unsafe(cls, conn: sqlite3.Connection, session_id: str, column: str):
+        # Scalar lookups skip the dataframe blob that a full-row fetch would load.
+        if column not in {"run_id", "started_at"}:
+            raise ValueError(f"Unsupported session column: {column}")
+        row = conn.execute(
+            f"SELECT {column} FROM sessions WHERE session_id = ?", (session_id,)
+        ).fetchone()
+        return row[0] if row is not None else None
+
     @classmethod
     def _sqlite_configs_from_row(cls, row) -> Dict[str, str]:
         if row is None or not row[8]:
@@ -181,7 +199,7 @@ class StateStore:
 
     @classmethod
     def _sqlite_cleanup_unsafe(cls, conn: sqlite3.Connection) -> None:
-        now = time.time()
+        now = _clock()
         expiry_cutoff = now - SESSION_TTL_SECONDS
         expired_rows = conn.execute(
             "SELECT session_id FROM sessions WHERE last_accessed < ?",
@@ -214,16 +232,25 @@ class StateStore:
         cls, df: pd.DataFrame, session_id: Optional[str] = None, run_id: Optional[str] = None
     ) -> str:
         """Save a DataFrame to the store. Generates a new session_id if not provided."""
+        using_sqlite = cls._using_sqlite()
+        # Parquet encoding dominates a SQLite save and, like the per-save metadata, touches
+        # no shared state, so both run before the store lock; concurrent saves only
+        # serialize on the write itself.
+        blob = sqlite3.Binary(cls._sqlite_df_blob(df)) if using_sqlite else None
+        now_ts = pd.Timestamp.now()
+        metadata = {
+            "row_count": len(df),
+            "col_count": len(df.columns),
+            "updated_at": now_ts.isoformat(),
+        }
         with cls._lock:
-            if cls._using_sqlite():
+            if using_sqlite:
                 conn = cls._sqlite_connect_unsafe()
                 try:
                     cls._sqlite_cleanup_unsafe(conn)
                     existing_row = (
                         cls._sqlite_fetch_row_unsafe(conn, session_id) if session_id else None
                     )
-                    now_ts = pd.Timestamp.now()
-                    now_iso = now_ts.isoformat()
                     if session_id is None:
                         session_id = f"sess_{uuid.uuid4().hex[:8]}"
                     started_at = (
@@ -237,11 +264,6 @@ class StateStore:
                         else (existing_row[1] if existing_row is not None else None)
                     )
                     configs = cls._sqlite_configs_from_row(existing_row)
-                    metadata = {
-                        "row_count": len(df),
-                        "col_count": len(df.columns),
-                        "updated_at": now_iso,
-                    }
                     conn.execute(
                         """
                         INSERT INTO sessions (
@@ -263,10 +285,10 @@ class StateStore:
                             session_id,
                             effective_run_id,
                             started_at,
-                            now_iso,
-                            time.time(),
+                            metadata["updated_at"],
+                            _clock(),
                             "parquet",
-                            sqlite3.Binary(cls._sqlite_df_blob(df)),
+                            blob,
                             json.dumps(metadata),
                             json.dumps(configs),
                         ),
@@ -284,15 +306,11 @@ class StateStore:
 
             if session_id is None:
                 session_id = f"sess_{uuid.uuid4().hex[:8]}"
-                cls._session_start_times[session_id] = pd.Timestamp.now().strftime("%Y%m%d_%H%M%S")
+                cls._session_start_times[session_id] = now_ts.strftime("%Y%m%d_%H%M%S")
 
             cls._sessions[session_id] = df
-            cls._metadata[session_id] = {
-                "row_count": len(df),
-                "col_count": len(df.columns),
-                "updated_at": pd.Timestamp.now().isoformat(),
-            }
-            cls._last_accessed[session_id] = time.time()
+            cls._metadata[session_id] = metadata
+            cls._touch_unsafe(session_id)
 
             if run_id:
                 cls._session_run_ids[session_id] = run_id
@@ -304,26 +322,28 @@ class StateStore:
     def get(cls, session_id: str) -> Optional[pd.DataFrame]:
         """Retrieve a DataFrame from the store by session_id."""
         with cls._lock:
-            if cls._using_sqlite():
-                conn = cls._sqlite_connect_unsafe()
-                try:
-                    cls._sqlite_cleanup_unsafe(conn)
-                    row = cls._sqlite_fetch_row_unsafe(conn, session_id)
-                    if row is None:
-                        return None
-                    now_ts = time.time()
-                    conn.execute(
-                        "UPDATE sessions SET last_accessed = ? WHERE session_id = ?",
-                        (now_ts, session_id),
-                    )
-                    conn.commit()
-                    return cls._sqlite_df_from_row(row)
-                finally:
-                    conn.close()
-            if session_id in cls._sessions:
-                cls._last_accessed[session_id] = time.time()
-                return cls._sessions[session_id]
-        return None
+            if not cls._using_sqlite():
+                if session_id in cls._sessions:
+                    cls._touch_unsafe(session_id)
+                    return cls._sessions[session_id]
+                return None
+            conn = cls._sqlite_connect_unsafe()
+            try:
+                cls._sqlite_cleanup_unsafe(conn)
+                row = cls._sqlite_fetch_row_unsafe(conn, session_id)
+                if row is None:
+                    return None
+                now_ts = _clock()
+                conn.execute(
+                    "UPDATE sessions SET last_accessed = ? WHERE session_id = ?",
+                    (now_ts, session_id),
+                )
+                conn.commit()
+            finally:
+                conn.close()
+        # The fetched row is private to this call, so decoding happens after the lock is
+        # released and concurrent readers don't queue behind parquet parsing.
+        return cls._sqlite_df_from_row(row)
 
     @classmethod
     def get_run_id(cls, session_id: str) -> Optional[str]:
@@ -333,8 +353,7 @@ class StateStore:
                 conn = cls._sqlite_connect_unsafe()
                 try:
                     cls._sqlite_cleanup_unsafe(conn)
-                    row = cls._sqlite_fetch_row_unsafe(conn, session_id)
-                    return row[1] if row is not None else None
+                    return cls._sqlite_fetch_scalar_unsafe(conn, session_id, "run_id")
                 finally:
                     conn.close()
             return cls._session_run_ids.get(session_id)
@@ -347,8 +366,7 @@ class StateStore:
                 conn = cls._sqlite_connect_unsafe()
                 try:
                     cls._sqlite_cleanup_unsafe(conn)
-                    row = cls._sqlite_fetch_row_unsafe(conn, session_id)
-                    return row[2] if row is not None else None
+                    return cls._sqlite_fetch_scalar_unsafe(conn, session_id, "started_at")
                 finally:
                     conn.close()
             return cls._session_start_times.get(session_id)
@@ -403,7 +421,7 @@ class StateStore:
             }
 
         expires_at_ts = last_accessed + SESSION_TTL_SECONDS
-        now = time.time()
+        now = _clock()
         return {
             "last_accessed_at": datetime.fromtimestamp(last_accessed, tz=timezone.utc).isoformat(),
             "expires_at": datetime.fromtimestamp(expires_at_ts, tz=timezone.utc).isoformat(),
@@ -489,16 +507,15 @@ class StateStore:
                     row = cls._sqlite_fetch_row_unsafe(conn, source_session_id)
                     if row is None:
                         return None
-                    df = cls._sqlite_df_from_row(row)
+                    if row[5] != "parquet":
+                        raise ValueError(f"Unsupported SQLite session dataframe format: {row[5]}")
                     new_session_id = f"sess_{uuid.uuid4().hex[:8]}"
                     now_ts = pd.Timestamp.now()
                     now_iso = now_ts.isoformat()
                     configs = cls._sqlite_configs_from_row(row) if copy_configs else {}
-                    metadata = {
-                        "row_count": len(df),
-                        "col_count": len(df.columns),
-                        "updated_at": now_iso,
-                    }
+                    # The stored parquet blob is immutable bytes, so the fork reuses it and
+                    # the source's shape metadata instead of decoding and re-encoding.
+                    metadata = {**cls._sqlite_metadata_from_row(row), "updated_at": now_iso}
                     conn.execute(
                         """
                         INSERT INTO sessions (
@@ -512,9 +529,9 @@ class StateStore:
                             run_id,
                             now_ts.strftime("%Y%m%d_%H%M%S"),
                             now_iso,
-                            time.time(),
+                            _clock(),
                             "parquet",
-                            sqlite3.Binary(cls._sqlite_df_blob(df.copy())),
+                            row[6],
                             json.dumps(metadata),
                             json.dumps(configs),
                         ),
@@ -544,7 +561,7 @@ class StateStore:
                 "col_count": len(df.columns),
                 "updated_at": now_ts.isoformat(),
             }
-            cls._last_accessed[new_session_id] = time.time()
+            cls._touch_unsafe(new_session_id)
             cls._session_start_times[new_session_id] = now_ts.strftime("%Y%m%d_%H%M%S")
 
             if run_id:
@@ -619,22 +636,51 @@ class StateStore:
         cls._session_configs.pop(sid, None)
         logger.info("Evicted session %s (%s)", sid, reason)
 
+    @classmethod
+    def _touch_unsafe(cls, sid: str) -> None:
+        """Record an access to ``sid``. Must be called with _lock held."""
+        now = _clock()
+        cls._last_accessed[sid] = now
+        heapq.heappush(cls._access_heap, (now, next(cls._access_seq), sid))
+        # Each touch strands the session's previous entry; rebuild once stale entries
+        # dominate so sessions that are read often don't grow the heap without bound.
+        if len(cls._access_heap) > 4 * len(cls._last_accessed) + 64:
+            cls._access_heap = [
+                (ts, next(cls._access_seq), key)
+                for key, ts in sorted(cls._last_accessed.items(), key=lambda item: item[1])
+            ]
+
+    @classmethod
+    def _oldest_access_unsafe(cls) -> Optional[tuple[float, str]]:
+        """Return the least recently accessed live session, dropping stale heap heads."""
+        heap = cls._access_heap
+        while heap:
+            ts, _, sid = heap[0]
+            if cls._last_accessed.get(sid) == ts:
+                return ts, sid
+            heapq.heappop(heap)
+        return None
+
     @classmethod
     def _cleanup_unsafe(cls):
         """Evict expired and over-limit sessions. Must be called with _lock held."""
-        now = time.time()
-        expired = [
-            sid
-            for sid, last_ts in cls._last_accessed.items()
-            if now - last_ts > SESSION_TTL_SECONDS
-        ]
-        for sid in expired:
+        # Only the least recently accessed sessions can have expired, so the sweep stops
+        # at the first live one rather than scanning every stored session.
+        now = _clock()
+        while (oldest := cls._oldest_access_unsafe()) is not None:
+            ts, sid = oldest
+            if now - ts <= SESSION_TTL_SECONDS:
+                break
+            heapq.heappop(cls._access_heap)
             cls._evict_session_unsafe(sid, "TTL reached")
 
         # LRU eviction when over capacity
         while len(cls._sessions) > SESSION_MAX_ENTRIES:
-            oldest_sid = min(cls._last_accessed, key=cls._last_accessed.get)
-            cls._evict_session_unsafe(oldest_sid, "LRU capacity limit")
+            oldest = cls._oldest_access_unsafe()
+            if oldest is None:
+                break
+            heapq.heappop(cls._access_heap)
+            cls._evict_session_unsafe(oldest[1], "LRU capacity limit")
 
     @classmethod
     def cleanup(cls):
@@ -667,6 +713,7 @@ class StateStore:
                 cls._sessions.clear()
                 cls._metadata.clear()
                 cls._last_accessed.clear()
+                cls._access_heap.clear()
                 cls._session_run_ids.clear()
                 cls._session_start_times.clear()
                 cls._session_configs.clear()
@@ -682,24 +729,22 @@ class StateStore:
                 cls._sessions.clear()
                 cls._metadata.clear()
                 cls._last_accessed.clear()
+                cls._access_heap.clear()
                 cls._session_run_ids.clear()
                 cls._session_start_times.clear()
                 cls._session_configs.clear()
 
     @classmethod
-    def backdate_session_for_test(cls, session_id: str, timestamp: float) -> None:
-        """Test helper: set last_accessed to a known timestamp for TTL assertions."""
+    def _reset_for_tests(cls) -> None:
+        """Test helper: drop all in-memory sessions by rebinding fresh containers."""
+        if cls._using_sqlite():
+            cls.clear()
+            return
         with cls._lock:
-            if cls._using_sqlite():
-                conn = cls._sqlite_connect_unsafe()
-                try:
-                    conn.execute(
-                        "UPDATE sessions SET last_accessed = ? WHERE session_id = ?",
-                        (timestamp, session_id),
-                    )
-                    conn.commit()
-                finally:
-                    conn.close()
-                return
-            if session_id in cls._last_accessed:
-                cls._last_accessed[session_id] = timestamp
+            cls._sessions = {}
+            cls._metadata = {}
+            cls._last_accessed = {}
+            cls._access_heap = []
+            cls._session_run_ids = {}
+            cls._session_start_times = {}
+            cls._session_configs = {}
@@ -2,6 +2,7 @@
 templates.py — Template discovery for tool calls and MCP resources.
 """
 
+from copy import deepcopy
 from dataclasses import dataclass
 from functools import lru_cache
 from importlib import resources
@@ -10,6 +11,8 @@ from urllib.parse import unquote, urlparse
 
 import yaml
 
+from analyst_toolkit.m00_utils.config_loader import safe_load_yaml
+
 RESOURCE_SCHEME = "analyst"
 RESOURCE_HOST = "templates"
 
@@ -152,6 +155,7 @@ def list_config_template_specs() -> list[TemplateSpec]:
 
 def refresh_template_spec_cache() -> None:
     list_config_template_specs.cache_clear()
+    _load_golden_configs.cache_clear()
 
 
 def list_module_template_specs() -> list[TemplateSpec]:
@@ -241,19 +245,27 @@ def read_template_resource(uri: str) -> str:
     return path.read_text(encoding="utf-8")
 
 
-def get_golden_configs() -> dict:
-    """
-    Scans config/golden_templates/ for YAML files and returns them as a dictionary.
-    """
+@lru_cache(maxsize=1)
+def _load_golden_configs() -> dict:
     templates = {}
     for file in _iter_golden_template_files():
         try:
             with file.open("r", encoding="utf-8") as f:
-                templates[file.stem] = yaml.safe_load(f)
+                templates[file.stem] = safe_load_yaml(f)
         except Exception:
             continue
     return templates
 
 
+def get_golden_configs() -> dict:
+    """
+    Scans config/golden_templates/ for YAML files and returns them as a dictionary.
+
+    The YAML is parsed once per process (see ``refresh_template_spec_cache``); each call
+    returns a deep copy so callers may mutate the configs they are handed.
+    """
+    return deepcopy(_load_golden_configs())
+
+
 # For backwards compatibility if imported as a constant
 GOLDEN_CONFIGS = get_golden_configs()
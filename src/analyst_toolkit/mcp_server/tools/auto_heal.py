@@ -5,6 +5,7 @@ import logging
 
 import yaml
 
+from analyst_toolkit.m00_utils.config_loader import safe_load_yaml
 from analyst_toolkit.m00_utils.export_utils import export_html_report
 from analyst_toolkit.mcp_server.io import (
     append_to_run_history,
@@ -107,7 +108,7 @@ async def _run_auto_heal_pipeline(
     if "normalization" in configs:
         try:
             norm_cfg_str = configs["normalization"]
-            norm_cfg = yaml.safe_load(norm_cfg_str)
+            norm_cfg = safe_load_yaml(norm_cfg_str)
             # The inferred config usually has a top-level 'normalization' key
             actual_cfg = norm_cfg.get("normalization", norm_cfg)
 
@@ -131,7 +132,7 @@ async def _run_auto_heal_pipeline(
     if "imputation" in configs:
         try:
             imp_cfg_str = configs["imputation"]
-            imp_cfg = yaml.safe_load(imp_cfg_str)
+            imp_cfg = safe_load_yaml(imp_cfg_str)
             actual_cfg = imp_cfg.get("imputation", imp_cfg)
             rules = actual_cfg.get("rules", {}) if isinstance(actual_cfg, dict) else {}
             strategies = rules.get("strategies") if isinstance(rules, dict) else None
@@ -224,12 +225,15 @@ async def _run_auto_heal_pipeline(
     warnings = list(lifecycle["warnings"]) + list(runtime_warnings)
     rendered_artifact_path = ""
     if export_html:
+        # Rendering and uploading the dashboard block on file and network I/O; run them
+        # off the event loop so queued async jobs and other requests keep progressing.
         try:
-            rendered_artifact_path = export_html_report(
-                auto_heal_report, artifact_path, "Auto Heal", run_id
+            rendered_artifact_path = await asyncio.to_thread(
+                export_html_report, auto_heal_report, artifact_path, "Auto Heal", run_id
             )
             artifact_path = rendered_artifact_path
-            artifact_delivery = deliver_artifact(
+            artifact_delivery = await asyncio.to_thread(
+                deliver_artifact,
                 artifact_path,
                 run_id=run_id,
                 module="auto_heal",
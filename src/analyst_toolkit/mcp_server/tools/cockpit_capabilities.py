@@ -5,6 +5,7 @@ from typing import Any
 
 import yaml
 
+from analyst_toolkit.m00_utils.config_loader import safe_load_yaml
 from analyst_toolkit.mcp_server.templates import (
     list_module_template_specs,
     list_runtime_template_specs,
@@ -145,7 +146,7 @@ def _load_template_root(root_key: str, template_path: str) -> dict[str, Any]:
     if not path.exists():
         return {}
     with path.open("r", encoding="utf-8") as f:
-        data = yaml.safe_load(f) or {}
+        data = safe_load_yaml(f) or {}
     if not isinstance(data, dict):
         return {}
     root = data.get(root_key, {})
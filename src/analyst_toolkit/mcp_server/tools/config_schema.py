@@ -1,8 +1,17 @@
 """MCP tool: toolkit_get_config_schema — returns JSON Schema for module configs."""
 
+from copy import deepcopy
+from functools import lru_cache
+
 from analyst_toolkit.mcp_server.config_models import CONFIG_MODELS
 
 
+@lru_cache(maxsize=None)
+def _module_json_schema(module_name: str) -> dict:
+    # Config models are fixed at import time, so each schema is generated once.
+    return CONFIG_MODELS[module_name].model_json_schema()
+
+
 async def _toolkit_get_config_schema(module_name: str) -> dict:
     """
     Return the JSON Schema for a specific module's configuration.
@@ -14,13 +23,10 @@ async def _toolkit_get_config_schema(module_name: str) -> dict:
             "message": f"Unknown module: {module_name}. Available: {list(CONFIG_MODELS.keys())}",
         }
 
-    model = CONFIG_MODELS[module_name]
-    schema = model.model_json_schema()
-
     return {
         "status": "pass",
         "module": module_name,
-        "schema": schema,
+        "schema": deepcopy(_module_json_schema(module_name)),
     }
 
 
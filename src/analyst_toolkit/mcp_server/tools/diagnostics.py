@@ -10,6 +10,7 @@ from analyst_toolkit.mcp_server.io import (
     coerce_config,
     compact_destination_metadata,
     deliver_artifact,
+    deliver_report_artifacts,
     empty_delivery_state,
     fold_status_with_artifacts,
     generate_default_export_path,
@@ -84,6 +85,8 @@ async def _toolkit_diagnostics(
     # Check if user explicitly asked for plotting in config OR tool arguments
     run_plots = plotting_cfg.get("run", False) or kwargs.get("plotting", False)
 
+    html_requested = should_export_html(config)
+
     # Build module config
     module_cfg = {
         "diagnostics": {
@@ -91,7 +94,7 @@ async def _toolkit_diagnostics(
             "logging": "off",
             "profile": {
                 "run": True,
-                "settings": {"export": True, "export_html": should_export_html(config)},
+                "settings": {"export": True, "export_html": html_requested},
             },
             "plotting": {
                 "run": run_plots,
@@ -140,49 +143,31 @@ async def _toolkit_diagnostics(
     warnings.extend(runtime_meta["runtime_warnings"])
     warnings.extend(export_delivery["warnings"])
 
-    if should_export_html(config):
-        artifact_path = f"exports/reports/diagnostics/{run_id}_diagnostics_report.html"
-        artifact_delivery = deliver_artifact(
-            artifact_path,
+    if html_requested:
+        plot_dirs = (
+            [Path("exports/plots/diagnostics"), Path(f"exports/plots/diagnostics/{run_id}")]
+            if run_plots
+            else []
+        )
+        artifact_delivery, xlsx_delivery, plot_delivery = deliver_report_artifacts(
             run_id,
             "diagnostics",
+            html_path=f"exports/reports/diagnostics/{run_id}_diagnostics_report.html",
+            xlsx_path=f"exports/reports/diagnostics/{run_id}_diagnostics_report.xlsx",
+            plot_dirs=plot_dirs,
+            deliver=deliver_artifact,
             config=kwargs,
             session_id=session_id,
         )
         artifact_path = artifact_delivery["local_path"]
         artifact_url = artifact_delivery["url"]
         warnings.extend(artifact_delivery["warnings"])
-
-        xlsx_path = f"exports/reports/diagnostics/{run_id}_diagnostics_report.xlsx"
-        xlsx_delivery = deliver_artifact(
-            xlsx_path,
-            run_id,
-            "diagnostics",
-            config=kwargs,
-            session_id=session_id,
-        )
         xlsx_url = xlsx_delivery["url"]
         warnings.extend(xlsx_delivery["warnings"])
-
-        if run_plots:
-            plot_dirs = [
-                Path("exports/plots/diagnostics"),
-                Path(f"exports/plots/diagnostics/{run_id}"),
-            ]
-            for plot_dir in plot_dirs:
-                if plot_dir.exists():
-                    for plot_file in plot_dir.glob(f"*{run_id}*.png"):
-                        delivered = deliver_artifact(
-                            str(plot_file),
-                            run_id,
-                            "diagnostics/plots",
-                            config=kwargs,
-                            session_id=session_id,
-                        )
-                        plot_delivery[plot_file.name] = delivered
-                        warnings.extend(delivered["warnings"])
-                        if delivered["url"]:
-                            plot_urls[plot_file.name] = delivered["url"]
+        for plot_name, delivered in plot_delivery.items():
+            warnings.extend(delivered["warnings"])
+            if delivered["url"]:
+                plot_urls[plot_name] = delivered["url"]
 
     artifact_contract = build_artifact_contract(
         export_url,
@@ -195,10 +180,10 @@ async def _toolkit_diagnostics(
             name: item["local_path"] for name, item in plot_delivery.items() if item["local_path"]
         },
         plot_urls=plot_urls,
-        expect_html=should_export_html(config),
-        expect_xlsx=should_export_html(config),
-        expect_plots=run_plots and should_export_html(config),
-        required_html=should_export_html(config),
+        expect_html=html_requested,
+        expect_xlsx=html_requested,
+        expect_plots=run_plots and html_requested,
+        required_html=html_requested,
         required_xlsx=False,
         probe_local_paths=True,
     )
@@ -44,14 +44,19 @@ async def _toolkit_drift_detection(
 
     added_cols = list(target_cols - base_cols)
     removed_cols = list(base_cols - target_cols)
-    common_cols = list(base_cols & target_cols)
+    # Keep the base frame's column order so reports are stable across runs.
+    common_cols = [c for c in dict.fromkeys(df_base.columns) if c in target_cols]
+
+    # Classify from the dtype maps instead of materializing a Series per column check.
+    base_dtypes = df_base.dtypes.to_dict()
+    target_dtypes = df_target.dtypes.to_dict()
 
     dtype_changes = {}
     for col in common_cols:
-        if df_base[col].dtype != df_target[col].dtype:
+        if base_dtypes[col] != target_dtypes[col]:
             dtype_changes[col] = {
-                "base": str(df_base[col].dtype),
-                "target": str(df_target[col].dtype),
+                "base": str(base_dtypes[col]),
+                "target": str(target_dtypes[col]),
             }
 
     # 2. Simple distribution comparison for numeric columns
@@ -59,12 +64,17 @@ async def _toolkit_drift_detection(
     numeric_cols = [
         c
         for c in common_cols
-        if pd.api.types.is_numeric_dtype(df_base[c]) and pd.api.types.is_numeric_dtype(df_target[c])
+        if pd.api.types.is_numeric_dtype(base_dtypes[c])
+        and pd.api.types.is_numeric_dtype(target_dtypes[c])
     ]
 
+    if numeric_cols:
+        # One column-wise reduction per frame rather than one mean() call per column.
+        base_means = df_base[numeric_cols].mean()
+        target_means = df_target[numeric_cols].mean()
     for col in numeric_cols:
-        base_mean = float(df_base[col].mean())
-        target_mean = float(df_target[col].mean())
+        base_mean = float(base_means[col])
+        target_mean = float(target_means[col])
         mean_diff_pct = abs(target_mean - base_mean) / (abs(base_mean) + 1e-9)
 
         drift_metrics[col] = {
@@ -11,6 +11,7 @@ from analyst_toolkit.mcp_server.io import (
     coerce_config,
     compact_destination_metadata,
     deliver_artifact,
+    deliver_report_artifacts,
     empty_delivery_state,
     fold_status_with_artifacts,
     generate_default_export_path,
@@ -83,6 +84,8 @@ async def _toolkit_duplicates(
     mode = _normalize_mode(base_cfg.get("mode", "flag"))
     plotting_requested = bool(config.get("plotting", {}).get("run", True))
 
+    html_requested = should_export_html(config)
+
     # Build module config for the pipeline runner
     module_cfg = {
         "duplicates": {
@@ -92,7 +95,7 @@ async def _toolkit_duplicates(
             "logging": "off",
             "settings": {
                 "export": True,
-                "export_html": should_export_html(config),
+                "export_html": html_requested,
                 "plotting": {"run": plotting_requested},
             },
         }
@@ -158,46 +161,28 @@ async def _toolkit_duplicates(
     if config_warning:
         advisory_warnings.append(config_warning)
 
-    if should_export_html(config):
-        artifact_path = f"exports/reports/duplicates/{run_id}_duplicates_report.html"
-        artifact_delivery = deliver_artifact(
-            artifact_path,
+    if html_requested:
+        # Upload plots - search both root and run_id subdir
+        plot_dirs = [Path("exports/plots/duplicates"), Path(f"exports/plots/duplicates/{run_id}")]
+        artifact_delivery, xlsx_delivery, plot_delivery = deliver_report_artifacts(
             run_id,
             "duplicates",
+            html_path=f"exports/reports/duplicates/{run_id}_duplicates_report.html",
+            xlsx_path=f"exports/reports/duplicates/{run_id}_duplicates_report.xlsx",
+            plot_dirs=plot_dirs,
+            deliver=deliver_artifact,
             config=kwargs,
             session_id=session_id,
         )
         artifact_path = artifact_delivery["local_path"]
         artifact_url = artifact_delivery["url"]
         artifact_warnings = artifact_delivery["warnings"]
-
-        xlsx_path = f"exports/reports/duplicates/{run_id}_duplicates_report.xlsx"
-        xlsx_delivery = deliver_artifact(
-            xlsx_path,
-            run_id,
-            "duplicates",
-            config=kwargs,
-            session_id=session_id,
-        )
         xlsx_url = xlsx_delivery["url"]
         artifact_warnings.extend(xlsx_delivery["warnings"])
-
-        # Upload plots - search both root and run_id subdir
-        plot_dirs = [Path("exports/plots/duplicates"), Path(f"exports/plots/duplicates/{run_id}")]
-        for plot_dir in plot_dirs:
-            if plot_dir.exists():
-                for plot_file in plot_dir.glob(f"*{run_id}*.png"):
-                    delivered = deliver_artifact(
-                        str(plot_file),
-                        run_id,
-                        "duplicates/plots",
-                        config=kwargs,
-                        session_id=session_id,
-                    )
-                    plot_delivery[plot_file.name] = delivered
-                    artifact_warnings.extend(delivered["warnings"])
-                    if delivered["url"]:
-                        plot_urls[plot_file.name] = delivered["url"]
+        for plot_name, delivered in plot_delivery.items():
+            artifact_warnings.extend(delivered["warnings"])
+            if delivered["url"]:
+                plot_urls[plot_name] = delivered["url"]
     else:
         artifact_warnings = []
 
@@ -212,10 +197,10 @@ async def _toolkit_duplicates(
             name: item["local_path"] for name, item in plot_delivery.items() if item["local_path"]
         },
         plot_urls=plot_urls,
-        expect_html=should_export_html(config),
-        expect_xlsx=should_export_html(config),
-        expect_plots=should_export_html(config) and plotting_requested,
-        required_html=should_export_html(config),
+        expect_html=html_requested,
+        expect_xlsx=html_requested,
+        expect_plots=html_requested and plotting_requested,
+        required_html=html_requested,
         probe_local_paths=True,
     )
     warnings = (
@@ -8,6 +8,7 @@ from typing import Any
 
 import yaml
 
+from analyst_toolkit.m00_utils.config_loader import safe_load_yaml
 from analyst_toolkit.m02_validation.validate_data import run_validation_suite
 from analyst_toolkit.m10_final_audit.final_audit_pipeline import (
     run_final_audit_pipeline,
@@ -135,7 +136,7 @@ async def _toolkit_final_audit(
             if not raw_yaml:
                 continue
             try:
-                parsed = yaml.safe_load(raw_yaml)
+                parsed = safe_load_yaml(raw_yaml)
             except yaml.YAMLError:
                 logging.getLogger(__name__).warning(
                     "Failed to parse inferred %s config from session %s",
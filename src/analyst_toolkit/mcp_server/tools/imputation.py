@@ -18,6 +18,7 @@ from analyst_toolkit.mcp_server.io import (
     coerce_config,
     compact_destination_metadata,
     deliver_artifact,
+    deliver_report_artifacts,
     empty_delivery_state,
     fold_status_with_artifacts,
     generate_default_export_path,
@@ -86,13 +87,15 @@ async def _toolkit_imputation(
     base_cfg = config.get("imputation", config)
     plotting_requested = bool(config.get("plotting", {}).get("run", True))
 
+    html_requested = should_export_html(config)
+
     # Build module config for the pipeline runner
     module_cfg = {
         "imputation": {
             **base_cfg,
             "logging": "off",
             "settings": {
-                "export": {"run": True, "export_html": should_export_html(config)},
+                "export": {"run": True, "export_html": html_requested},
                 "plotting": {"run": plotting_requested},
             },
         }
@@ -159,7 +162,6 @@ async def _toolkit_imputation(
     artifact_warnings: list = []
 
     # Only expect report artifacts when imputation actually filled nulls
-    html_requested = should_export_html(config)
     expect_reports = html_requested and nulls_filled > 0
     runtime_artifacts = runtime_cfg.get("artifacts", {}) if isinstance(runtime_cfg, dict) else {}
     if runtime_artifacts.get("export_html") is True and not expect_reports:
@@ -174,48 +176,27 @@ async def _toolkit_imputation(
         )
 
     if expect_reports:
-        artifact_path = f"exports/reports/imputation/{run_id}_imputation_report.html"
-        artifact_delivery = deliver_artifact(
-            artifact_path,
+        # Upload plots - search both root and run_id subdir
+        plot_dirs = [Path("exports/plots/imputation"), Path(f"exports/plots/imputation/{run_id}")]
+        artifact_delivery, xlsx_delivery, plot_delivery = deliver_report_artifacts(
             run_id,
             "imputation",
+            html_path=f"exports/reports/imputation/{run_id}_imputation_report.html",
+            xlsx_path=f"exports/reports/imputation/{run_id}_imputation_report.xlsx",
+            plot_dirs=plot_dirs,
+            deliver=deliver_artifact,
             config=kwargs,
             session_id=session_id,
         )
         artifact_path = artifact_delivery["local_path"]
         artifact_url = artifact_delivery["url"]
         artifact_warnings.extend(artifact_delivery["warnings"])
-
-        xlsx_path = f"exports/reports/imputation/{run_id}_imputation_report.xlsx"
-        xlsx_delivery = deliver_artifact(
-            xlsx_path,
-            run_id,
-            "imputation",
-            config=kwargs,
-            session_id=session_id,
-        )
         xlsx_url = xlsx_delivery["url"]
         artifact_warnings.extend(xlsx_delivery["warnings"])
-
-        # Upload plots - search both root and run_id subdir
-        plot_dirs = [
-            Path("exports/plots/imputation"),
-            Path(f"exports/plots/imputation/{run_id}"),
-        ]
-        for plot_dir in plot_dirs:
-            if plot_dir.exists():
-                for plot_file in plot_dir.glob(f"*{run_id}*.png"):
-                    delivered = deliver_artifact(
-                        str(plot_file),
-                        run_id,
-                        "imputation/plots",
-                        config=kwargs,
-                        session_id=session_id,
-                    )
-                    plot_delivery[plot_file.name] = delivered
-                    artifact_warnings.extend(delivered["warnings"])
-                    if delivered["url"]:
-                        plot_urls[plot_file.name] = delivered["url"]
+        for plot_name, delivered in plot_delivery.items():
+            artifact_warnings.extend(delivered["warnings"])
+            if delivered["url"]:
+                plot_urls[plot_name] = delivered["url"]
 
     artifact_contract = build_artifact_contract(
         export_url,
@@ -9,6 +9,7 @@ from typing import Any
 
 import yaml
 
+from analyst_toolkit.m00_utils.config_loader import safe_load_yaml
 from analyst_toolkit.mcp_server.config_normalizers import (
     sanitize_inferred_final_audit_config,
     sanitize_inferred_validation_config,
@@ -105,7 +106,7 @@ def _module_name_from_generated_file(path: Path) -> str | None:
 
 def _module_name_from_generated_yaml(raw_yaml: str) -> str | None:
     try:
-        loaded = yaml.safe_load(raw_yaml) or {}
+        loaded = safe_load_yaml(raw_yaml) or {}
     except yaml.YAMLError:
         return None
     if not isinstance(loaded, dict) or not loaded:
@@ -199,7 +200,7 @@ def _sanitize_generated_yaml(
     temp_input_path: str,
 ) -> str:
     try:
-        loaded = yaml.safe_load(raw_yaml)
+        loaded = safe_load_yaml(raw_yaml)
     except yaml.YAMLError:
         return raw_yaml
     if not isinstance(loaded, dict):
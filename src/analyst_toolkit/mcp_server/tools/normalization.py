@@ -76,6 +76,8 @@ async def _toolkit_normalization(
 
     base_cfg = config.get("normalization", config)
 
+    html_requested = should_export_html(config)
+
     # Build module config for the pipeline runner
     module_cfg = {
         "normalization": {
@@ -83,7 +85,7 @@ async def _toolkit_normalization(
             "logging": "off",
             "settings": {
                 "export": True,
-                "export_html": should_export_html(config),
+                "export_html": html_requested,
             },
         }
     }
@@ -151,7 +153,6 @@ async def _toolkit_normalization(
     artifact_warnings: list = []
 
     # Only expect report artifacts when the pipeline had work to report on
-    html_requested = should_export_html(config)
     expect_reports = html_requested and changes_made > 0
     runtime_artifacts = runtime_cfg.get("artifacts", {}) if isinstance(runtime_cfg, dict) else {}
     if runtime_artifacts.get("export_html") is True and not expect_reports:
@@ -17,6 +17,7 @@ from analyst_toolkit.mcp_server.io import (
     coerce_config,
     compact_destination_metadata,
     deliver_artifact,
+    deliver_report_artifacts,
     empty_delivery_state,
     fold_status_with_artifacts,
     generate_default_export_path,
@@ -83,13 +84,15 @@ async def _toolkit_outliers(
     base_cfg = normalize_outliers_config(config.get("outlier_detection", config))
     plotting_requested = bool(config.get("plotting", {}).get("run", True))
 
+    html_requested = should_export_html(config)
+
     # Build a module config that ensures plotting and export are on
     module_cfg = {
         "outlier_detection": {
             **base_cfg,
             "logging": "off",
             "plotting": {"run": plotting_requested},
-            "export": {"run": True, "export_html": should_export_html(config)},
+            "export": {"run": True, "export_html": html_requested},
         }
     }
 
@@ -152,7 +155,6 @@ async def _toolkit_outliers(
     status_warnings.extend(export_delivery["warnings"])
     artifact_warnings: list = []
     # Only expect report artifacts when outliers were actually detected
-    html_requested = should_export_html(config)
     expect_reports = html_requested and outlier_count > 0
     runtime_artifacts = runtime_cfg.get("artifacts", {}) if isinstance(runtime_cfg, dict) else {}
     plotting_requested_runtime = runtime_artifacts.get("plotting") is True
@@ -169,49 +171,30 @@ async def _toolkit_outliers(
         )
 
     if expect_reports:
-        # Path where the pipeline runner saves its report
-        artifact_path = f"exports/reports/outliers/detection/{run_id}_outlier_report.html"
-        artifact_delivery = deliver_artifact(
-            artifact_path,
+        # Upload plots - search both root and run_id subdir
+        plot_dirs = [
+            Path("exports/plots/outliers/detection"),
+            Path(f"exports/plots/outliers/{run_id}"),
+        ]
+        artifact_delivery, xlsx_delivery, plot_delivery = deliver_report_artifacts(
             run_id,
             "outliers",
+            html_path=f"exports/reports/outliers/detection/{run_id}_outlier_report.html",
+            xlsx_path=f"exports/reports/outliers/detection/{run_id}_outlier_report.xlsx",
+            plot_dirs=plot_dirs,
+            deliver=deliver_artifact,
             config=kwargs,
             session_id=session_id,
         )
         artifact_path = artifact_delivery["local_path"]
         artifact_url = artifact_delivery["url"]
         artifact_warnings.extend(artifact_delivery["warnings"])
-
-        xlsx_path = f"exports/reports/outliers/detection/{run_id}_outlier_report.xlsx"
-        xlsx_delivery = deliver_artifact(
-            xlsx_path,
-            run_id,
-            "outliers",
-            config=kwargs,
-            session_id=session_id,
-        )
         xlsx_url = xlsx_delivery["url"]
         artifact_warnings.extend(xlsx_delivery["warnings"])
-
-        # Upload plots - search both root and run_id subdir
-        plot_dirs = [
-            Path("exports/plots/outliers/detection"),
-            Path(f"exports/plots/outliers/{run_id}"),
-        ]
-        for plot_dir in plot_dirs:
-            if plot_dir.exists():
-                for plot_file in plot_dir.glob(f"*{run_id}*.png"):
-                    delivered = deliver_artifact(
-                        str(plot_file),
-                        run_id,
-                        "outliers/plots",
-                        config=kwargs,
-                        session_id=session_id,
-                    )
-                    plot_delivery[plot_file.name] = delivered
-                    artifact_warnings.extend(delivered["warnings"])
-                    if delivered["url"]:
-                        plot_urls[plot_file.name] = delivered["url"]
+        for plot_name, delivered in plot_delivery.items():
+            artifact_warnings.extend(delivered["warnings"])
+            if delivered["url"]:
+                plot_urls[plot_name] = delivered["url"]
 
     artifact_contract = build_artifact_contract(
         export_url,
@@ -115,6 +115,8 @@ async def _toolkit_validation(
         )
         export_url = export_delivery["reference"]
 
+    html_requested = should_export_html(config)
+
     module_cfg = {
         "validation": {
             **base_cfg,
@@ -122,13 +124,15 @@ async def _toolkit_validation(
             "settings": {
                 **base_cfg.get("settings", {}),
                 "export": True,
-                "export_html": should_export_html(config),
+                "export_html": html_requested,
             },
         }
     }
 
-    # run_validation_pipeline handles export/reporting
-    run_validation_pipeline(config=module_cfg, df=df, notebook=False, run_id=run_id)
+    # run_validation_pipeline handles export/reporting and caches the suite results below
+    run_validation_pipeline(
+        config=module_cfg, df=df, notebook=False, run_id=run_id, cache_results=True
+    )
 
     # Run suite directly to get structured pass/fail results for the MCP response
     schema_cfg = base_cfg.get("schema_validation", {})
@@ -136,7 +140,8 @@ async def _toolkit_validation(
     violations_detail: dict = {}
     checks_run = 0
     if schema_cfg.get("run", False):
-        validation_results = run_validation_suite(df, config=base_cfg)
+        # Same frame and rules the pipeline just validated; reuse its results.
+        validation_results = run_validation_suite(df, config=base_cfg, reuse_cached=True)
         for check_name, check in validation_results.items():
             if isinstance(check, dict) and "passed" in check:
                 checks_run += 1
@@ -160,7 +165,7 @@ async def _toolkit_validation(
     if not has_validation_config:
         advisory_warnings.append(INFER_CONFIG_REQUIRED_WARNING)
     status_warnings.extend(export_delivery["warnings"])
-    if should_export_html(config):
+    if html_requested:
         artifact_path = f"exports/reports/validation/{run_id}_validation_report.html"
         artifact_delivery = deliver_artifact(
             artifact_path,
@@ -191,9 +196,9 @@ async def _toolkit_validation(
         artifact_url=artifact_url,
         xlsx_path=xlsx_delivery["local_path"],
         xlsx_url=xlsx_url,
-        expect_html=should_export_html(config),
-        expect_xlsx=should_export_html(config),
-        required_html=should_export_html(config),
+        expect_html=html_requested,
+        expect_xlsx=html_requested,
+        required_html=html_requested,
         probe_local_paths=True,
     )
     warnings = status_warnings + advisory_warnings + artifact_contract["artifact_warnings"]
@@ -75,7 +75,7 @@ def run_full_pipeline(config_path: str):
         raise ValueError("Master config is missing 'pipeline_entry_path'. Cannot start pipeline.")
 
     logging.info("--- Loading initial data from %s ---", entry_path)
-    df: pd.DataFrame = load_csv(entry_path)
+    df: pd.DataFrame = load_csv(entry_path, engine=master_config.get("csv_engine"))
 
     # Initialize artifact placeholder for outlier detection
     detection_results = {}
@@ -1,13 +1,43 @@
 import pytest
 
+from analyst_toolkit.mcp_server.job_state import JobStore
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+
+if uvloop is not None:
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_asyncio_loop_factories(config, item):
+        """
+        Run async tests on uvloop where it is installed (it ships with uvicorn[standard]
+        on non-Windows platforms); without it pytest-asyncio keeps the stock loop.
+        """
+        return {"uvloop": uvloop.new_event_loop}
+
 
 @pytest.fixture(autouse=True)
-def isolate_test_env(monkeypatch: pytest.MonkeyPatch) -> None:
+def isolate_test_env(
+    request: pytest.FixtureRequest, tmp_path, monkeypatch: pytest.MonkeyPatch
+) -> None:
     """
     Keep tests deterministic by clearing optional report-upload env vars.
     This prevents accidental network/storage behavior from shell-local settings.
+
+    Reports and the job store default to paths under ``exports/reports``, so each
+    test runs from its own ``tmp_path`` with a fresh job store there. Tests that read
+    repo files through relative paths opt out with ``@pytest.mark.repo_cwd``.
     """
     monkeypatch.setenv("ANALYST_MCP_SESSION_BACKEND", "memory")
     monkeypatch.delenv("ANALYST_MCP_SESSION_DB_PATH", raising=False)
     monkeypatch.delenv("ANALYST_REPORT_BUCKET", raising=False)
     monkeypatch.delenv("ANALYST_REPORT_PREFIX", raising=False)
+    monkeypatch.setenv("ANALYST_MCP_JOB_STATE_PATH", str(tmp_path / "jobs" / "job_state.json"))
+    monkeypatch.setattr(JobStore, "_jobs", {})
+    monkeypatch.setattr(JobStore, "_loaded", False)
+    monkeypatch.setattr(JobStore, "_journal_lines", 0)
+    if request.node.get_closest_marker("repo_cwd") is None:
+        monkeypatch.chdir(tmp_path)
@@ -1,15 +1,23 @@
 import pandas as pd
 import pytest
 
+from analyst_toolkit.mcp_server.io import _reset_path_roots_for_tests
+from analyst_toolkit.mcp_server.io_storage import _reset_storage_clients_for_tests
 from analyst_toolkit.mcp_server.state import StateStore
 
 
+def _reset_server_state():
+    StateStore._reset_for_tests()
+    _reset_path_roots_for_tests()
+    _reset_storage_clients_for_tests()
+
+
 @pytest.fixture(autouse=True)
 def clear_state():
-    """Wipe StateStore before and after every test."""
-    StateStore.clear()
+    """Reset StateStore, memoized session path roots, and cached GCS clients around every test."""
+    _reset_server_state()
     yield
-    StateStore.clear()
+    _reset_server_state()
 
 
 @pytest.fixture
@@ -1,3 +1,5 @@
+import asyncio
+import threading
 from pathlib import Path
 
 import pytest
@@ -274,3 +276,50 @@ async def test_auto_heal_preserves_local_dashboard_when_delivery_raises(monkeypa
     assert res["artifact_url"] == ""
     assert "AUTO_HEAL_EXPORT_FAILED" in res["warnings"]
     assert res["artifact_matrix"]["html_report"]["status"] == "available"
+
+
+@pytest.mark.asyncio
+async def test_auto_heal_delivers_dashboard_off_the_event_loop(monkeypatch):
+    import analyst_toolkit.mcp_server.tools.auto_heal as auto_heal_module
+
+    async def fake_infer(*args, **kwargs):
+        return {
+            "status": "pass",
+            "configs": {"normalization": "normalization:\n  rules: {}\n"},
+            "session_id": "sess_unit",
+        }
+
+    async def fake_norm(*args, **kwargs):
+        return {"status": "pass", "session_id": "sess_unit", "summary": {}}
+
+    released = threading.Event()
+
+    def blocking_deliver(local_path, *args, **kwargs):
+        # Only returns promptly if the loop stays free to run release() meanwhile.
+        assert released.wait(timeout=5)
+        return {
+            "reference": local_path,
+            "local_path": local_path,
+            "url": "",
+            "warnings": [],
+            "destinations": {},
+        }
+
+    async def release():
+        await asyncio.sleep(0.05)
+        released.set()
+
+    monkeypatch.setattr(auto_heal_module, "_toolkit_infer_configs", fake_infer)
+    monkeypatch.setattr(auto_heal_module, "_toolkit_normalization", fake_norm)
+    monkeypatch.setattr(auto_heal_module, "export_html_report", lambda *args, **kwargs: "auto.html")
+    monkeypatch.setattr(auto_heal_module, "deliver_artifact", blocking_deliver)
+    monkeypatch.setattr(auto_heal_module, "append_to_run_history", lambda *args, **kwargs: None)
+    monkeypatch.setattr(auto_heal_module, "get_session_metadata", lambda sid: {"row_count": 3})
+
+    res, _ = await asyncio.gather(
+        auto_heal_module._toolkit_auto_heal(session_id="sess_input", run_id="run_auto"),
+        release(),
+    )
+
+    assert res["artifact_path"] == "auto.html"
+    assert "AUTO_HEAL_EXPORT_FAILED" not in res["warnings"]
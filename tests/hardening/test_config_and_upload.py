@@ -1,11 +1,16 @@
 import sys
+import threading
 import types
 
 import pytest
+import yaml
 
+from analyst_toolkit.m00_utils import config_loader
 from analyst_toolkit.mcp_server.io import (
     check_upload,
     coerce_config,
+    deliver_many,
+    deliver_report_artifacts,
     load_input,
     resolve_run_context,
     save_output,
@@ -33,6 +38,22 @@ def test_coerce_config_parses_raw_yaml_string():
     assert result["rules"]["standardize_text_columns"] == ["name"]
 
 
+def test_yaml_parsing_uses_libyaml_loader_when_available():
+    if not hasattr(yaml, "CSafeLoader"):
+        pytest.skip("PyYAML was built without libyaml")
+    assert config_loader._YAML_SAFE_LOADER is yaml.CSafeLoader
+
+
+def test_coerce_config_repeated_yaml_string_returns_independent_dicts():
+    yaml_str = "rules:\n  coerce_dtypes: true\n  standardize_text_columns: [name]\n"
+    first = coerce_config(yaml_str, "normalization")
+    first["rules"]["standardize_text_columns"].append("city")
+    first["rules"]["coerce_dtypes"] = False
+
+    second = coerce_config(yaml_str, "normalization")
+    assert second == {"rules": {"coerce_dtypes": True, "standardize_text_columns": ["name"]}}
+
+
 def test_coerce_config_parses_yaml_string_inside_module_key():
     """Agent passes {module: yaml_string} instead of {module: dict}."""
     yaml_str = "rules:\n  coerce_dtypes: true\n"
@@ -60,19 +81,28 @@ def test_coerce_config_unwraps_double_wrapped():
     assert result["normalization"]["rules"]["coerce_dtypes"] is True
 
 
-def test_check_upload_passes_through_valid_url():
-    warnings: list = []
-    url = check_upload("https://storage.googleapis.com/bucket/path.html", "path.html", warnings)
-    assert url == "https://storage.googleapis.com/bucket/path.html"
-    assert warnings == []
-
-
-def test_check_upload_appends_warning_on_empty_url():
+@pytest.mark.parametrize(
+    ("url", "path", "expected_warnings"),
+    [
+        (
+            "https://storage.googleapis.com/bucket/path.html",
+            "path.html",
+            [],
+        ),
+        (
+            "",
+            "exports/reports/normalization/run1_report.html",
+            ["exports/reports/normalization/run1_report.html"],
+        ),
+    ],
+    ids=["valid_url_passes_through", "empty_url_warns"],
+)
+def test_check_upload(url, path, expected_warnings):
     warnings: list = []
-    url = check_upload("", "exports/reports/normalization/run1_report.html", warnings)
-    assert url == ""
-    assert len(warnings) == 1
-    assert "exports/reports/normalization/run1_report.html" in warnings[0]
+    assert check_upload(url, path, warnings) == url
+    assert len(warnings) == len(expected_warnings)
+    for warning, expected_path in zip(warnings, expected_warnings):
+        assert expected_path in warning
 
 
 def test_check_upload_accumulates_multiple_warnings():
@@ -108,38 +138,40 @@ def test_should_export_html_honors_nested_module_config(monkeypatch):
     assert should_export_html({"normalization": {"settings": {"export_html": ["true"]}}}) is False
 
 
-def _install_fake_google_storage(monkeypatch, calls: list, *, fail_on_existing: bool = False):
-    existing_blobs: set[str] = set()
+@pytest.fixture(scope="session")
+def _fake_storage_modules():
+    """Build the fake ``google.cloud.storage`` module tree once for the session."""
+    state = types.SimpleNamespace(calls=[], existing_blobs=set(), fail_on_existing=False)
 
     class FakeBlob:
         def __init__(self, name: str):
             self.name = name
 
         def upload_from_filename(self, filename: str, content_type: str | None = None):
-            calls.append(("upload", self.name, content_type, filename))
-            if fail_on_existing and self.name in existing_blobs:
+            state.calls.append(("upload", self.name, content_type, filename))
+            if state.fail_on_existing and self.name in state.existing_blobs:
                 raise FileExistsError(f"blob already exists: {self.name}")
-            existing_blobs.add(self.name)
+            state.existing_blobs.add(self.name)
 
         def exists(self):
-            calls.append(("exists", self.name))
-            return self.name in existing_blobs
+            state.calls.append(("exists", self.name))
+            return self.name in state.existing_blobs
 
     class FakeBucket:
         def __init__(self, name: str):
             self.name = name
 
         def blob(self, blob_name: str):
-            calls.append(("blob", self.name, blob_name))
+            state.calls.append(("blob", self.name, blob_name))
             return FakeBlob(blob_name)
 
         def get_blob(self, blob_name: str):
-            calls.append(("get_blob", self.name, blob_name))
-            return FakeBlob(blob_name) if blob_name in existing_blobs else None
+            state.calls.append(("get_blob", self.name, blob_name))
+            return FakeBlob(blob_name) if blob_name in state.existing_blobs else None
 
     class FakeClient:
         def bucket(self, bucket_name: str):
-            calls.append(("bucket", bucket_name))
+            state.calls.append(("bucket", bucket_name))
             return FakeBucket(bucket_name)
 
     storage_mod = types.ModuleType("google.cloud.storage")
@@ -151,14 +183,24 @@ def _install_fake_google_storage(monkeypatch, calls: list, *, fail_on_existing:
     google_mod = types.ModuleType("google")
     setattr(google_mod, "cloud", cloud_mod)
 
-    monkeypatch.setitem(sys.modules, "google", google_mod)
-    monkeypatch.setitem(sys.modules, "google.cloud", cloud_mod)
-    monkeypatch.setitem(sys.modules, "google.cloud.storage", storage_mod)
+    modules = {"google": google_mod, "google.cloud": cloud_mod, "google.cloud.storage": storage_mod}
+    return state, modules
+
+
+@pytest.fixture
+def fake_google_storage(monkeypatch, _fake_storage_modules):
+    """Install the shared fake GCS modules for one test with fresh call and blob state."""
+    state, modules = _fake_storage_modules
+    state.calls.clear()
+    state.existing_blobs.clear()
+    state.fail_on_existing = False
+    for name, module in modules.items():
+        monkeypatch.setitem(sys.modules, name, module)
+    return state
 
 
-def test_save_output_gcs_uses_storage_upload(sample_df, monkeypatch):
-    calls: list = []
-    _install_fake_google_storage(monkeypatch, calls)
+def test_save_output_gcs_uses_storage_upload(sample_df, fake_google_storage):
+    calls = fake_google_storage.calls
 
     path = "gs://example-bucket/runs/run_1/imputation_output.csv"
     out = save_output(sample_df, path)
@@ -172,9 +214,9 @@ def test_save_output_gcs_uses_storage_upload(sample_df, monkeypatch):
     assert uploads[0][2] == "text/csv"
 
 
-def test_save_output_gcs_is_idempotent_for_same_path(sample_df, monkeypatch):
-    calls: list = []
-    _install_fake_google_storage(monkeypatch, calls, fail_on_existing=True)
+def test_save_output_gcs_is_idempotent_for_same_path(sample_df, fake_google_storage):
+    calls = fake_google_storage.calls
+    fake_google_storage.fail_on_existing = True
 
     path = "gs://example-bucket/runs/shared_run/imputation_output.csv"
     out_one = save_output(sample_df, path)
@@ -377,3 +419,66 @@ def test_blob_exists_propagates_lookup_errors():
 
     with pytest.raises(PermissionError):
         _blob_exists(BrokenBucket(), "reports/run/report.html")
+
+
+def test_storage_client_is_reused_across_uploads(sample_df, monkeypatch, fake_google_storage):
+    calls = fake_google_storage.calls
+    storage_mod = sys.modules["google.cloud.storage"]
+    constructed: list = []
+
+    class CountingClient(storage_mod.Client):
+        def __init__(self):
+            constructed.append(self)
+
+    monkeypatch.setattr(storage_mod, "Client", CountingClient)
+
+    save_output(sample_df, "gs://example-bucket/runs/run_1/a.csv")
+    save_output(sample_df, "gs://example-bucket/runs/run_1/b.csv")
+
+    assert len(constructed) == 1
+    assert len([c for c in calls if c[0] == "upload"]) == 2
+
+
+def test_deliver_many_overlaps_deliveries_and_keeps_order():
+    barrier = threading.Barrier(3, timeout=5)
+
+    def deliver(path):
+        # Every call waits for the others, so this only completes when they overlap.
+        barrier.wait()
+        return {"local_path": path}
+
+    out = deliver_many(deliver, ["a.png", "b.png", "c.png"])
+
+    assert [item["local_path"] for item in out] == ["a.png", "b.png", "c.png"]
+
+
+def test_deliver_report_artifacts_routes_reports_and_plots(tmp_path):
+    plot_dir = tmp_path / "plots"
+    plot_dir.mkdir()
+    (plot_dir / "hist_run_7.png").write_bytes(b"png")
+    (plot_dir / "hist_other.png").write_bytes(b"png")
+    calls = []
+
+    def deliver(local_path, run_id, module, config=None, session_id=None):
+        calls.append((local_path, run_id, module, session_id))
+        return {"local_path": local_path, "url": "", "warnings": []}
+
+    html, xlsx, plots = deliver_report_artifacts(
+        "run_7",
+        "imputation",
+        html_path="r.html",
+        xlsx_path="r.xlsx",
+        plot_dirs=[plot_dir, tmp_path / "missing"],
+        deliver=deliver,
+        session_id="sess_7",
+    )
+
+    assert (html["local_path"], xlsx["local_path"]) == ("r.html", "r.xlsx")
+    assert list(plots) == ["hist_run_7.png"]
+    assert sorted(calls) == sorted(
+        [
+            ("r.html", "run_7", "imputation", "sess_7"),
+            ("r.xlsx", "run_7", "imputation", "sess_7"),
+            (str(plot_dir / "hist_run_7.png"), "run_7", "imputation/plots", "sess_7"),
+        ]
+    )
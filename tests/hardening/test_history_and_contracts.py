@@ -1,8 +1,14 @@
+import json
 import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 
 import pandas as pd
+import pytest
 
 import analyst_toolkit.mcp_server.io as io_module
+import analyst_toolkit.mcp_server.io_history_files as history_files
 from analyst_toolkit.mcp_server.io import (
     _resolve_path_root,
     append_to_run_history,
@@ -22,6 +28,27 @@ def test_resolve_path_root_includes_session_and_run(sample_df):
     assert parts[2] == "run_alpha"
 
 
+def test_resolve_path_root_looks_up_session_start_once(sample_df, monkeypatch):
+    sid = StateStore.save(sample_df, run_id="run_memo")
+    lookups = []
+    get_start = io_module.get_session_start
+
+    def counting_get_start(session_id):
+        lookups.append(session_id)
+        return get_start(session_id)
+
+    monkeypatch.setattr(io_module, "get_session_start", counting_get_start)
+
+    first = _resolve_path_root("run_memo", session_id=sid)
+    assert _resolve_path_root("run_memo", session_id=sid) == first
+    assert lookups == [sid]
+
+    # Unknown sessions fall back to the current time and are not memoized.
+    _resolve_path_root("run_memo", session_id="sess_missing")
+    _resolve_path_root("run_memo", session_id="sess_missing")
+    assert lookups == [sid, "sess_missing", "sess_missing"]
+
+
 def test_get_run_history_isolation_by_session(sample_df, tmp_path, monkeypatch):
     monkeypatch.chdir(tmp_path)
 
@@ -65,11 +92,8 @@ def test_append_to_run_history_is_thread_safe(sample_df, tmp_path, monkeypatch):
             with error_lock:
                 errors.append(exc)
 
-    threads = [threading.Thread(target=worker, args=(i,)) for i in range(total)]
-    for t in threads:
-        t.start()
-    for t in threads:
-        t.join()
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(worker, range(total)))
 
     assert not errors
     history = get_run_history(run_id, session_id=session_id)
@@ -77,6 +101,47 @@ def test_append_to_run_history_is_thread_safe(sample_df, tmp_path, monkeypatch):
     assert {entry["module"] for entry in history} == {f"m{i}" for i in range(total)}
 
 
+def test_append_to_run_history_writes_queued_entries_in_one_batch(sample_df, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+
+    run_id = "run_batched_history"
+    session_id = StateStore.save(sample_df, run_id=run_id)
+    append_to_run_history(run_id, {"module": "m0"}, session_id=session_id)
+    history_file = (
+        Path("exports/reports/history")
+        / _resolve_path_root(run_id, session_id)
+        / f"{run_id}_history.json"
+    )
+    key = str(history_file.resolve())
+    batches = []
+    append_entries = io_module._append_json_array_entries
+
+    def recording_append(path, entries):
+        batches.append(len(entries))
+        return append_entries(path, entries)
+
+    monkeypatch.setattr(io_module, "_append_json_array_entries", recording_append)
+    queued = 5
+    with ThreadPoolExecutor(max_workers=queued) as pool:
+        # Hold the file lock so every append queues behind it.
+        with io_module._history_lock(history_file):
+            futures = [
+                pool.submit(append_to_run_history, run_id, {"module": f"m{i}"}, session_id)
+                for i in range(1, queued + 1)
+            ]
+            deadline = time.monotonic() + 5
+            while len(io_module._PENDING_HISTORY.get(key, [])) < queued:
+                assert time.monotonic() < deadline
+                time.sleep(0.001)
+        for future in futures:
+            future.result()
+
+    assert batches == [queued]
+    history = get_run_history(run_id, session_id=session_id)
+    assert [entry["module"] for entry in history][0] == "m0"
+    assert {entry["module"] for entry in history} == {f"m{i}" for i in range(queued + 1)}
+
+
 def test_append_to_run_history_serializes_dataframe_details(sample_df, tmp_path, monkeypatch):
     monkeypatch.chdir(tmp_path)
 
@@ -124,6 +189,80 @@ def test_get_run_history_recovers_from_corrupt_json(sample_df, tmp_path, monkeyp
     assert meta["skipped_records"] > 0
 
 
+def test_append_to_run_history_appends_in_place_with_identical_layout(
+    sample_df, tmp_path, monkeypatch
+):
+    monkeypatch.chdir(tmp_path)
+
+    run_id = "run_inplace_history"
+    session_id = StateStore.save(sample_df, run_id=run_id)
+    reads = []
+    read_history = io_module._read_history_file_safe
+
+    def counting_read(path):
+        reads.append(path)
+        return read_history(path)
+
+    monkeypatch.setattr(io_module, "_read_history_file_safe", counting_read)
+    for i in range(3):
+        append_to_run_history(run_id, {"module": f"m{i}"}, session_id=session_id)
+
+    # The first append creates the file directly; none of them parse or rewrite it.
+    assert reads == []
+
+    history_file = (
+        tmp_path
+        / "exports/reports/history"
+        / _resolve_path_root(run_id, session_id)
+        / f"{run_id}_history.json"
+    )
+    history = json.loads(history_file.read_text(encoding="utf-8"))
+    assert [entry["module"] for entry in history] == ["m0", "m1", "m2"]
+    assert history_file.read_text(encoding="utf-8") == json.dumps(history, indent=2)
+
+
+def _history_writer(name):
+    """The orjson handle io_history_files should use for the named writer."""
+    if name == "orjson":
+        return pytest.importorskip("orjson")
+    return None
+
+
+@pytest.mark.parametrize("creator", ["json", "orjson"])
+@pytest.mark.parametrize("appender", ["json", "orjson"])
+def test_history_writers_produce_the_same_layout(tmp_path, monkeypatch, creator, appender):
+    history_file = tmp_path / "history.json"
+    first = [{"module": "m0", "summary": {"rows": 3, "ratio": 0.5, "tags": []}, "note": None}]
+    more = [{"module": "m1", "details": {}}, {"module": "m2", "warnings": ["a", "b"]}]
+
+    monkeypatch.setattr(history_files, "orjson", _history_writer(creator))
+    assert history_files.create_json_file(history_file, first)
+    monkeypatch.setattr(history_files, "orjson", _history_writer(appender))
+    assert history_files.append_json_array_entries(history_file, more)
+
+    assert history_file.read_text(encoding="utf-8") == json.dumps(first + more, indent=2)
+
+    # Non-ASCII text differs only in escaping: orjson writes raw UTF-8.
+    history_files.write_json_atomic(history_file, [{"module": "café"}])
+    assert json.loads(history_file.read_text(encoding="utf-8")) == [{"module": "café"}]
+
+
+def test_append_to_run_history_rewrites_damaged_file(sample_df, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+
+    run_id = "run_damaged_history"
+    session_id = StateStore.save(sample_df, run_id=run_id)
+    history_dir = tmp_path / "exports/reports/history" / _resolve_path_root(run_id, session_id)
+    history_dir.mkdir(parents=True, exist_ok=True)
+    history_file = history_dir / f"{run_id}_history.json"
+    history_file.write_text('[\n  {"module": "m0"},\n  {"modu', encoding="utf-8")
+
+    append_to_run_history(run_id, {"module": "m1"}, session_id=session_id)
+
+    history = json.loads(history_file.read_text(encoding="utf-8"))
+    assert [entry["module"] for entry in history] == ["m0", "m1"]
+
+
 def test_build_artifact_contract_warns_for_server_local_export(tmp_path, monkeypatch):
     local_export = tmp_path / "output.csv"
     local_export.write_text("a\n1\n", encoding="utf-8")
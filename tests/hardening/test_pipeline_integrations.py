@@ -3,12 +3,18 @@ import inspect
 import sys
 
 import pandas as pd
+import pytest
+
+from analyst_toolkit.m01_diagnostics.data_diag import run_data_profile
+from analyst_toolkit.m02_validation.validate_data import run_validation_suite
+from analyst_toolkit.m03_normalization.normalize_data import apply_normalization
+from analyst_toolkit.m07_imputation.impute_data import apply_imputation
+from analyst_toolkit.m07_imputation.run_imputation_pipeline import run_imputation_pipeline
+from analyst_toolkit.m10_final_audit.final_audit_producer import _apply_final_edits
 
 
 def test_normalization_changes_made_rename():
     """apply_normalization changelog counts renamed columns correctly."""
-    from analyst_toolkit.m03_normalization.normalize_data import apply_normalization
-
     df = pd.DataFrame({"old_name": [1, 2], "b": [3, 4]})
     config = {"rules": {"rename_columns": {"old_name": "new_name"}}}
     _, df_norm, changelog = apply_normalization(df, config)
@@ -20,8 +26,6 @@ def test_normalization_changes_made_rename():
 
 def test_normalization_changes_made_text_standardize():
     """apply_normalization changelog counts standardized text columns correctly."""
-    from analyst_toolkit.m03_normalization.normalize_data import apply_normalization
-
     df = pd.DataFrame({"name": ["  Alice  ", "BOB"]})
     config = {"rules": {"standardize_text_columns": ["name"]}}
     _, df_norm, changelog = apply_normalization(df, config)
@@ -31,20 +35,55 @@ def test_normalization_changes_made_text_standardize():
     assert len(changelog["strings_cleaned"]) == 1
 
 
+def test_normalization_text_standardize_preserves_non_string_cells():
+    df = pd.DataFrame(
+        {
+            "mixed": ["  Alice  ", 7, None, float("nan")],
+            "typed": pd.Series([" Bob", None, "EVE ", "x"], dtype="string"),
+            "count": [1, 2, 3, 4],
+            "tier": pd.Series(["Gold ", "gold", None, "SILVER"], dtype="category"),
+            "grade": pd.Series([" B", "A", "A", None], dtype="category"),
+        }
+    )
+    columns = ["mixed", "typed", "count", "tier", "grade"]
+    config = {"rules": {"standardize_text_columns": columns}}
+    _, df_norm, _ = apply_normalization(df, config)
+
+    assert df_norm["mixed"].iloc[:2].tolist() == ["alice", 7]
+    assert df_norm["mixed"].iloc[2] is None
+    assert pd.isna(df_norm["mixed"].iloc[3])
+    assert df_norm["typed"].dtype == "string"
+    assert df_norm["typed"].tolist() == ["bob", pd.NA, "eve", "x"]
+    pd.testing.assert_series_equal(df_norm["count"], df["count"])
+    assert isinstance(df_norm["tier"].dtype, pd.CategoricalDtype)
+    assert df_norm["tier"].tolist()[:2] == ["gold", "gold"]
+    assert pd.isna(df_norm["tier"].iloc[2]) and df_norm["tier"].iloc[3] == "silver"
+    assert sorted(df_norm["tier"].cat.categories) == ["gold", "silver"]
+    assert isinstance(df_norm["grade"].dtype, pd.CategoricalDtype)
+    assert df_norm["grade"].tolist()[:3] == ["b", "a", "a"]
+
+
 def test_normalization_no_rules_returns_unchanged():
     """Empty rules -> changelog is empty, df unchanged."""
-    from analyst_toolkit.m03_normalization.normalize_data import apply_normalization
-
     df = pd.DataFrame({"a": [1, 2], "b": ["x", "y"]})
     _, df_norm, changelog = apply_normalization(df, {"rules": {}})
 
-    pd.testing.assert_frame_equal(df, df_norm)
+    assert df_norm is df
     assert changelog == {}
 
 
-def test_normalization_value_mapping_does_not_mutate_config():
-    from analyst_toolkit.m03_normalization.normalize_data import apply_normalization
+def test_normalization_non_mapping_rules_fail_safe(caplog):
+    """Malformed rules are logged and skipped rather than raised."""
+    df = pd.DataFrame({"a": [1, 2]})
+
+    _, df_norm, changelog = apply_normalization(df, {"rules": ["rename_columns"]})
 
+    assert df_norm is df
+    assert changelog == {}
+    assert "must be a mapping" in caplog.text
+
+
+def test_normalization_value_mapping_does_not_mutate_config():
     df = pd.DataFrame({"status": ["ok", None]})
     config = {"rules": {"value_mappings": {"status": {"null": "UNKNOWN", "ok": "OK"}}}}
 
@@ -55,18 +94,14 @@ def test_normalization_value_mapping_does_not_mutate_config():
 
 def test_imputation_empty_strategies_returns_unchanged():
     """Empty strategy map should be treated as no-op, not an error."""
-    from analyst_toolkit.m07_imputation.run_imputation_pipeline import run_imputation_pipeline
-
     df = pd.DataFrame({"a": [1, None], "b": ["x", "y"]})
     cfg = {"imputation": {"rules": {"strategies": {}}, "settings": {"plotting": {"run": False}}}}
 
     out = run_imputation_pipeline(config=cfg, df=df, notebook=False, run_id="run_imp_empty")
-    pd.testing.assert_frame_equal(out, df)
+    assert out is df
 
 
 def test_imputation_mode_all_nan_column_is_noop():
-    from analyst_toolkit.m07_imputation.impute_data import apply_imputation
-
     df = pd.DataFrame({"score": [None, None, None]})
 
     out, changelog = apply_imputation(df, {"rules": {"strategies": {"score": "mode"}}})
@@ -75,87 +110,62 @@ def test_imputation_mode_all_nan_column_is_noop():
     assert changelog.empty
 
 
-def test_validation_suite_passes_with_correct_schema():
-    """run_validation_suite returns passed=True when schema matches."""
-    from analyst_toolkit.m02_validation.validate_data import run_validation_suite
-
-    df = pd.DataFrame({"a": [1, 2], "b": ["x", "y"]})
-    config = {
-        "schema_validation": {
-            "rules": {
-                "expected_columns": ["a", "b"],
-                "expected_types": {},
-                "categorical_values": {},
-                "numeric_ranges": {},
-            }
-        }
+def _schema_config(**rules) -> dict:
+    """Schema-validation config with every rule family empty unless overridden."""
+    base = {
+        "expected_columns": [],
+        "expected_types": {},
+        "categorical_values": {},
+        "numeric_ranges": {},
     }
-    results = run_validation_suite(df, config)
+    return {"schema_validation": {"rules": {**base, **rules}}}
+
+
+# run_validation_suite only reads its input, so each frame is built once per module.
+@pytest.fixture(scope="module")
+def tiny_ab_df():
+    return pd.DataFrame({"a": [1, 2], "b": ["x", "y"]})
+
+
+@pytest.fixture(scope="module")
+def tiny_score_df():
+    return pd.DataFrame({"score": ["high", "low"]})
+
+
+@pytest.fixture(scope="module")
+def tiny_color_df():
+    return pd.DataFrame({"color": ["red", "blue", "purple"]})
+
+
+def test_validation_suite_passes_with_correct_schema(tiny_ab_df):
+    """run_validation_suite returns passed=True when schema matches."""
+    results = run_validation_suite(tiny_ab_df, _schema_config(expected_columns=["a", "b"]))
     assert results["schema_conformity"]["passed"] is True
 
 
-def test_validation_suite_fails_missing_columns():
+def test_validation_suite_fails_missing_columns(tiny_ab_df):
     """run_validation_suite detects missing columns and marks schema_conformity failed."""
-    from analyst_toolkit.m02_validation.validate_data import run_validation_suite
-
-    df = pd.DataFrame({"a": [1, 2]})
-    config = {
-        "schema_validation": {
-            "rules": {
-                "expected_columns": ["a", "b"],
-                "expected_types": {},
-                "categorical_values": {},
-                "numeric_ranges": {},
-            }
-        }
-    }
-    results = run_validation_suite(df, config)
+    config = _schema_config(expected_columns=["a", "b"])
+    results = run_validation_suite(tiny_ab_df[["a"]], config)
     assert results["schema_conformity"]["passed"] is False
     assert "b" in results["schema_conformity"]["details"]["missing_columns"]
 
 
-def test_validation_suite_fails_dtype_mismatch():
+def test_validation_suite_fails_dtype_mismatch(tiny_score_df):
     """run_validation_suite detects dtype mismatches."""
-    from analyst_toolkit.m02_validation.validate_data import run_validation_suite
-
-    df = pd.DataFrame({"score": ["high", "low"]})
-    config = {
-        "schema_validation": {
-            "rules": {
-                "expected_columns": [],
-                "expected_types": {"score": "int64"},
-                "categorical_values": {},
-                "numeric_ranges": {},
-            }
-        }
-    }
-    results = run_validation_suite(df, config)
+    results = run_validation_suite(tiny_score_df, _schema_config(expected_types={"score": "int64"}))
     assert results["dtype_enforcement"]["passed"] is False
     assert "score" in results["dtype_enforcement"]["details"]
 
 
-def test_validation_suite_fails_categorical_violation():
+def test_validation_suite_fails_categorical_violation(tiny_color_df):
     """run_validation_suite detects values outside allowed set."""
-    from analyst_toolkit.m02_validation.validate_data import run_validation_suite
-
-    df = pd.DataFrame({"color": ["red", "blue", "purple"]})
-    config = {
-        "schema_validation": {
-            "rules": {
-                "expected_columns": [],
-                "expected_types": {},
-                "categorical_values": {"color": ["red", "blue"]},
-                "numeric_ranges": {},
-            }
-        }
-    }
-    results = run_validation_suite(df, config)
+    config = _schema_config(categorical_values={"color": ["red", "blue"]})
+    results = run_validation_suite(tiny_color_df, config)
     assert results["categorical_values"]["passed"] is False
 
 
 def test_run_data_profile_uses_none_default_config():
-    from analyst_toolkit.m01_diagnostics.data_diag import run_data_profile
-
     default = inspect.signature(run_data_profile).parameters["config"].default
 
     assert default is None
@@ -204,8 +214,6 @@ def test_run_diag_pipeline_does_not_import_plotting_stack_when_disabled(monkeypa
 
 
 def test_apply_final_edits_handles_dtype_coercion_failures():
-    from analyst_toolkit.m10_final_audit.final_audit_producer import _apply_final_edits
-
     df = pd.DataFrame({"score": ["bad", "2"], "flag": ["1", "0"]})
 
     out, changelog = _apply_final_edits(
@@ -219,8 +227,6 @@ def test_apply_final_edits_handles_dtype_coercion_failures():
 
 
 def test_apply_final_edits_logs_dtype_coercion_failures(caplog):
-    from analyst_toolkit.m10_final_audit.final_audit_producer import _apply_final_edits
-
     df = pd.DataFrame({"score": ["bad"]})
 
     with caplog.at_level("WARNING"):
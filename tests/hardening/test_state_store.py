@@ -1,11 +1,16 @@
+import sqlite3
 import threading
-import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+import pandas as pd
 import pytest
 
+import analyst_toolkit.mcp_server.state as state_module
 from analyst_toolkit.mcp_server.state import StateStore
 
+pytestmark = pytest.mark.xdist_group(name="state_store")
+
 
 def _configure_sqlite_state_env(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> Path:
     state_home = tmp_path / "state_home"
@@ -16,12 +21,22 @@ def _configure_sqlite_state_env(monkeypatch: pytest.MonkeyPatch, tmp_path: Path)
     return db_path
 
 
+@pytest.fixture(scope="module")
+def thread_pool():
+    with ThreadPoolExecutor(max_workers=20) as executor:
+        yield executor
+
+
+@pytest.fixture
+def saved_sid(sample_df):
+    """A session id for tests that only need an existing in-memory session."""
+    return StateStore.save(sample_df)
+
+
 def test_save_and_get(sample_df):
     sid = StateStore.save(sample_df)
     assert sid.startswith("sess_")
     result = StateStore.get(sid)
-    import pandas as pd
-
     pd.testing.assert_frame_equal(result, sample_df)
 
 
@@ -34,10 +49,9 @@ def test_save_preserves_run_id(sample_df):
     assert StateStore.get_run_id(sid) == "run_abc"
 
 
-def test_clear_single_session(sample_df):
-    sid = StateStore.save(sample_df)
-    StateStore.clear(sid)
-    assert StateStore.get(sid) is None
+def test_clear_single_session(saved_sid):
+    StateStore.clear(saved_sid)
+    assert StateStore.get(saved_sid) is None
 
 
 def test_clear_all(sample_df):
@@ -48,83 +62,89 @@ def test_clear_all(sample_df):
     assert StateStore.get(sid2) is None
 
 
-def test_concurrent_saves_are_thread_safe(sample_df):
+def test_reset_for_tests_drops_every_session(sample_df):
+    sid = StateStore.save(sample_df, run_id="run_reset")
+    StateStore._reset_for_tests()
+    assert StateStore.get(sid) is None
+    assert StateStore.get_run_id(sid) is None
+    assert StateStore.list_sessions() == {}
+
+
+@pytest.mark.parametrize("workers", [8, 20])
+def test_concurrent_saves_are_thread_safe(thread_pool, workers):
     """Concurrent saves must not corrupt the store or raise exceptions."""
-    ids = []
-    errors = []
-    lock = threading.Lock()
-
-    def worker(i):
-        try:
-            import pandas as pd
-
-            df = pd.DataFrame({"col": [i]})
-            sid = StateStore.save(df, run_id=f"run_{i}")
-            with lock:
-                ids.append(sid)
-        except Exception as e:
-            with lock:
-                errors.append(e)
-
-    threads = [threading.Thread(target=worker, args=(i,)) for i in range(20)]
-    for t in threads:
-        t.start()
-    for t in threads:
-        t.join()
-
-    assert not errors, f"Errors during concurrent saves: {errors}"
-    assert len(ids) == 20
-    for sid in ids:
-        assert StateStore.get(sid) is not None
-
-
-def test_concurrent_reads_are_safe(sample_df):
+    frames = [pd.DataFrame({"col": [i]}) for i in range(workers)]
+    # Every worker blocks on the barrier, so the saves start together rather than staggered.
+    start = threading.Barrier(workers, timeout=5)
+
+    def save(i):
+        start.wait()
+        return StateStore.save(frames[i], run_id=f"run_{i}")
+
+    # list() re-raises the first worker exception, failing the test with its traceback.
+    ids = list(thread_pool.map(save, range(workers)))
+
+    assert len(set(ids)) == workers
+    for i, sid in enumerate(ids):
+        assert StateStore.get(sid).iloc[0]["col"] == i
+        assert StateStore.get_metadata(sid)["row_count"] == 1
+
+
+@pytest.mark.parametrize("workers", [8, 20])
+def test_concurrent_reads_are_safe(saved_sid, thread_pool, workers):
     """Concurrent reads on the same session should not raise."""
-    sid = StateStore.save(sample_df)
-    errors = []
-    lock = threading.Lock()
+    start = threading.Barrier(workers, timeout=5)
 
-    def reader():
-        try:
-            StateStore.get(sid)
-        except Exception as e:
-            with lock:
-                errors.append(e)
+    def read():
+        start.wait()
+        return StateStore.get(saved_sid)
 
-    threads = [threading.Thread(target=reader) for _ in range(20)]
-    for t in threads:
-        t.start()
-    for t in threads:
-        t.join()
+    futures = [thread_pool.submit(read) for _ in range(workers)]
 
-    assert not errors
+    assert all(future.result() is not None for future in futures)
 
 
 def test_ttl_eviction_removes_expired_sessions(sample_df, monkeypatch):
     """Sessions accessed longer ago than SESSION_TTL_SECONDS are evicted on next save."""
-    import analyst_toolkit.mcp_server.state as state_module
-
     monkeypatch.setattr(state_module, "SESSION_TTL_SECONDS", 1)
+    monkeypatch.setattr(state_module, "_clock", lambda: 10_000.0)
 
     sid = StateStore.save(sample_df)
     assert StateStore.get(sid) is not None
 
-    StateStore.backdate_session_for_test(sid, time.time() - 2)
-
+    monkeypatch.setattr(state_module, "_clock", lambda: 10_002.0)
     StateStore.save(sample_df)
 
     assert StateStore.get(sid) is None
 
 
-def test_non_expired_session_survives_cleanup(sample_df, monkeypatch):
-    """Sessions within TTL are NOT evicted."""
-    import analyst_toolkit.mcp_server.state as state_module
+def test_capacity_eviction_drops_least_recently_accessed_session(sample_df, monkeypatch):
+    monkeypatch.setattr(state_module, "SESSION_MAX_ENTRIES", 2)
+    ticks = iter(range(10_000, 10_100))
+    monkeypatch.setattr(state_module, "_clock", lambda: float(next(ticks)))
+
+    first = StateStore.save(sample_df)
+    second = StateStore.save(sample_df)
+    StateStore.get(first)
+    third = StateStore.save(sample_df)
+
+    assert set(StateStore.list_sessions()) == {first, third}
+    assert StateStore.get(second) is None
+
+
+def test_repeated_reads_keep_access_heap_bounded(saved_sid):
+    for _ in range(500):
+        StateStore.get(saved_sid)
 
+    assert len(StateStore._access_heap) <= 4 * len(StateStore._last_accessed) + 64
+
+
+def test_non_expired_session_survives_cleanup(saved_sid, monkeypatch):
+    """Sessions within TTL are NOT evicted."""
     monkeypatch.setattr(state_module, "SESSION_TTL_SECONDS", 60)
 
-    sid = StateStore.save(sample_df)
     StateStore.cleanup()
-    assert StateStore.get(sid) is not None
+    assert StateStore.get(saved_sid) is not None
 
 
 def test_sqlite_backend_save_and_get(sample_df, tmp_path, monkeypatch):
@@ -136,10 +156,10 @@ def test_sqlite_backend_save_and_get(sample_df, tmp_path, monkeypatch):
     assert StateStore.policy()["durable"] is True
     result = StateStore.get(sid)
 
-    import pandas as pd
-
     pd.testing.assert_frame_equal(result, sample_df)
     assert StateStore.get_run_id(sid) == "sqlite_run"
+    assert len(StateStore.get_session_start(sid)) == len("YYYYmmdd_HHMMSS")
+    assert StateStore.get_session_start("sess_missing") is None
     assert db_path.stat().st_mode & 0o777 == 0o600
     assert db_path.parent.stat().st_mode & 0o777 == 0o700
 
@@ -155,6 +175,8 @@ def test_sqlite_backend_persists_configs_and_fork(sample_df, tmp_path, monkeypat
     assert forked is not None
     assert StateStore.get_run_id(forked) == "forked_sqlite_run"
     assert StateStore.get_config(forked, "validation") == StateStore.get_config(sid, "validation")
+    pd.testing.assert_frame_equal(StateStore.get(forked), sample_df)
+    assert StateStore.get_metadata(forked)["row_count"] == len(sample_df)
 
 
 def test_sqlite_backend_rebind_and_clear(sample_df, tmp_path, monkeypatch):
@@ -170,77 +192,64 @@ def test_sqlite_backend_rebind_and_clear(sample_df, tmp_path, monkeypatch):
 
 
 def test_sqlite_backend_ttl_cleanup(sample_df, tmp_path, monkeypatch):
-    import analyst_toolkit.mcp_server.state as state_module
-
     _configure_sqlite_state_env(monkeypatch, tmp_path)
     monkeypatch.setattr(state_module, "SESSION_TTL_SECONDS", 1)
+    monkeypatch.setattr(state_module, "_clock", lambda: 10_000.0)
 
     sid = StateStore.save(sample_df, run_id="sqlite_run")
-    StateStore.backdate_session_for_test(sid, time.time() - 2)
 
+    monkeypatch.setattr(state_module, "_clock", lambda: 10_002.0)
     StateStore.cleanup()
     assert StateStore.get(sid) is None
 
 
-def test_sqlite_concurrent_saves_are_thread_safe(tmp_path, monkeypatch):
+def test_sqlite_parquet_codec_runs_outside_store_lock(sample_df, tmp_path, monkeypatch):
     _configure_sqlite_state_env(monkeypatch, tmp_path)
-    saved = []
-    errors = []
-    lock = threading.Lock()
-
-    def worker(i):
-        try:
-            import pandas as pd
-
-            df = pd.DataFrame({"col": [i]})
-            sid = StateStore.save(df, run_id=f"run_{i}")
-            with lock:
-                saved.append((sid, i))
-        except Exception as e:
-            with lock:
-                errors.append(e)
-
-    threads = [threading.Thread(target=worker, args=(i,)) for i in range(20)]
-    for thread in threads:
-        thread.start()
-    for thread in threads:
-        thread.join()
-
-    assert not errors, f"Errors during concurrent sqlite saves: {errors}"
-    assert len(saved) == 20
-    assert len({sid for sid, _ in saved}) == 20
-    for sid, i in saved:
+    lock_held = []
+    encode = StateStore._sqlite_df_blob.__func__
+    decode = StateStore._sqlite_df_from_row.__func__
+
+    def tracking_encode(cls, df):
+        lock_held.append(("encode", StateStore._lock.locked()))
+        return encode(cls, df)
+
+    def tracking_decode(cls, row):
+        lock_held.append(("decode", StateStore._lock.locked()))
+        return decode(cls, row)
+
+    monkeypatch.setattr(StateStore, "_sqlite_df_blob", classmethod(tracking_encode))
+    monkeypatch.setattr(StateStore, "_sqlite_df_from_row", classmethod(tracking_decode))
+
+    sid = StateStore.save(sample_df, run_id="sqlite_run")
+    pd.testing.assert_frame_equal(StateStore.get(sid), sample_df)
+
+    assert lock_held == [("encode", False), ("decode", False)]
+
+
+def test_sqlite_concurrent_saves_are_thread_safe(tmp_path, monkeypatch, thread_pool):
+    _configure_sqlite_state_env(monkeypatch, tmp_path)
+    frames = [pd.DataFrame({"col": [i]}) for i in range(20)]
+
+    ids = list(thread_pool.map(lambda i: StateStore.save(frames[i], run_id=f"run_{i}"), range(20)))
+
+    assert len(set(ids)) == 20
+    for i, sid in enumerate(ids):
         stored = StateStore.get(sid)
         assert stored is not None
         assert stored.iloc[0]["col"] == i
         assert StateStore.get_run_id(sid) == f"run_{i}"
 
 
-def test_sqlite_concurrent_reads_are_safe(sample_df, tmp_path, monkeypatch):
+def test_sqlite_concurrent_reads_are_safe(sample_df, tmp_path, monkeypatch, thread_pool):
     _configure_sqlite_state_env(monkeypatch, tmp_path)
     sid = StateStore.save(sample_df, run_id="sqlite_run")
-    errors = []
-    lock = threading.Lock()
-
-    def reader():
-        try:
-            StateStore.get(sid)
-        except Exception as e:
-            with lock:
-                errors.append(e)
 
-    threads = [threading.Thread(target=reader) for _ in range(20)]
-    for thread in threads:
-        thread.start()
-    for thread in threads:
-        thread.join()
+    futures = [thread_pool.submit(StateStore.get, sid) for _ in range(20)]
 
-    assert not errors
+    assert all(future.result() is not None for future in futures)
 
 
 def test_sqlite_state_path_defaults_to_private_state_dir(monkeypatch, tmp_path):
-    import analyst_toolkit.mcp_server.state as state_module
-
     monkeypatch.delenv("ANALYST_MCP_SESSION_DB_PATH", raising=False)
     monkeypatch.setenv("XDG_STATE_HOME", str(tmp_path / "state_home"))
 
@@ -250,8 +259,6 @@ def test_sqlite_state_path_defaults_to_private_state_dir(monkeypatch, tmp_path):
 
 
 def test_sqlite_state_path_treats_blank_env_as_unset(monkeypatch, tmp_path):
-    import analyst_toolkit.mcp_server.state as state_module
-
     monkeypatch.setenv("ANALYST_MCP_SESSION_DB_PATH", "   ")
     monkeypatch.setenv("XDG_STATE_HOME", str(tmp_path / "state_home"))
 
@@ -261,8 +268,6 @@ def test_sqlite_state_path_treats_blank_env_as_unset(monkeypatch, tmp_path):
 
 
 def test_sqlite_state_path_rejects_exports_root(monkeypatch):
-    import analyst_toolkit.mcp_server.state as state_module
-
     monkeypatch.setenv("ANALYST_MCP_SESSION_DB_PATH", "exports/reports/state/session_store.db")
 
     with pytest.raises(ValueError, match="cannot use a path under ./exports"):
@@ -270,8 +275,6 @@ def test_sqlite_state_path_rejects_exports_root(monkeypatch):
 
 
 def test_sqlite_state_path_requires_private_root(monkeypatch, tmp_path):
-    import analyst_toolkit.mcp_server.state as state_module
-
     monkeypatch.setenv("XDG_STATE_HOME", str(tmp_path / "state_home"))
     monkeypatch.setenv("ANALYST_MCP_SESSION_DB_PATH", str(tmp_path / "elsewhere" / "db.sqlite"))
 
@@ -280,8 +283,6 @@ def test_sqlite_state_path_requires_private_root(monkeypatch, tmp_path):
 
 
 def test_sqlite_state_path_rejects_symlink(monkeypatch, tmp_path):
-    import analyst_toolkit.mcp_server.state as state_module
-
     state_home = tmp_path / "state_home"
     state_home.mkdir()
     target = state_home / "target.sqlite"
@@ -296,8 +297,6 @@ def test_sqlite_state_path_rejects_symlink(monkeypatch, tmp_path):
 
 
 def test_sqlite_rejects_legacy_pickle_rows(sample_df, tmp_path, monkeypatch):
-    import sqlite3
-
     db_path = _configure_sqlite_state_env(monkeypatch, tmp_path)
     sid = StateStore.save(sample_df, run_id="sqlite_run")
 
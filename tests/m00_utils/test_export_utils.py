@@ -1,4 +1,5 @@
 import pandas as pd
+import pytest
 
 from analyst_toolkit.m00_utils.export_utils import export_dataframes
 
@@ -40,3 +41,68 @@ def test_export_dataframes_keeps_explicit_run_id_csv_stem(tmp_path):
 
     assert (tmp_path / "run_001_duplicates_report_summary.csv").exists()
     assert not (tmp_path / "run_001_run_001_duplicates_report_summary.csv").exists()
+
+
+def test_export_dataframes_writes_one_parquet_file_per_frame(tmp_path):
+    export_path = tmp_path / "outlier_handling_report.xlsx"
+    log = pd.DataFrame([{"strategy": "clip", "column": "x", "outliers_handled": 2}])
+    wide = pd.DataFrame([[1.0, 2.0]], columns=pd.MultiIndex.from_tuples([("a", "b"), ("a", 1)]))
+
+    export_dataframes(
+        {"handling_summary_log": log, "wide": wide, "empty": pd.DataFrame()},
+        str(export_path),
+        file_format="parquet",
+        run_id="run_001",
+    )
+
+    summary_path = tmp_path / "run_001_outlier_handling_report_handling_summary_log.parquet"
+    pd.testing.assert_frame_equal(pd.read_parquet(summary_path), log)
+    wide_path = tmp_path / "run_001_outlier_handling_report_wide.parquet"
+    assert list(pd.read_parquet(wide_path).columns) == ["a__b", "a__1"]
+    assert not (tmp_path / "run_001_outlier_handling_report_empty.parquet").exists()
+
+
+def test_export_dataframes_streams_large_workbooks_in_row_order(tmp_path, monkeypatch):
+    from analyst_toolkit.m00_utils import export_utils
+
+    frame = pd.DataFrame(
+        {
+            "value": [1.5, None, 3.0],
+            "label": ["a", "b", None],
+            "flag": [True, False, True],
+            "when": pd.to_datetime(["2024-01-01 00:00", None, "2024-03-01 12:30"]),
+        }
+    )
+    data = {"main": frame, "log": pd.DataFrame([{"step": "x", "count": 1}])}
+    export_utils.export_dataframes(data, str(tmp_path / "buffered.xlsx"))
+    monkeypatch.setattr(export_utils, "_EXCEL_STREAM_MIN_ROWS", 2)
+    export_utils.export_dataframes(data, str(tmp_path / "streamed.xlsx"))
+
+    buffered = pd.read_excel(tmp_path / "buffered.xlsx", sheet_name=None)
+    streamed = pd.read_excel(tmp_path / "streamed.xlsx", sheet_name=None)
+    assert list(streamed) == ["main", "log"]
+    for name in buffered:
+        pd.testing.assert_frame_equal(streamed[name], buffered[name])
+
+
+def test_write_csv_uses_arrow_only_when_opted_in(tmp_path):
+    pytest.importorskip("pyarrow")
+    from analyst_toolkit.m00_utils import export_utils
+
+    frame = pd.DataFrame(
+        {
+            "value": [1.5, None, 3.0],
+            "label": ["a", "b,c", float("nan")],
+            "flag": [True, False, True],
+        }
+    )
+    mixed = pd.DataFrame({"cell": [[1], {"a": 1}, "x"]})
+
+    export_utils.write_csv(frame, tmp_path / "default.csv")
+    export_utils.write_csv(frame, tmp_path / "arrow.csv", engine="pyarrow")
+    export_utils.write_csv(mixed, tmp_path / "mixed.csv", engine="pyarrow")
+
+    assert (tmp_path / "default.csv").read_text() == frame.to_csv(index=False)
+    assert (tmp_path / "arrow.csv").read_text().startswith('"value","label","flag"')
+    pd.testing.assert_frame_equal(pd.read_csv(tmp_path / "arrow.csv"), frame)
+    assert pd.read_csv(tmp_path / "mixed.csv")["cell"].tolist() == ["[1]", "{'a': 1}", "x"]
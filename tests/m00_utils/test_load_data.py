@@ -1,7 +1,9 @@
 import joblib
+import pandas as pd
 import pytest
 
-from analyst_toolkit.m00_utils.load_data import load_joblib
+from analyst_toolkit.m00_utils import load_data
+from analyst_toolkit.m00_utils.load_data import load_csv, load_joblib
 
 
 def test_load_joblib_requires_explicit_opt_in(monkeypatch, tmp_path):
@@ -19,3 +21,31 @@ def test_load_joblib_allows_trusted_opt_in(monkeypatch, tmp_path):
     monkeypatch.setenv("ANALYST_TOOLKIT_ALLOW_UNSAFE_JOBLIB", "1")
 
     assert load_joblib(str(payload_path)) == {"status": "ok"}
+
+
+def test_load_csv_pyarrow_engine_matches_default_parser(tmp_path):
+    pytest.importorskip("pyarrow")
+    csv_path = tmp_path / "data.csv"
+    csv_path.write_text("a,b,c\n1,x,1.5\n2,y,\n", encoding="utf-8")
+
+    pd.testing.assert_frame_equal(
+        load_csv(str(csv_path), engine="pyarrow"), load_csv(str(csv_path))
+    )
+
+
+def test_load_csv_falls_back_when_pyarrow_is_missing(monkeypatch, tmp_path):
+    csv_path = tmp_path / "data.csv"
+    csv_path.write_text("a\n1\n", encoding="utf-8")
+    read_csv = pd.read_csv
+    engines = []
+
+    def fake_read_csv(path, engine=None):
+        engines.append(engine)
+        if engine == "pyarrow":
+            raise ImportError("pyarrow missing")
+        return read_csv(path, engine=engine)
+
+    monkeypatch.setattr(load_data.pd, "read_csv", fake_read_csv)
+
+    assert load_csv(str(csv_path), engine="pyarrow")["a"].tolist() == [1]
+    assert engines == ["pyarrow", None]
@@ -1,5 +1,6 @@
 import importlib
 import sys
+import types
 
 import pandas as pd
 
@@ -75,3 +76,125 @@ def test_display_markdown_summary_falls_back_when_to_markdown_import_errors(monk
     assert "### Summary" in out
     assert "col" in out
     assert "1" in out
+
+
+def test_to_html_table_reuses_render_for_unchanged_content(monkeypatch):
+    module = _import_rendering_utils()
+    calls = []
+    original_to_html = pd.DataFrame.to_html
+
+    def counting_to_html(self, *args, **kwargs):
+        calls.append(1)
+        return original_to_html(self, *args, **kwargs)
+
+    monkeypatch.setattr(pd.DataFrame, "to_html", counting_to_html)
+    df = pd.DataFrame({"value": [1.5, 2.5]})
+
+    first = module.to_html_table(df)
+    assert module.to_html_table(df.copy()) == first
+    assert len(calls) == 1
+
+    df.loc[0, "value"] = 9.5
+    assert "9.5" in module.to_html_table(df)
+    assert len(calls) == 2
+
+    module.to_html_table(pd.DataFrame({"value": [[1], [2]]}))
+    module.to_html_table(pd.DataFrame({"value": [[1], [2]]}))
+    assert len(calls) == 4
+
+
+def test_to_html_table_cache_survives_concurrent_renders(monkeypatch):
+    from concurrent.futures import ThreadPoolExecutor
+
+    module = _import_rendering_utils()
+    monkeypatch.setattr(module, "_MAX_HTML_TABLE_CACHE", 2)
+    frames = [pd.DataFrame({"value": [i + 0.5]}) for i in range(8)]
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        rendered = list(pool.map(module.to_html_table, frames * 25))
+
+    assert all(f"{i + 0.5}" in html for i, html in zip(range(8), rendered[:8]))
+    assert len(module._HTML_TABLE_CACHE) <= 2
+
+
+def test_to_html_table_writes_small_tables_without_pandas_formatter(monkeypatch):
+    module = _import_rendering_utils()
+    df = pd.DataFrame({"Metric": ["Rows", " <b>&</b> ", "tab\there"], "Value": [3, -1, 10**12]})
+    expected = {
+        escape: df.to_html(classes="table table-striped", escape=escape, index=False)
+        for escape in (True, False)
+    }
+    calls = []
+    original_to_html = pd.DataFrame.to_html
+
+    def counting_to_html(self, *args, **kwargs):
+        calls.append(1)
+        return original_to_html(self, *args, **kwargs)
+
+    monkeypatch.setattr(pd.DataFrame, "to_html", counting_to_html)
+
+    assert module.to_html_table(df) == expected[True]
+    assert module.to_html_table(df, escape=False) == expected[False]
+    assert calls == []
+
+    module.to_html_table(pd.DataFrame({"Metric": ["Rows"], "Value": [1.5]}))
+    assert len(calls) == 1
+
+
+def _fake_ipython(monkeypatch, shell):
+    shown = []
+    ipython = types.ModuleType("IPython")
+    ipython.get_ipython = lambda: shell
+    ipython_display = types.ModuleType("IPython.display")
+    ipython_display.Markdown = lambda text: ("markdown", text)
+    ipython_display.display = shown.append
+    monkeypatch.setitem(sys.modules, "IPython", ipython)
+    monkeypatch.setitem(sys.modules, "IPython.display", ipython_display)
+    return shown
+
+
+def test_markdown_prints_when_ipython_is_loaded_without_a_shell(monkeypatch, capsys):
+    shown = _fake_ipython(monkeypatch, shell=None)
+    module = _import_rendering_utils()
+
+    module.display_warnings(["first"], title="Warnings")
+
+    assert shown == []
+    assert "- first" in capsys.readouterr().out
+
+
+def test_markdown_uses_ipython_display_inside_a_shell(monkeypatch):
+    shown = _fake_ipython(monkeypatch, shell=object())
+    module = _import_rendering_utils()
+
+    module.display_warnings(["first"], title="Warnings")
+    monkeypatch.delitem(sys.modules, "IPython.display")
+    module.display_warnings(["second"], title="Warnings")
+
+    assert [text for _, text in shown] == ["### Warnings\n\n- first", "### Warnings\n\n- second"]
+
+
+def test_markdown_summary_skips_tabulate_outside_a_shell(monkeypatch, capsys):
+    _fake_ipython(monkeypatch, shell=None)
+    module = _import_rendering_utils()
+
+    def fail_to_markdown(*args, **kwargs):
+        raise AssertionError("to_markdown should not run without a shell")
+
+    monkeypatch.setattr(pd.DataFrame, "to_markdown", fail_to_markdown)
+
+    module.display_markdown_summary("Summary", pd.DataFrame({"col": [1, 2]}))
+
+    out = capsys.readouterr().out
+    assert out.startswith("### Summary")
+    assert "col" in out
+
+
+def test_markdown_summary_renders_markdown_inside_a_shell(monkeypatch):
+    shown = _fake_ipython(monkeypatch, shell=object())
+    module = _import_rendering_utils()
+    monkeypatch.setattr(pd.DataFrame, "to_markdown", lambda self, index: "| col |")
+
+    module.display_markdown_summary("Summary", pd.DataFrame({"col": [1, 2]}))
+
+    assert shown == [("markdown", "### Summary\n\n| col |")]
@@ -1,6 +1,9 @@
 import pandas as pd
 
-from analyst_toolkit.m00_utils.report_tables import generate_transformation_report
+from analyst_toolkit.m00_utils.report_tables import (
+    generate_imputation_report,
+    generate_transformation_report,
+)
 
 
 def test_generate_transformation_report_resolves_renamed_preview_columns():
@@ -28,3 +31,22 @@ def test_generate_transformation_report_resolves_renamed_preview_columns():
     value_audit = column_value_analysis["gender"]["value_audit"]
     assert isinstance(value_audit, pd.DataFrame)
     assert set(value_audit.columns) == {"Value", "Original Count", "Normalized Count"}
+
+
+def test_generate_imputation_report_counts_missing_and_new_categories():
+    df_original = pd.DataFrame(
+        {"sex": pd.Series(["Male", None, "Male", "Female"], dtype="category")}
+    )
+    df_imputed = pd.DataFrame(
+        {"sex": pd.Series(["Male", "Male", "Male", "Female"], dtype="category")}
+    )
+    changelog = pd.DataFrame([{"Column": "sex", "Strategy": "mode", "Nulls Filled": 1}])
+
+    report = generate_imputation_report(df_original, df_imputed, changelog)
+
+    audit = report["categorical_shift"]["sex"]
+    rows = {
+        (None if pd.isna(value) else value): (original, imputed, change)
+        for value, original, imputed, change in audit.itertuples(index=False)
+    }
+    assert rows == {"Male": (2, 3, 1), "Female": (1, 1, 0), None: (1, 0, -1)}
@@ -1,13 +1,93 @@
+import asyncio
+import json
+from collections.abc import Awaitable, Callable, Iterator
+from typing import Any
+
 import pytest
 from fastapi.testclient import TestClient
 
 import analyst_toolkit.mcp_server.local_artifact_server as artifact_server_module
 from analyst_toolkit.mcp_server.server import app
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _encode_json(payload: Any) -> bytes:
+    # orjson (from the ``accel`` extra) encodes and parses several times faster than json.
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload).encode("utf-8")
+
+
+def _decode_json(body: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(body)
+    return json.loads(body)
+
+
+@pytest.fixture(scope="session")
+def client() -> Iterator[TestClient]:
+    """One client for the session; entering it keeps a single portal thread for all requests."""
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+async def _post_rpc_asgi(payload: Any) -> tuple[int, Any]:
+    body = _encode_json(payload)
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "POST",
+        "scheme": "http",
+        "path": "/rpc",
+        "raw_path": b"/rpc",
+        "root_path": "",
+        "query_string": b"",
+        "headers": [
+            (b"host", b"testserver"),
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(body)).encode("ascii")),
+        ],
+        "client": ("testclient", 50000),
+        "server": ("testserver", 80),
+    }
+    request_sent = False
+    response_done = asyncio.Event()
+    status = 0
+    chunks: list[bytes] = []
+
+    async def receive() -> dict[str, Any]:
+        nonlocal request_sent
+        if not request_sent:
+            request_sent = True
+            return {"type": "http.request", "body": body, "more_body": False}
+        await response_done.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message: dict[str, Any]) -> None:
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+        elif message["type"] == "http.response.body":
+            chunks.append(message.get("body", b""))
+            if not message.get("more_body", False):
+                response_done.set()
+
+    await app(scope, receive, send)
+    return status, _decode_json(b"".join(chunks))
+
 
 @pytest.fixture
-def client() -> TestClient:
-    return TestClient(app)
+def asgi_rpc() -> Callable[[Any], Awaitable[tuple[int, Any]]]:
+    """POST a JSON-RPC payload straight into the ASGI app and return ``(status, body)``.
+
+    Skips the httpx client and TestClient portal for tests that only check the JSON reply.
+    """
+    return _post_rpc_asgi
 
 
 @pytest.fixture
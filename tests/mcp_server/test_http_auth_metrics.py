@@ -1,5 +1,12 @@
+import json
+
 import analyst_toolkit.mcp_server.server as server_module
 
+# The initialize request never varies between tests, so its body is encoded once.
+_INITIALIZE_PAYLOAD = {"jsonrpc": "2.0", "id": 800, "method": "initialize", "params": {}}
+_INITIALIZE_BODY = json.dumps(_INITIALIZE_PAYLOAD).encode("utf-8")
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
 
 def test_health_check(client):
     """Verify the /health endpoint returns the registered tools."""
@@ -13,6 +20,12 @@ def test_health_check(client):
     assert "outliers" in data["tools"]
 
 
+def test_app_registers_no_startup_or_shutdown_work():
+    """The session-wide test client relies on app startup being free; keep it that way."""
+    assert server_module.app.router.on_startup == []
+    assert server_module.app.router.on_shutdown == []
+
+
 def test_ready_check(client):
     """Verify the readiness endpoint contract."""
     response = client.get("/ready")
@@ -39,20 +52,18 @@ def test_metrics_rpc_counters_delta(client):
     """Verify request/error counters increment based on RPC outcomes."""
     before = server_module.METRICS.snapshot()["rpc"]
 
-    ok_payload = {"jsonrpc": "2.0", "id": 801, "method": "initialize", "params": {}}
-    ok_response = client.post("/rpc", json=ok_payload)
-    assert ok_response.status_code == 200
-    assert "result" in ok_response.json()
-
     err_payload = {
         "jsonrpc": "2.0",
         "id": 802,
         "method": "tools/call",
         "params": {"name": "missing_tool_for_metrics", "arguments": {}},
     }
-    err_response = client.post("/rpc", json=err_payload)
-    assert err_response.status_code == 200
-    assert "error" in err_response.json()
+    # One JSON-RPC batch covers both outcomes in a single HTTP roundtrip.
+    response = client.post("/rpc", json=[_INITIALIZE_PAYLOAD, err_payload])
+    assert response.status_code == 200
+    ok_result, err_result = response.json()
+    assert "result" in ok_result
+    assert "error" in err_result
 
     after = server_module.METRICS.snapshot()["rpc"]
     assert after["requests_total"] == before["requests_total"] + 2
@@ -65,6 +76,41 @@ def test_metrics_rpc_counters_delta(client):
     )
 
 
+def test_rpc_batch_answers_each_message_in_order(client):
+    """Verify batch requests get one response per member, including invalid ones."""
+    unknown_method = {"jsonrpc": "2.0", "id": 801, "method": "no/such_method", "params": {}}
+    response = client.post("/rpc", json=[_INITIALIZE_PAYLOAD, 42, unknown_method, "x"])
+    assert response.status_code == 200
+    first, second, third, fourth = response.json()
+    assert first["id"] == 800
+    assert "result" in first
+    assert second["error"]["code"] == -32600
+    assert third["id"] == 801
+    assert third["error"]["code"] == -32601
+    assert fourth["error"]["code"] == -32600
+
+    empty_response = client.post("/rpc", json=[])
+    assert empty_response.json()["error"]["code"] == -32600
+
+
+def test_rpc_batch_over_the_size_limit_is_rejected_whole(client, monkeypatch):
+    """Verify oversized batches get one -32600 error and dispatch none of their members."""
+    monkeypatch.setattr(server_module, "MAX_RPC_BATCH_SIZE", 2)
+    before = server_module.METRICS.snapshot()["rpc"]
+
+    response = client.post("/rpc", json=[_INITIALIZE_PAYLOAD] * 3)
+
+    assert response.status_code == 200
+    error = response.json()["error"]
+    assert error["code"] == -32600
+    assert error["data"] == {"batch_size": 3, "max_batch_size": 2}
+    after = server_module.METRICS.snapshot()["rpc"]
+    assert after["by_method"].get("initialize", 0) == before["by_method"].get("initialize", 0)
+
+    at_limit = client.post("/rpc", json=[_INITIALIZE_PAYLOAD] * 2)
+    assert [message["id"] for message in at_limit.json()] == [800, 800]
+
+
 def test_auth_mode_rejects_unauthorized_requests(client, monkeypatch):
     """Verify token auth mode blocks unauthenticated calls."""
     monkeypatch.setattr(server_module, "AUTH_TOKEN", "test-token")
@@ -73,24 +119,23 @@ def test_auth_mode_rejects_unauthorized_requests(client, monkeypatch):
     assert health_response.status_code == 401
     assert health_response.json()["status"] == "unauthorized"
 
-    rpc_payload = {"jsonrpc": "2.0", "id": 901, "method": "initialize", "params": {}}
-    rpc_response = client.post("/rpc", json=rpc_payload)
+    rpc_response = client.post("/rpc", content=_INITIALIZE_BODY, headers=_JSON_HEADERS)
     assert rpc_response.status_code == 401
-    assert rpc_response.json()["error"] == "Unauthorized"
-    assert isinstance(rpc_response.json().get("trace_id"), str)
+    rpc_data = rpc_response.json()
+    assert rpc_data["error"] == "Unauthorized"
+    assert isinstance(rpc_data.get("trace_id"), str)
 
 
 def test_auth_mode_allows_bearer_token(client, monkeypatch):
     """Verify token auth mode accepts valid bearer auth."""
     monkeypatch.setattr(server_module, "AUTH_TOKEN", "test-token")
-    headers = {"Authorization": "Bearer test-token"}
+    headers = {**_JSON_HEADERS, "Authorization": "Bearer test-token"}
 
     ready_response = client.get("/ready", headers=headers)
     assert ready_response.status_code == 200
     assert ready_response.json()["status"] == "ready"
 
-    rpc_payload = {"jsonrpc": "2.0", "id": 902, "method": "initialize", "params": {}}
-    rpc_response = client.post("/rpc", json=rpc_payload, headers=headers)
+    rpc_response = client.post("/rpc", content=_INITIALIZE_BODY, headers=headers)
     assert rpc_response.status_code == 200
     assert rpc_response.json()["result"]["serverInfo"]["name"] == "analyst-toolkit"
 
@@ -105,15 +150,16 @@ def test_auth_mode_rejects_unauthorized_input_register(client, monkeypatch, tmp_
         "/inputs/register", json={"uri": str(source), "load_into_session": False}
     )
     assert response.status_code == 401
-    assert response.json()["detail"]["error"] == "Unauthorized"
-    assert isinstance(response.json()["detail"]["trace_id"], str)
+    detail = response.json()["detail"]
+    assert detail["error"] == "Unauthorized"
+    assert isinstance(detail["trace_id"], str)
 
 
 def test_auth_mode_allows_authorized_input_register(client, monkeypatch, tmp_path):
     """Verify token auth mode allows authorized input registration."""
     monkeypatch.setattr(server_module, "AUTH_TOKEN", "test-token")
     monkeypatch.setenv("ANALYST_MCP_ALLOWED_INPUT_ROOTS", str(tmp_path))
-    headers = {"Authorization": "Bearer test-token"}
+    headers = {**_JSON_HEADERS, "Authorization": "Bearer test-token"}
     source = tmp_path / "dirty_penguins.csv"
     source.write_text("species,bill_length_mm\nAdelie,39.1\n")
 
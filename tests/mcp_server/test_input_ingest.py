@@ -154,9 +154,11 @@ def test_inputs_upload_reuses_input_id_for_same_payload(client, clean_input_env)
 
     assert response_one.status_code == 200
     assert response_two.status_code == 200
-    assert response_one.json()["status"] == "pass"
-    assert response_two.json()["status"] == "pass"
-    assert response_one.json()["input"]["input_id"] == response_two.json()["input"]["input_id"]
+    payload_one = response_one.json()
+    payload_two = response_two.json()
+    assert payload_one["status"] == "pass"
+    assert payload_two["status"] == "pass"
+    assert payload_one["input"]["input_id"] == payload_two["input"]["input_id"]
 
 
 def test_inputs_upload_reuses_session_for_anonymous_idempotent_retry(client, clean_input_env):
@@ -185,8 +187,10 @@ def test_inputs_upload_reuses_session_for_anonymous_idempotent_retry(client, cle
 
     assert response_one.status_code == 200
     assert response_two.status_code == 200
-    assert response_one.json()["input"]["input_id"] == response_two.json()["input"]["input_id"]
-    assert response_one.json()["session_id"] == response_two.json()["session_id"]
+    payload_one = response_one.json()
+    payload_two = response_two.json()
+    assert payload_one["input"]["input_id"] == payload_two["input"]["input_id"]
+    assert payload_one["session_id"] == payload_two["session_id"]
 
 
 def test_inputs_upload_conflict_does_not_mutate_original_session_or_descriptor(
@@ -291,9 +295,11 @@ def test_inputs_register_reuses_input_id_with_stable_idempotency_key(client, cle
 
     assert response_one.status_code == 200
     assert response_two.status_code == 200
-    assert response_one.json()["status"] == "pass"
-    assert response_two.json()["status"] == "pass"
-    assert response_one.json()["input"]["input_id"] == response_two.json()["input"]["input_id"]
+    payload_one = response_one.json()
+    payload_two = response_two.json()
+    assert payload_one["status"] == "pass"
+    assert payload_two["status"] == "pass"
+    assert payload_one["input"]["input_id"] == payload_two["input"]["input_id"]
 
 
 def test_inputs_register_reuses_session_for_anonymous_idempotent_retry(client, clean_input_env):
@@ -323,8 +329,10 @@ def test_inputs_register_reuses_session_for_anonymous_idempotent_retry(client, c
 
     assert response_one.status_code == 200
     assert response_two.status_code == 200
-    assert response_one.json()["input"]["input_id"] == response_two.json()["input"]["input_id"]
-    assert response_one.json()["session_id"] == response_two.json()["session_id"]
+    payload_one = response_one.json()
+    payload_two = response_two.json()
+    assert payload_one["input"]["input_id"] == payload_two["input"]["input_id"]
+    assert payload_one["session_id"] == payload_two["session_id"]
 
 
 def test_inputs_register_rejects_conflicting_explicit_session_rebind_and_preserves_retry_binding(
@@ -352,7 +360,9 @@ def test_inputs_register_rejects_conflicting_explicit_session_rebind_and_preserv
         },
     )
     assert response_one.status_code == 200
-    original_session_id = response_one.json()["session_id"]
+    payload_one = response_one.json()
+    original_input_id = payload_one["input"]["input_id"]
+    original_session_id = payload_one["session_id"]
 
     competing_response = client.post(
         "/inputs/register",
@@ -377,8 +387,9 @@ def test_inputs_register_rejects_conflicting_explicit_session_rebind_and_preserv
     )
 
     assert response_two.status_code == 200
-    assert response_one.json()["input"]["input_id"] == response_two.json()["input"]["input_id"]
-    assert response_two.json()["session_id"] == original_session_id
+    payload_two = response_two.json()
+    assert payload_two["input"]["input_id"] == original_input_id
+    assert payload_two["session_id"] == original_session_id
     assert StateStore.get_metadata(original_session_id) is not None
 
 
@@ -409,9 +420,11 @@ def test_inputs_register_uses_distinct_input_ids_for_distinct_idempotency_keys(
 
     assert response_one.status_code == 200
     assert response_two.status_code == 200
-    assert response_one.json()["status"] == "pass"
-    assert response_two.json()["status"] == "pass"
-    assert response_one.json()["input"]["input_id"] != response_two.json()["input"]["input_id"]
+    payload_one = response_one.json()
+    payload_two = response_two.json()
+    assert payload_one["status"] == "pass"
+    assert payload_two["status"] == "pass"
+    assert payload_one["input"]["input_id"] != payload_two["input"]["input_id"]
 
 
 def test_inputs_register_rejects_path_outside_allowed_roots(client, monkeypatch, clean_input_env):
@@ -51,6 +51,7 @@ def test_build_cockpit_resource_groups_raises_clear_error_for_missing_reference(
         build_cockpit_resource_groups(resources)
 
 
+@pytest.mark.repo_cwd
 def test_rpc_capability_catalog_tool(client):
     """Verify capability catalog exposes editable knobs including fuzzy matching."""
     payload = {
@@ -86,9 +87,11 @@ def test_rpc_capability_catalog_tool(client):
     )
     modules = {item["tool"]: item for item in result["modules"]}
     assert all(str(item["template_path"]).startswith("config/") for item in result["modules"])
-    final_audit_knobs = {k["path"]: k["default"] for k in modules["final_audit"]["key_knobs"]}
-    assert "summary.run" not in final_audit_knobs
-    assert final_audit_knobs["final_edits.run"] is True
+    final_audit_knobs = modules["final_audit"]["key_knobs"]
+    assert not any(k["path"] == "summary.run" for k in final_audit_knobs)
+    final_edits_knob = next((k for k in final_audit_knobs if k["path"] == "final_edits.run"), None)
+    assert final_edits_knob is not None
+    assert final_edits_knob["default"] is True
 
     global_controls = result["global_controls"]
     plotting_control = next(c for c in global_controls if "Plotting toggles" in c["description"])
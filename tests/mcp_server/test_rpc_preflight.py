@@ -1,32 +1,40 @@
+import pytest
+
 import analyst_toolkit.mcp_server.tools.diagnostics as diagnostics_tool
 from analyst_toolkit.mcp_server.input.errors import InputPayloadTooLargeError
 
 
-def test_rpc_preflight_config_normalizes_validation_shape(client):
-    payload = {
+def _tool_call(req_id: int, name: str, arguments: dict) -> dict:
+    return {
         "jsonrpc": "2.0",
-        "id": 36,
+        "id": req_id,
         "method": "tools/call",
-        "params": {
-            "name": "preflight_config",
-            "arguments": {
-                "module_name": "validation",
-                "config": {
-                    "rules": {
-                        "schema_validation": {
-                            "rules": {
-                                "expected_columns": ["tag_id", "species"],
-                            }
-                        },
-                        "expected_types": {"tag_id": "str"},
-                    }
-                },
+        "params": {"name": name, "arguments": arguments},
+    }
+
+
+@pytest.mark.asyncio
+async def test_rpc_preflight_config_normalizes_validation_shape(asgi_rpc):
+    payload = _tool_call(
+        36,
+        "preflight_config",
+        {
+            "module_name": "validation",
+            "config": {
+                "rules": {
+                    "schema_validation": {
+                        "rules": {
+                            "expected_columns": ["tag_id", "species"],
+                        }
+                    },
+                    "expected_types": {"tag_id": "str"},
+                }
             },
         },
-    }
-    response = client.post("/rpc", json=payload)
-    assert response.status_code == 200
-    result = response.json()["result"]
+    )
+    status, data = await asgi_rpc(payload)
+    assert status == 200
+    result = data["result"]
     assert result["status"] == "pass"
     assert result["module"] == "validation"
     assert result["summary"]["effective_rules_path"] == "validation.schema_validation.rules.*"
@@ -37,26 +45,23 @@ def test_rpc_preflight_config_normalizes_validation_shape(client):
     assert "expected_types" in result["effective_config"]["schema_validation"]["rules"]
 
 
-def test_rpc_preflight_config_normalizes_outliers_shorthand(client):
-    payload = {
-        "jsonrpc": "2.0",
-        "id": 37,
-        "method": "tools/call",
-        "params": {
-            "name": "preflight_config",
-            "arguments": {
-                "module_name": "outliers",
-                "config": {
-                    "method": "iqr",
-                    "iqr_multiplier": 1.1,
-                    "columns": ["transaction_amount", "frequency_24h"],
-                },
+@pytest.mark.asyncio
+async def test_rpc_preflight_config_normalizes_outliers_shorthand(asgi_rpc):
+    payload = _tool_call(
+        37,
+        "preflight_config",
+        {
+            "module_name": "outliers",
+            "config": {
+                "method": "iqr",
+                "iqr_multiplier": 1.1,
+                "columns": ["transaction_amount", "frequency_24h"],
             },
         },
-    }
-    response = client.post("/rpc", json=payload)
-    assert response.status_code == 200
-    result = response.json()["result"]
+    )
+    status, data = await asgi_rpc(payload)
+    assert status == 200
+    result = data["result"]
     assert result["status"] == "pass"
     assert result["module"] == "outliers"
     assert (
@@ -67,45 +72,41 @@ def test_rpc_preflight_config_normalizes_outliers_shorthand(client):
     assert specs["frequency_24h"]["method"] == "iqr"
 
 
-def test_rpc_preflight_config_strict_fails_on_warnings(client):
-    payload = {
-        "jsonrpc": "2.0",
-        "id": 38,
-        "method": "tools/call",
-        "params": {
-            "name": "preflight_config",
-            "arguments": {
-                "module_name": "validation",
-                "strict": True,
-                "config": {
-                    "rules": {
-                        "schema_validation": {
-                            "rules": {
-                                "expected_columns": ["tag_id", "species"],
-                            }
+@pytest.mark.asyncio
+async def test_rpc_preflight_config_strict_fails_on_warnings(asgi_rpc):
+    payload = _tool_call(
+        38,
+        "preflight_config",
+        {
+            "module_name": "validation",
+            "strict": True,
+            "config": {
+                "rules": {
+                    "schema_validation": {
+                        "rules": {
+                            "expected_columns": ["tag_id", "species"],
                         }
                     }
-                },
+                }
             },
         },
-    }
-    response = client.post("/rpc", json=payload)
-    assert response.status_code == 200
-    result = response.json()["result"]
+    )
+    status, data = await asgi_rpc(payload)
+    assert status == 200
+    result = data["result"]
     assert result["status"] == "error"
     assert result["summary"]["strict"] is True
     assert result["warnings"]
     assert "schema_validation" in result["warnings"][0]
 
 
-def test_rpc_preflight_config_strict_fails_on_unknown_keys(client):
-    payload = {
-        "jsonrpc": "2.0",
-        "id": 39,
-        "method": "tools/call",
-        "params": {
-            "name": "preflight_config",
-            "arguments": {
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("req_id", "arguments", "expected_status"),
+    [
+        (
+            39,
+            {
                 "module_name": "outliers",
                 "strict": True,
                 "config": {
@@ -114,136 +115,106 @@ def test_rpc_preflight_config_strict_fails_on_unknown_keys(client):
                     "unexpected_flag": True,
                 },
             },
-        },
-    }
-    response = client.post("/rpc", json=payload)
-    assert response.status_code == 200
-    result = response.json()["result"]
-    assert result["status"] == "error"
+            "error",
+        ),
+        (
+            41,
+            {"module_name": "normalization", "config": {"unexpected_flag": 1}},
+            "pass",
+        ),
+    ],
+    ids=["strict_fails", "non_strict_warns"],
+)
+async def test_rpc_preflight_config_reports_unknown_keys(
+    asgi_rpc, req_id, arguments, expected_status
+):
+    payload = _tool_call(req_id, "preflight_config", arguments)
+    status, data = await asgi_rpc(payload)
+    assert status == 200
+    result = data["result"]
+    assert result["status"] == expected_status
     assert result["unknown_keys"] == ["unexpected_flag"]
     assert result["summary"]["unknown_key_count"] == 1
     assert any("Unknown top-level keys" in w for w in result["warnings"])
 
 
-def test_rpc_preflight_config_strict_fails_on_nested_unknown_keys(client):
-    payload = {
-        "jsonrpc": "2.0",
-        "id": 44,
-        "method": "tools/call",
-        "params": {
-            "name": "preflight_config",
-            "arguments": {
-                "module_name": "normalization",
-                "strict": True,
-                "config": {"normalization": {"run": True, "bogus_key_for_test": 123}},
-            },
+@pytest.mark.asyncio
+async def test_rpc_preflight_config_strict_fails_on_nested_unknown_keys(asgi_rpc):
+    payload = _tool_call(
+        44,
+        "preflight_config",
+        {
+            "module_name": "normalization",
+            "strict": True,
+            "config": {"normalization": {"run": True, "bogus_key_for_test": 123}},
         },
-    }
-    response = client.post("/rpc", json=payload)
-    assert response.status_code == 200
-    result = response.json()["result"]
+    )
+    status, data = await asgi_rpc(payload)
+    assert status == 200
+    result = data["result"]
     assert result["status"] == "error"
     assert result["summary"]["unknown_key_count"] >= 1
     assert any("bogus_key_for_test" in k for k in result["unknown_keys"])
 
 
-def test_rpc_preflight_config_non_strict_warns_on_unknown_keys(client):
-    payload = {
-        "jsonrpc": "2.0",
-        "id": 41,
-        "method": "tools/call",
-        "params": {
-            "name": "preflight_config",
-            "arguments": {"module_name": "normalization", "config": {"foo": 1}},
-        },
-    }
-    response = client.post("/rpc", json=payload)
-    assert response.status_code == 200
-    result = response.json()["result"]
-    assert result["status"] == "pass"
-    assert result["unknown_keys"] == ["foo"]
-    assert result["summary"]["unknown_key_count"] == 1
-    assert any("Unknown top-level keys" in w for w in result["warnings"])
-
-
-def test_rpc_preflight_config_applies_runtime_overlay(client):
-    payload = {
-        "jsonrpc": "2.0",
-        "id": 45,
-        "method": "tools/call",
-        "params": {
-            "name": "preflight_config",
-            "arguments": {
-                "module_name": "normalization",
-                "config": {"rules": {"rename_columns": {"a": "b"}}},
-                "runtime": {"artifacts": {"export_html": False}},
-            },
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("req_id", "artifacts", "expected_warning"),
+    [
+        (45, {"export_html": False}, None),
+        (47, {"export_html": False, "mystery_flag": True}, "Ignored unknown runtime key"),
+    ],
+    ids=["known_keys", "unknown_keys_warn"],
+)
+async def test_rpc_preflight_config_applies_runtime_overlay(
+    asgi_rpc, req_id, artifacts, expected_warning
+):
+    payload = _tool_call(
+        req_id,
+        "preflight_config",
+        {
+            "module_name": "normalization",
+            "config": {"rules": {"rename_columns": {"a": "b"}}},
+            "runtime": {"artifacts": artifacts},
         },
-    }
-    response = client.post("/rpc", json=payload)
-    assert response.status_code == 200
-    result = response.json()["result"]
+    )
+    status, data = await asgi_rpc(payload)
+    assert status == 200
+    result = data["result"]
     assert result["status"] == "pass"
     assert result["summary"]["runtime_applied"] is True
     assert result["effective_config"]["export_html"] is False
-
-
-def test_rpc_preflight_config_rejects_invalid_runtime_overlay(client):
-    payload = {
-        "jsonrpc": "2.0",
-        "id": 46,
-        "method": "tools/call",
-        "params": {
-            "name": "preflight_config",
-            "arguments": {
-                "module_name": "normalization",
-                "strict": True,
-                "config": {"rules": {"rename_columns": {"a": "b"}}},
-                "runtime": {"artifacts": {"export_html": "definitely"}},
-            },
+    if expected_warning is not None:
+        assert any(expected_warning in warning for warning in result["warnings"])
+
+
+@pytest.mark.asyncio
+async def test_rpc_preflight_config_rejects_invalid_runtime_overlay(asgi_rpc):
+    payload = _tool_call(
+        46,
+        "preflight_config",
+        {
+            "module_name": "normalization",
+            "strict": True,
+            "config": {"rules": {"rename_columns": {"a": "b"}}},
+            "runtime": {"artifacts": {"export_html": "definitely"}},
         },
-    }
-    response = client.post("/rpc", json=payload)
-    assert response.status_code == 200
-    result = response.json()["result"]
+    )
+    status, data = await asgi_rpc(payload)
+    assert status == 200
+    result = data["result"]
     assert result["status"] == "error"
     assert result["error"]["code"] == "tool_execution_failed"
     assert "RuntimeOverlayError" in result["error"]["message"]
 
 
-def test_rpc_preflight_config_warns_on_unknown_runtime_keys(client):
-    payload = {
-        "jsonrpc": "2.0",
-        "id": 47,
-        "method": "tools/call",
-        "params": {
-            "name": "preflight_config",
-            "arguments": {
-                "module_name": "normalization",
-                "config": {"rules": {"rename_columns": {"a": "b"}}},
-                "runtime": {"artifacts": {"export_html": False, "mystery_flag": True}},
-            },
-        },
-    }
-    response = client.post("/rpc", json=payload)
-    assert response.status_code == 200
-    result = response.json()["result"]
-    assert result["status"] == "pass"
-    assert result["summary"]["runtime_applied"] is True
-    assert any("Ignored unknown runtime key" in warning for warning in result["warnings"])
-
-
-def test_rpc_tools_call_returns_structured_error_envelope_for_tool_failure(client):
+@pytest.mark.asyncio
+async def test_rpc_tools_call_returns_structured_error_envelope_for_tool_failure(asgi_rpc):
     """Verify tool runtime failures are normalized to structured status=error payloads."""
-    payload = {
-        "jsonrpc": "2.0",
-        "id": 28,
-        "method": "tools/call",
-        "params": {"name": "diagnostics", "arguments": {}},
-    }
-    response = client.post("/rpc", json=payload)
-    assert response.status_code == 200
-    result = response.json()["result"]
+    payload = _tool_call(28, "diagnostics", {})
+    status, data = await asgi_rpc(payload)
+    assert status == 200
+    result = data["result"]
     assert result["status"] == "error"
     assert result["module"] == "diagnostics"
     assert isinstance(result.get("trace_id"), str)
@@ -253,21 +224,19 @@ def test_rpc_tools_call_returns_structured_error_envelope_for_tool_failure(clien
     assert result["error"]["trace_id"] == result["trace_id"]
 
 
-def test_rpc_tools_call_surfaces_stable_input_error_for_capacity_guardrail(client, monkeypatch):
+@pytest.mark.asyncio
+async def test_rpc_tools_call_surfaces_stable_input_error_for_capacity_guardrail(
+    asgi_rpc, monkeypatch
+):
     def raise_input_limit(*args, **kwargs):
         raise InputPayloadTooLargeError("Input exceeds ANALYST_MCP_MAX_INPUT_ROWS")
 
     monkeypatch.setattr(diagnostics_tool, "load_input", raise_input_limit)
-    payload = {
-        "jsonrpc": "2.0",
-        "id": 29,
-        "method": "tools/call",
-        "params": {"name": "diagnostics", "arguments": {"gcs_path": "gs://bucket/data.csv"}},
-    }
+    payload = _tool_call(29, "diagnostics", {"gcs_path": "gs://bucket/data.csv"})
 
-    response = client.post("/rpc", json=payload)
-    assert response.status_code == 200
-    result = response.json()["result"]
+    status, data = await asgi_rpc(payload)
+    assert status == 200
+    result = data["result"]
     assert result["status"] == "error"
     assert result["module"] == "diagnostics"
     assert result["code"] == "INPUT_PAYLOAD_TOO_LARGE"
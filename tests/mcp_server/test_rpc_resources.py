@@ -1,6 +1,6 @@
 import asyncio
 import json
-import time
+import threading
 
 import pytest
 
@@ -8,12 +8,17 @@ import analyst_toolkit.mcp_server.server as server_module
 import analyst_toolkit.mcp_server.tools.cockpit as cockpit_module
 
 
-def test_rpc_resources_list(client):
+async def _raise_timeout(*args, **kwargs):
+    raise asyncio.TimeoutError
+
+
+@pytest.mark.asyncio
+async def test_rpc_resources_list(asgi_rpc):
     """Verify template resources are discoverable via MCP resources/list."""
     payload = {"jsonrpc": "2.0", "id": 20, "method": "resources/list", "params": {}}
-    response = client.post("/rpc", json=payload)
-    assert response.status_code == 200
-    result = response.json()["result"]
+    status, data = await asgi_rpc(payload)
+    assert status == 200
+    result = data["result"]
     assert "resources" in result
     uris = [r["uri"] for r in result["resources"]]
     assert any(uri.startswith("analyst://templates/golden/") for uri in uris)
@@ -23,41 +28,45 @@ def test_rpc_resources_list(client):
     assert "analyst://catalog/capabilities" in uris
 
 
-def test_rpc_resource_templates_list(client):
+@pytest.mark.asyncio
+async def test_rpc_resource_templates_list(asgi_rpc):
     """Verify MCP resources/templates/list advertises template URI patterns by default."""
     payload = {"jsonrpc": "2.0", "id": 23, "method": "resources/templates/list", "params": {}}
-    response = client.post("/rpc", json=payload)
-    assert response.status_code == 200
-    result = response.json()["result"]
+    status, data = await asgi_rpc(payload)
+    assert status == 200
+    result = data["result"]
     assert "resourceTemplates" in result
     template_uris = [t["uriTemplate"] for t in result["resourceTemplates"]]
     assert "analyst://templates/config/{name}_template.yaml" in template_uris
     assert "analyst://templates/golden/{name}.yaml" in template_uris
 
 
-def test_rpc_resource_templates_list_when_enabled(client, monkeypatch):
+@pytest.mark.asyncio
+async def test_rpc_resource_templates_list_when_enabled(asgi_rpc, monkeypatch):
     """Verify MCP resources/templates/list returns URI templates when explicitly enabled."""
     monkeypatch.setattr(server_module, "ADVERTISE_RESOURCE_TEMPLATES", True)
     payload = {"jsonrpc": "2.0", "id": 35, "method": "resources/templates/list", "params": {}}
-    response = client.post("/rpc", json=payload)
-    assert response.status_code == 200
-    result = response.json()["result"]
+    status, data = await asgi_rpc(payload)
+    assert status == 200
+    result = data["result"]
     template_uris = [t["uriTemplate"] for t in result["resourceTemplates"]]
     assert "analyst://templates/config/{name}_template.yaml" in template_uris
     assert "analyst://templates/golden/{name}.yaml" in template_uris
 
 
-def test_rpc_resource_templates_list_when_disabled(client, monkeypatch):
+@pytest.mark.asyncio
+async def test_rpc_resource_templates_list_when_disabled(asgi_rpc, monkeypatch):
     """Verify MCP resources/templates/list can still be explicitly disabled."""
     monkeypatch.setattr(server_module, "ADVERTISE_RESOURCE_TEMPLATES", False)
     payload = {"jsonrpc": "2.0", "id": 36, "method": "resources/templates/list", "params": {}}
-    response = client.post("/rpc", json=payload)
-    assert response.status_code == 200
-    result = response.json()["result"]
+    status, data = await asgi_rpc(payload)
+    assert status == 200
+    result = data["result"]
     assert result["resourceTemplates"] == []
 
 
-def test_rpc_resources_read(client):
+@pytest.mark.asyncio
+async def test_rpc_resources_read(asgi_rpc):
     """Verify MCP resources/read returns YAML for a known template URI."""
     payload = {
         "jsonrpc": "2.0",
@@ -65,56 +74,59 @@ def test_rpc_resources_read(client):
         "method": "resources/read",
         "params": {"uri": "analyst://templates/golden/fraud_detection.yaml"},
     }
-    response = client.post("/rpc", json=payload)
-    assert response.status_code == 200
-    contents = response.json()["result"]["contents"]
+    status, data = await asgi_rpc(payload)
+    assert status == 200
+    contents = data["result"]["contents"]
     assert len(contents) == 1
     assert contents[0]["uri"] == "analyst://templates/golden/fraud_detection.yaml"
     assert "fraud" in contents[0]["text"].lower()
 
 
-def test_rpc_resources_read_auto_heal_template(client):
+@pytest.mark.asyncio
+async def test_rpc_resources_read_auto_heal_template(asgi_rpc):
     payload = {
         "jsonrpc": "2.0",
         "id": 121,
         "method": "resources/read",
         "params": {"uri": "analyst://templates/config/auto_heal_request_template.yaml"},
     }
-    response = client.post("/rpc", json=payload)
-    assert response.status_code == 200
-    contents = response.json()["result"]["contents"]
+    status, data = await asgi_rpc(payload)
+    assert status == 200
+    contents = data["result"]["contents"]
     assert len(contents) == 1
     assert contents[0]["uri"] == "analyst://templates/config/auto_heal_request_template.yaml"
     assert "auto_heal" in contents[0]["text"]
     assert "runtime" in contents[0]["text"]
 
 
-def test_rpc_resources_read_quickstart_doc(client):
+@pytest.mark.asyncio
+async def test_rpc_resources_read_quickstart_doc(asgi_rpc):
     payload = {
         "jsonrpc": "2.0",
         "id": 123,
         "method": "resources/read",
         "params": {"uri": "analyst://docs/quickstart"},
     }
-    response = client.post("/rpc", json=payload)
-    assert response.status_code == 200
-    contents = response.json()["result"]["contents"]
+    status, data = await asgi_rpc(payload)
+    assert status == 200
+    contents = data["result"]["contents"]
     assert len(contents) == 1
     assert contents[0]["uri"] == "analyst://docs/quickstart"
     assert contents[0]["mimeType"] == "text/markdown"
     assert "Analyst Toolkit Quickstart" in contents[0]["text"]
 
 
-def test_rpc_resources_read_capability_catalog(client):
+@pytest.mark.asyncio
+async def test_rpc_resources_read_capability_catalog(asgi_rpc):
     payload = {
         "jsonrpc": "2.0",
         "id": 124,
         "method": "resources/read",
         "params": {"uri": "analyst://catalog/capabilities"},
     }
-    response = client.post("/rpc", json=payload)
-    assert response.status_code == 200
-    contents = response.json()["result"]["contents"]
+    status, data = await asgi_rpc(payload)
+    assert status == 200
+    contents = data["result"]["contents"]
     assert len(contents) == 1
     assert contents[0]["uri"] == "analyst://catalog/capabilities"
     assert contents[0]["mimeType"] == "application/json"
@@ -123,23 +135,25 @@ def test_rpc_resources_read_capability_catalog(client):
     assert "modules" in catalog
 
 
-def test_rpc_resources_read_data_dictionary_template(client):
+@pytest.mark.asyncio
+async def test_rpc_resources_read_data_dictionary_template(asgi_rpc):
     payload = {
         "jsonrpc": "2.0",
         "id": 122,
         "method": "resources/read",
         "params": {"uri": "analyst://templates/config/data_dictionary_request_template.yaml"},
     }
-    response = client.post("/rpc", json=payload)
-    assert response.status_code == 200
-    contents = response.json()["result"]["contents"]
+    status, data = await asgi_rpc(payload)
+    assert status == 200
+    contents = data["result"]["contents"]
     assert len(contents) == 1
     assert contents[0]["uri"] == "analyst://templates/config/data_dictionary_request_template.yaml"
     assert "data_dictionary" in contents[0]["text"]
     assert "prelaunch_report" in contents[0]["text"]
 
 
-def test_rpc_resources_read_not_found(client):
+@pytest.mark.asyncio
+async def test_rpc_resources_read_not_found(asgi_rpc):
     """Verify resources/read returns invalid params for unknown resource URI."""
     payload = {
         "jsonrpc": "2.0",
@@ -147,9 +161,9 @@ def test_rpc_resources_read_not_found(client):
         "method": "resources/read",
         "params": {"uri": "analyst://templates/golden/does_not_exist.yaml"},
     }
-    response = client.post("/rpc", json=payload)
-    assert response.status_code == 200
-    error = response.json()["error"]
+    status, data = await asgi_rpc(payload)
+    assert status == 200
+    error = data["error"]
     assert error["code"] == -32602
     assert "Resource not found" in error["message"]
     assert error["data"]["error"]["code"] == "resource_not_found"
@@ -157,17 +171,14 @@ def test_rpc_resources_read_not_found(client):
     assert isinstance(error["data"]["error"]["trace_id"], str)
 
 
-def test_rpc_resources_list_timeout(client, mocker):
+@pytest.mark.asyncio
+async def test_rpc_resources_list_timeout(asgi_rpc, monkeypatch):
     """Verify resources/list surfaces timeout as a non-hanging RPC error."""
-    mocker.patch.object(
-        server_module,
-        "_resource_models_with_timeout",
-        mocker.AsyncMock(side_effect=asyncio.TimeoutError),
-    )
+    monkeypatch.setattr(server_module, "_resource_models_with_timeout", _raise_timeout)
     payload = {"jsonrpc": "2.0", "id": 26, "method": "resources/list", "params": {}}
-    response = client.post("/rpc", json=payload)
-    assert response.status_code == 200
-    error = response.json()["error"]
+    status, data = await asgi_rpc(payload)
+    assert status == 200
+    error = data["error"]
     assert error["code"] == -32000
     assert "timed out" in error["message"].lower()
     assert error["data"]["error"]["code"] == "resources_list_timeout"
@@ -175,22 +186,19 @@ def test_rpc_resources_list_timeout(client, mocker):
     assert isinstance(error["data"]["error"]["trace_id"], str)
 
 
-def test_rpc_resources_read_timeout(client, mocker):
+@pytest.mark.asyncio
+async def test_rpc_resources_read_timeout(asgi_rpc, monkeypatch):
     """Verify resources/read surfaces timeout as a non-hanging RPC error."""
-    mocker.patch.object(
-        server_module,
-        "_read_resource_with_timeout",
-        mocker.AsyncMock(side_effect=asyncio.TimeoutError),
-    )
+    monkeypatch.setattr(server_module, "_read_resource_with_timeout", _raise_timeout)
     payload = {
         "jsonrpc": "2.0",
         "id": 27,
         "method": "resources/read",
         "params": {"uri": "analyst://templates/config/outlier_config_template.yaml"},
     }
-    response = client.post("/rpc", json=payload)
-    assert response.status_code == 200
-    error = response.json()["error"]
+    status, data = await asgi_rpc(payload)
+    assert status == 200
+    error = data["error"]
     assert error["code"] == -32000
     assert "timed out" in error["message"].lower()
     assert error["data"]["error"]["code"] == "resource_read_timeout"
@@ -199,28 +207,25 @@ def test_rpc_resources_read_timeout(client, mocker):
 
 
 @pytest.mark.asyncio
-async def test_toolkit_get_capability_catalog_timeout(mocker):
+async def test_toolkit_get_capability_catalog_timeout(monkeypatch):
     """Verify capability catalog fails fast on template read timeout."""
-    mocker.patch.object(cockpit_module, "TEMPLATE_IO_TIMEOUT_SEC", 0.01)
-    mocker.patch.object(
-        cockpit_module,
-        "_build_capability_catalog",
-        side_effect=lambda: time.sleep(0.05),
-    )
+    monkeypatch.setattr(cockpit_module, "TEMPLATE_IO_TIMEOUT_SEC", 0.01)
+    # The worker thread outlives the timeout; releasing it lets loop teardown finish at once.
+    release = threading.Event()
+    monkeypatch.setattr(cockpit_module, "_build_capability_catalog", lambda: release.wait(1.0))
     result = await cockpit_module._toolkit_get_capability_catalog()
+    release.set()
     assert result["status"] == "error"
     assert "timed out" in result["error"].lower()
 
 
 @pytest.mark.asyncio
-async def test_toolkit_get_golden_templates_timeout(mocker):
+async def test_toolkit_get_golden_templates_timeout(monkeypatch):
     """Verify golden template loading fails fast on timeout."""
-    mocker.patch.object(cockpit_module, "TEMPLATE_IO_TIMEOUT_SEC", 0.01)
-    mocker.patch.object(
-        cockpit_module,
-        "get_golden_configs",
-        side_effect=lambda: time.sleep(0.05),
-    )
+    monkeypatch.setattr(cockpit_module, "TEMPLATE_IO_TIMEOUT_SEC", 0.01)
+    release = threading.Event()
+    monkeypatch.setattr(cockpit_module, "get_golden_configs", lambda: release.wait(1.0))
     result = await cockpit_module._toolkit_get_golden_templates()
+    release.set()
     assert result["status"] == "error"
     assert "timed out" in result["error"].lower()
@@ -1,7 +1,23 @@
+import pytest
+
 import analyst_toolkit.mcp_server.tools.cockpit as cockpit_module
 
 
-def test_rpc_get_run_history_supports_summary_modes(client, mocker):
+@pytest.fixture
+def stub_run_history(monkeypatch):
+    """Install a plain function returning a fresh copy of the given history entries."""
+
+    def install(history: list[dict]) -> None:
+        entries = tuple(history)
+        monkeypatch.setattr(
+            cockpit_module, "get_run_history", lambda *args, **kwargs: list(entries)
+        )
+
+    return install
+
+
+@pytest.mark.asyncio
+async def test_rpc_get_run_history_supports_summary_modes(asgi_rpc, stub_run_history):
     history = [
         {
             "module": "diagnostics",
@@ -22,7 +38,7 @@ def test_rpc_get_run_history_supports_summary_modes(client, mocker):
             "timestamp": "2026-02-25T00:02:00Z",
         },
     ]
-    mocker.patch.object(cockpit_module, "get_run_history", return_value=history)
+    stub_run_history(history)
 
     payload = {
         "jsonrpc": "2.0",
@@ -38,9 +54,9 @@ def test_rpc_get_run_history_supports_summary_modes(client, mocker):
             },
         },
     }
-    response = client.post("/rpc", json=payload)
-    assert response.status_code == 200
-    result = response.json()["result"]
+    status, data = await asgi_rpc(payload)
+    assert status == 200
+    result = data["result"]
     assert result["status"] == "pass"
     assert result["filters"]["failures_only"] is True
     assert result["filters"]["summary_only"] is True
@@ -53,7 +69,8 @@ def test_rpc_get_run_history_supports_summary_modes(client, mocker):
     assert result["latest_status_by_module"]["validation"]["status"] == "fail"
 
 
-def test_rpc_get_run_history_limit_and_summary_only(client, mocker):
+@pytest.mark.asyncio
+async def test_rpc_get_run_history_limit_and_summary_only(asgi_rpc, stub_run_history):
     history = [
         {
             "module": "diagnostics",
@@ -77,7 +94,7 @@ def test_rpc_get_run_history_limit_and_summary_only(client, mocker):
             "artifact_url": "https://example.com/c",
         },
     ]
-    mocker.patch.object(cockpit_module, "get_run_history", return_value=history)
+    stub_run_history(history)
 
     payload = {
         "jsonrpc": "2.0",
@@ -92,9 +109,9 @@ def test_rpc_get_run_history_limit_and_summary_only(client, mocker):
             },
         },
     }
-    response = client.post("/rpc", json=payload)
-    assert response.status_code == 200
-    result = response.json()["result"]
+    status, data = await asgi_rpc(payload)
+    assert status == 200
+    result = data["result"]
     assert result["status"] == "pass"
     assert result["filters"]["limit"] == 2
     assert result["filters"]["summary_only"] is True
@@ -107,21 +124,22 @@ def test_rpc_get_run_history_limit_and_summary_only(client, mocker):
     )
 
 
-def test_rpc_get_run_history_defaults_to_compact_mode(client, mocker):
+@pytest.mark.asyncio
+async def test_rpc_get_run_history_defaults_to_compact_mode(asgi_rpc, stub_run_history):
     history = [
         {"module": "diagnostics", "status": "pass", "summary": {"row_count": 1}, "timestamp": "t1"},
         {"module": "validation", "status": "pass", "summary": {"passed": True}, "timestamp": "t2"},
     ]
-    mocker.patch.object(cockpit_module, "get_run_history", return_value=history)
+    stub_run_history(history)
     payload = {
         "jsonrpc": "2.0",
         "id": 42,
         "method": "tools/call",
         "params": {"name": "get_run_history", "arguments": {"run_id": "run_defaults"}},
     }
-    response = client.post("/rpc", json=payload)
-    assert response.status_code == 200
-    result = response.json()["result"]
+    status, data = await asgi_rpc(payload)
+    assert status == 200
+    result = data["result"]
     assert result["status"] == "pass"
     assert result["filters"]["summary_only"] is True
     assert result["filters"]["limit"] == 50
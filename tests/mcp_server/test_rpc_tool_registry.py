@@ -1,27 +1,54 @@
+import json
+
 import pytest
-from fastapi.testclient import TestClient
 
+from analyst_toolkit.mcp_server import registry
 from analyst_toolkit.mcp_server.input.models import INPUT_ID_PATTERN
-from analyst_toolkit.mcp_server.server import TOOL_REGISTRY, app
+from analyst_toolkit.mcp_server.server import TOOL_REGISTRY
 
+pytestmark = pytest.mark.xdist_group(name="rpc_registry")
 
-def test_rpc_initialize(client):
-    """Verify the MCP 'initialize' method via JSON-RPC."""
-    payload = {"jsonrpc": "2.0", "id": 1, "method": "initialize", "params": {}}
-    response = client.post("/rpc", json=payload)
+# Read-only calls whose results the tests below only inspect; they go out as one batch.
+_READ_ONLY_CALLS = [
+    {"jsonrpc": "2.0", "id": 1, "method": "initialize", "params": {}},
+    {"jsonrpc": "2.0", "id": 2, "method": "tools/list", "params": {}},
+    {
+        "jsonrpc": "2.0",
+        "id": 29,
+        "method": "tools/call",
+        "params": {"name": "get_config_schema", "arguments": {"module_name": "final_audit"}},
+    },
+    {
+        "jsonrpc": "2.0",
+        "id": 30,
+        "method": "tools/call",
+        "params": {"name": "get_config_schema", "arguments": {"module_name": "outliers"}},
+    },
+]
+_READ_ONLY_BODY = json.dumps(_READ_ONLY_CALLS).encode("utf-8")
+
+
+@pytest.fixture(scope="module")
+def batched_rpc(client):
+    """Send the read-only calls as one JSON-RPC batch and index the responses by id."""
+    response = client.post(
+        "/rpc", content=_READ_ONLY_BODY, headers={"Content-Type": "application/json"}
+    )
     assert response.status_code == 200
-    result = response.json()["result"]
+    return {message["id"]: message for message in response.json()}
+
+
+def test_rpc_initialize(batched_rpc):
+    """Verify the MCP 'initialize' method via JSON-RPC."""
+    result = batched_rpc[1]["result"]
     assert result["protocolVersion"] == "2024-05-01"
     assert result["serverInfo"]["name"] == "analyst-toolkit"
     assert "resources" in result["capabilities"]
 
 
-def test_rpc_tools_list(client):
+def test_rpc_tools_list(batched_rpc):
     """Verify the MCP 'tools/list' method returns registered tool schemas."""
-    payload = {"jsonrpc": "2.0", "id": 2, "method": "tools/list", "params": {}}
-    response = client.post("/rpc", json=payload)
-    assert response.status_code == 200
-    result = response.json()["result"]
+    result = batched_rpc[2]["result"]
     assert "tools" in result
     tool_names = [t["name"] for t in result["tools"]]
     assert "diagnostics" in tool_names
@@ -42,12 +69,9 @@ def test_rpc_tools_list(client):
     assert "get_agent_instructions" not in tool_names
 
 
-def test_rpc_tools_list_exposes_data_dictionary_input_id_schema(client):
+def test_rpc_tools_list_exposes_data_dictionary_input_id_schema(batched_rpc):
     """Verify data_dictionary advertises the shared input_id schema."""
-    payload = {"jsonrpc": "2.0", "id": 33, "method": "tools/list", "params": {}}
-    response = client.post("/rpc", json=payload)
-    assert response.status_code == 200
-    tools = response.json()["result"]["tools"]
+    tools = batched_rpc[2]["result"]["tools"]
     data_dictionary = next(tool for tool in tools if tool["name"] == "data_dictionary")
     input_schema = data_dictionary["inputSchema"]
 
@@ -55,12 +79,9 @@ def test_rpc_tools_list_exposes_data_dictionary_input_id_schema(client):
     assert "mutually exclusive" in input_schema["properties"]["input_id"]["description"].lower()
 
 
-def test_rpc_tools_list_standardizes_input_id_pattern_across_tool_schemas(client):
+def test_rpc_tools_list_standardizes_input_id_pattern_across_tool_schemas(batched_rpc):
     """Verify all remaining bespoke tool schemas reuse the shared input_id contract."""
-    payload = {"jsonrpc": "2.0", "id": 34, "method": "tools/list", "params": {}}
-    response = client.post("/rpc", json=payload)
-    assert response.status_code == 200
-    tools = {tool["name"]: tool for tool in response.json()["result"]["tools"]}
+    tools = {tool["name"]: tool for tool in batched_rpc[2]["result"]["tools"]}
 
     for tool_name in ("infer_configs", "auto_heal", "get_input_descriptor"):
         assert tool_name in tools, f"Expected tool '{tool_name}' not found in tools/list response"
@@ -69,45 +90,85 @@ def test_rpc_tools_list_standardizes_input_id_pattern_across_tool_schemas(client
         assert "Canonical server-managed input reference" in input_id_schema["description"]
 
 
-def test_rpc_get_config_schema_supports_final_audit(client):
-    """Verify get_config_schema returns final_audit schema."""
-    payload = {
-        "jsonrpc": "2.0",
-        "id": 29,
-        "method": "tools/call",
-        "params": {"name": "get_config_schema", "arguments": {"module_name": "final_audit"}},
-    }
-    response = client.post("/rpc", json=payload)
-    assert response.status_code == 200
-    result = response.json()["result"]
+def _check_final_audit_schema(schema):
+    """final_audit exposes its certification block."""
+    assert schema["properties"]["certification"]["$ref"]
+
+
+def _check_outliers_schema(schema):
+    """outliers exposes the canonical outlier_detection.detection_specs path."""
+    outlier_ref = schema["properties"]["outlier_detection"]["$ref"]
+    assert outlier_ref.endswith("OutlierDetectionConfig")
+    assert "detection_specs" in schema["$defs"]["OutlierDetectionConfig"]["properties"]
+
+
+@pytest.mark.parametrize(
+    "request_id,module_name,checker",
+    [
+        (29, "final_audit", _check_final_audit_schema),
+        (30, "outliers", _check_outliers_schema),
+    ],
+)
+def test_rpc_get_config_schema_matches_runtime_contract(
+    batched_rpc, request_id, module_name, checker
+):
+    """Verify get_config_schema returns each module's runtime contract from the batch."""
+    result = batched_rpc[request_id]["result"]
     assert result["status"] == "pass"
-    assert result["module"] == "final_audit"
-    props = result["schema"]["properties"]
-    assert "certification" in props
-    cert_props = props["certification"]["$ref"]
-    assert cert_props
+    assert result["module"] == module_name
+    checker(result["schema"])
 
 
-def test_rpc_get_config_schema_outliers_matches_runtime_contract_paths(client):
-    """Verify outliers schema exposes canonical outlier_detection.detection_specs path."""
-    payload = {
+def test_tool_descriptors_are_reused_until_next_registration(monkeypatch):
+    monkeypatch.setattr(registry, "TOOL_REGISTRY", {})
+    monkeypatch.setattr(registry, "_TOOL_DESCRIPTORS", None)
+
+    registry.register_tool("first", lambda: {}, "First tool.", {"type": "object"})
+    descriptors = registry.tool_descriptors()
+    assert registry.tool_descriptors() is descriptors
+    assert [d["name"] for d in descriptors] == ["first"]
+
+    registry.register_tool("second", lambda: {}, "Second tool.", {"type": "object"})
+    assert [d["name"] for d in registry.tool_descriptors()] == ["first", "second"]
+
+
+def test_tool_descriptors_follow_direct_registry_writes(monkeypatch):
+    """Writes that bypass register_tool still show up in tools/list."""
+    tools = {"kept": {"fn": None, "description": "Kept.", "inputSchema": {}}}
+    monkeypatch.setattr(registry, "_TOOL_DESCRIPTORS", None)
+    assert [d["name"] for d in registry.tool_descriptors(tools)] == ["kept"]
+
+    tools["added"] = {"fn": None, "description": "Added.", "inputSchema": {}}
+    assert [d["name"] for d in registry.tool_descriptors(tools)] == ["kept", "added"]
+
+    tools["added"] = {"fn": None, "description": "Replaced.", "inputSchema": {}}
+    assert registry.tool_descriptors(tools)[1]["description"] == "Replaced."
+
+    del tools["kept"]
+    assert [d["name"] for d in registry.tool_descriptors(tools)] == ["added"]
+
+
+def test_rpc_tools_list_matches_tools_call_registry(client, monkeypatch):
+    """tools/list and tools/call read the same registry, including test-only entries."""
+
+    async def _ping(**_kwargs):
+        return {"status": "pass"}
+
+    payload = {"jsonrpc": "2.0", "id": 31, "method": "tools/list", "params": {}}
+    client.post("/rpc", json=payload)
+    monkeypatch.setitem(
+        TOOL_REGISTRY, "test_ping", {"fn": _ping, "description": "Ping.", "inputSchema": {}}
+    )
+
+    listed = client.post("/rpc", json=payload).json()["result"]["tools"]
+    assert "test_ping" in [tool["name"] for tool in listed]
+    call = {
         "jsonrpc": "2.0",
-        "id": 30,
+        "id": 32,
         "method": "tools/call",
-        "params": {"name": "get_config_schema", "arguments": {"module_name": "outliers"}},
+        "params": {"name": "test_ping", "arguments": {}},
     }
-    response = client.post("/rpc", json=payload)
-    assert response.status_code == 200
-    result = response.json()["result"]
-    assert result["status"] == "pass"
-    assert result["module"] == "outliers"
-    props = result["schema"]["properties"]
-    assert "outlier_detection" in props
-    outlier_ref = props["outlier_detection"]["$ref"]
-    assert outlier_ref.endswith("OutlierDetectionConfig")
-    defs = result["schema"]["$defs"]
-    detection_props = defs["OutlierDetectionConfig"]["properties"]
-    assert "detection_specs" in detection_props
+    assert client.post("/rpc", json=call).json()["result"]["status"] == "pass"
 
 
 def test_rpc_tool_not_found(client):
@@ -126,18 +187,18 @@ def test_rpc_tool_not_found(client):
 
 
 @pytest.mark.asyncio
-async def test_rpc_tool_invocation_structure(mocker):
+async def test_rpc_tool_invocation_structure(asgi_rpc, monkeypatch):
     """
     Verify that tools/call correctly dispatches to the registered function.
     Mocks the actual diagnostics tool to avoid data loading/GCS overhead.
     """
     mock_result = {"status": "pass", "module": "diagnostics", "summary": {"test": True}}
 
-    mocker.patch.dict(
-        TOOL_REGISTRY["diagnostics"], {"fn": mocker.AsyncMock(return_value=mock_result)}
-    )
+    async def _diagnostics(**kwargs):
+        return mock_result
+
+    monkeypatch.setitem(TOOL_REGISTRY["diagnostics"], "fn", _diagnostics)
 
-    client = TestClient(app)
     payload = {
         "jsonrpc": "2.0",
         "id": 4,
@@ -147,9 +208,9 @@ async def test_rpc_tool_invocation_structure(mocker):
             "arguments": {"gcs_path": "gs://fake/data.parquet"},
         },
     }
-    response = client.post("/rpc", json=payload)
-    assert response.status_code == 200
-    result = response.json()["result"]
+    status, data = await asgi_rpc(payload)
+    assert status == 200
+    result = data["result"]
     assert result["status"] == mock_result["status"]
     assert result["module"] == mock_result["module"]
     assert result["summary"] == mock_result["summary"]
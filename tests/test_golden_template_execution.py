@@ -12,8 +12,12 @@ import analyst_toolkit.mcp_server.tools.outliers as outliers_tool
 import analyst_toolkit.mcp_server.tools.validation as validation_tool
 from analyst_toolkit.mcp_server.templates import get_golden_configs
 
+pytestmark = pytest.mark.xdist_group(name="golden_templates")
 
-def _sample_df() -> pd.DataFrame:
+
+@pytest.fixture(scope="module")
+def golden_df() -> pd.DataFrame:
+    """One sample frame for the module; tests and mocked pipelines only read it."""
     return pd.DataFrame(
         {
             "transaction_amount": [10.0, 25000.0, 42.5],
@@ -33,34 +37,61 @@ def _sample_df() -> pd.DataFrame:
     )
 
 
-def _patch_common_module(mocker, module, df: pd.DataFrame, session_id: str):
-    mocker.patch.object(module, "load_input", return_value=df.copy())
-    mocker.patch.object(module, "save_to_session", return_value=session_id)
-    mocker.patch.object(module, "get_session_metadata", return_value={"row_count": len(df)})
-    mocker.patch.object(module, "save_output", return_value="gs://dummy/output.csv")
-    mocker.patch.object(module, "append_to_run_history", return_value=None)
-    mocker.patch.object(module, "should_export_html", return_value=False)
+@pytest.fixture(scope="module")
+def golden_templates() -> dict:
+    return get_golden_configs()
+
+
+_GOLDEN_TOOL_MODULES = (
+    duplicates_tool,
+    imputation_tool,
+    normalization_tool,
+    outliers_tool,
+    validation_tool,
+)
+
+
+def _returns(value):
+    """Plain stand-in for ``MagicMock(return_value=value)``; no test inspects calls."""
+    return lambda *args, **kwargs: value
+
+
+@pytest.fixture(scope="module", autouse=True)
+def stub_tool_io(golden_df):
+    """Stub session/storage I/O on every tool module once for the whole file.
+
+    ``load_input`` is the one place the tools receive a frame they may modify in place,
+    so it is the only stub that hands out a copy.
+    """
+    df = golden_df
+    with pytest.MonkeyPatch.context() as mp:
+        for module in _GOLDEN_TOOL_MODULES:
+            mp.setattr(module, "load_input", lambda *args, **kwargs: df.copy())
+            mp.setattr(module, "save_to_session", _returns("sess_golden"))
+            mp.setattr(module, "get_session_metadata", _returns({"row_count": len(df)}))
+            mp.setattr(module, "save_output", _returns("gs://dummy/output.csv"))
+            mp.setattr(module, "append_to_run_history", _returns(None))
+            mp.setattr(module, "should_export_html", _returns(False))
+        yield
 
 
 @pytest.mark.asyncio
-async def test_golden_fraud_template_executes_across_modules(mocker):
-    templates = get_golden_configs()
-    fraud = templates["fraud_detection"]
-    df = _sample_df()
+async def test_golden_fraud_template_executes_across_modules(
+    golden_templates, golden_df, monkeypatch
+):
+    fraud = golden_templates["fraud_detection"]
+    df = golden_df
     run_id = "golden_fraud_smoke"
     session_id = "sess_golden_fraud"
 
     # Outliers (verify shorthand converts to canonical detection_specs)
-    _patch_common_module(mocker, outliers_tool, df, session_id)
     captured = {}
 
     def fake_outlier_pipeline(config, df, notebook, run_id):
         captured["cfg"] = config
-        return df.copy(), {"outlier_log": pd.DataFrame(columns=["column"])}
+        return df, {"outlier_log": pd.DataFrame(columns=["column"])}
 
-    mocker.patch.object(
-        outliers_tool, "run_outlier_detection_pipeline", side_effect=fake_outlier_pipeline
-    )
+    monkeypatch.setattr(outliers_tool, "run_outlier_detection_pipeline", fake_outlier_pipeline)
     out_res = await outliers_tool._toolkit_outliers(
         session_id=session_id,
         run_id=run_id,
@@ -72,11 +103,8 @@ async def test_golden_fraud_template_executes_across_modules(mocker):
     assert specs["frequency_24h"]["method"] == "iqr"
 
     # Duplicates
-    _patch_common_module(mocker, duplicates_tool, df, session_id)
-    mocker.patch.object(
-        duplicates_tool,
-        "run_duplicates_pipeline",
-        return_value=df.assign(is_duplicate=False),
+    monkeypatch.setattr(
+        duplicates_tool, "run_duplicates_pipeline", _returns(df.assign(is_duplicate=False))
     )
     dup_res = await duplicates_tool._toolkit_duplicates(
         session_id=session_id,
@@ -86,8 +114,7 @@ async def test_golden_fraud_template_executes_across_modules(mocker):
     assert dup_res["status"] in {"pass", "warn"}
 
     # Validation
-    _patch_common_module(mocker, validation_tool, df, session_id)
-    mocker.patch.object(validation_tool, "run_validation_pipeline", return_value=df)
+    monkeypatch.setattr(validation_tool, "run_validation_pipeline", _returns(df))
     val_res = await validation_tool._toolkit_validation(
         session_id=session_id,
         run_id=run_id,
@@ -97,15 +124,13 @@ async def test_golden_fraud_template_executes_across_modules(mocker):
 
 
 @pytest.mark.asyncio
-async def test_golden_quick_migration_template_executes(mocker):
-    templates = get_golden_configs()
-    quick = templates["quick_migration"]
-    df = _sample_df()
+async def test_golden_quick_migration_template_executes(golden_templates, golden_df, monkeypatch):
+    quick = golden_templates["quick_migration"]
+    df = golden_df
     run_id = "golden_quick_migration_smoke"
     session_id = "sess_golden_quick"
 
-    _patch_common_module(mocker, normalization_tool, df, session_id)
-    mocker.patch.object(normalization_tool, "run_normalization_pipeline", return_value=df.copy())
+    monkeypatch.setattr(normalization_tool, "run_normalization_pipeline", _returns(df))
     norm_res = await normalization_tool._toolkit_normalization(
         session_id=session_id,
         run_id=run_id,
@@ -113,8 +138,7 @@ async def test_golden_quick_migration_template_executes(mocker):
     )
     assert norm_res["status"] in {"pass", "warn"}
 
-    _patch_common_module(mocker, imputation_tool, df, session_id)
-    mocker.patch.object(imputation_tool, "run_imputation_pipeline", return_value=df.fillna(""))
+    monkeypatch.setattr(imputation_tool, "run_imputation_pipeline", _returns(df.fillna("")))
     imp_res = await imputation_tool._toolkit_imputation(
         session_id=session_id,
         run_id=run_id,
@@ -124,15 +148,15 @@ async def test_golden_quick_migration_template_executes(mocker):
 
 
 @pytest.mark.asyncio
-async def test_golden_compliance_template_executes_validation(mocker):
-    templates = get_golden_configs()
-    compliance = templates["compliance_audit"]
-    df = _sample_df()
+async def test_golden_compliance_template_executes_validation(
+    golden_templates, golden_df, monkeypatch
+):
+    compliance = golden_templates["compliance_audit"]
+    df = golden_df
     run_id = "golden_compliance_smoke"
     session_id = "sess_golden_compliance"
 
-    _patch_common_module(mocker, validation_tool, df, session_id)
-    mocker.patch.object(validation_tool, "run_validation_pipeline", return_value=df)
+    monkeypatch.setattr(validation_tool, "run_validation_pipeline", _returns(df))
     res = await validation_tool._toolkit_validation(
         session_id=session_id,
         run_id=run_id,
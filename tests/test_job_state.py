@@ -1,8 +1,10 @@
 """test_job_state.py — persistence and concurrency checks for async job store."""
 
+import json
 import threading
 import time
 
+from analyst_toolkit.mcp_server import job_state
 from analyst_toolkit.mcp_server.job_state import JobStore
 
 
@@ -21,7 +23,9 @@ def test_job_store_persists_and_recovers(tmp_path, monkeypatch):
     JobStore.mark_running(job_id)
     JobStore.mark_succeeded(job_id, result={"status": "pass"})
 
-    assert path.exists()
+    journal = path.with_suffix(".jsonl")
+    assert len(journal.read_text(encoding="utf-8").splitlines()) == 3
+    assert not path.exists()
 
     # Simulate process restart / fresh interpreter load.
     monkeypatch.setattr(JobStore, "_jobs", {})
@@ -129,3 +133,81 @@ def test_job_store_does_not_prune_in_flight_jobs(tmp_path, monkeypatch):
     assert first_succeeded_job is None
     assert second_succeeded_job is not None
     assert second_succeeded_job["state"] == "succeeded"
+
+
+def test_job_store_stores_private_json_safe_payloads(tmp_path, monkeypatch):
+    path = _reset_job_store(tmp_path, monkeypatch)
+    inputs = {"paths": [tmp_path / "data.csv"]}
+    result = {"report": {"rows": 3}}
+
+    job_id = JobStore.create(module="auto_heal", inputs=inputs)
+    JobStore.mark_succeeded(job_id, result=result)
+    inputs["paths"].append("late")
+    result["report"]["rows"] = 99
+
+    job = JobStore.get(job_id)
+    assert job["inputs"] == {"paths": [str(tmp_path / "data.csv")]}
+    assert job["result"] == {"report": {"rows": 3}}
+    last_record = path.with_suffix(".jsonl").read_text(encoding="utf-8").splitlines()[-1]
+    assert json.loads(last_record)["result"] == {"report": {"rows": 3}}
+
+
+def test_job_store_compacts_journal_into_snapshot(tmp_path, monkeypatch):
+    path = _reset_job_store(tmp_path, monkeypatch)
+    monkeypatch.setattr(job_state, "_COMPACT_MIN_LINES", 4)
+    journal = path.with_suffix(".jsonl")
+
+    job_id = JobStore.create(module="auto_heal", run_id="run_1")
+    for _ in range(9):
+        JobStore.mark_running(job_id)
+    assert len(journal.read_text(encoding="utf-8").splitlines()) == 10
+
+    # The eleventh record passes ten lines per retained job and folds into the snapshot.
+    JobStore.mark_running(job_id)
+    assert not journal.exists()
+    assert json.loads(path.read_text(encoding="utf-8"))[job_id]["state"] == "running"
+
+    JobStore.mark_succeeded(job_id, result={"status": "pass"})
+    monkeypatch.setattr(JobStore, "_jobs", {})
+    monkeypatch.setattr(JobStore, "_loaded", False)
+
+    recovered = JobStore.get(job_id)
+    assert recovered["state"] == "succeeded"
+    assert recovered["result"] == {"status": "pass"}
+
+
+def test_job_store_replay_skips_torn_journal_line(tmp_path, monkeypatch):
+    path = _reset_job_store(tmp_path, monkeypatch)
+    job_id = JobStore.create(module="auto_heal")
+    JobStore.mark_running(job_id)
+    with open(path.with_suffix(".jsonl"), "a", encoding="utf-8") as f:
+        f.write('{"job_id": "job_torn", "state": "succ')
+
+    monkeypatch.setattr(JobStore, "_jobs", {})
+    monkeypatch.setattr(JobStore, "_loaded", False)
+
+    assert JobStore.get(job_id)["state"] == "running"
+    assert JobStore.get("job_torn") is None
+
+
+def test_job_store_compacts_torn_journal_before_the_next_append(tmp_path, monkeypatch):
+    path = _reset_job_store(tmp_path, monkeypatch)
+    journal = path.with_suffix(".jsonl")
+    job_id = JobStore.create(module="auto_heal")
+    JobStore.mark_running(job_id)
+    with open(journal, "a", encoding="utf-8") as f:
+        f.write('{"job_id": "job_torn", "state": "succ')
+
+    # Restart, then record a terminal update on top of the torn journal.
+    monkeypatch.setattr(JobStore, "_jobs", {})
+    monkeypatch.setattr(JobStore, "_loaded", False)
+    JobStore.mark_succeeded(job_id, result={"status": "pass"})
+    assert all(json.loads(line) for line in journal.read_text(encoding="utf-8").splitlines())
+
+    # A second restart must still see the committed update.
+    monkeypatch.setattr(JobStore, "_jobs", {})
+    monkeypatch.setattr(JobStore, "_loaded", False)
+    recovered = JobStore.get(job_id)
+    assert recovered["state"] == "succeeded"
+    assert recovered["result"] == {"status": "pass"}
+    assert JobStore.get("job_torn") is None
@@ -3,6 +3,7 @@ from pathlib import Path
 import pandas as pd
 import pytest
 
+import analyst_toolkit.mcp_server.io as io_module
 import analyst_toolkit.mcp_server.tools.diagnostics as diagnostics_tool
 import analyst_toolkit.mcp_server.tools.duplicates as duplicates_tool
 import analyst_toolkit.mcp_server.tools.final_audit as final_audit_tool
@@ -605,6 +606,51 @@ async def test_imputation_runtime_can_disable_plot_artifacts(mocker):
     assert result["artifact_matrix"]["html_report"]["expected"] is True
 
 
+@pytest.mark.asyncio
+async def test_imputation_delivers_reports_and_plots_in_one_batch(mocker, monkeypatch, tmp_path):
+    monkeypatch.chdir(tmp_path)
+    run_id = "imp_batched_delivery"
+    plot_dir = Path("exports/plots/imputation")
+    plot_dir.mkdir(parents=True)
+    (plot_dir / f"value_{run_id}.png").write_bytes(b"png")
+    df = pd.DataFrame({"value": [1.0, None]})
+
+    mocker.patch.object(imputation_tool, "load_input", return_value=df)
+    mocker.patch.object(imputation_tool, "run_imputation_pipeline", return_value=df.fillna(0.0))
+    mocker.patch.object(imputation_tool, "save_to_session", return_value="sess_imp")
+    mocker.patch.object(imputation_tool, "get_session_metadata", return_value={"row_count": 2})
+    mocker.patch.object(imputation_tool, "save_output", return_value="gs://bucket/imp.csv")
+    mocker.patch.object(imputation_tool, "append_to_run_history", return_value=None)
+    mocker.patch.object(imputation_tool, "should_export_html", return_value=True)
+    delivered_modules = {}
+
+    def fake_deliver_artifact(local_path, run_id, module, **kwargs):
+        delivered_modules[Path(local_path).name] = module
+        return {
+            "reference": "",
+            "local_path": local_path,
+            "url": f"https://example.com/{Path(local_path).name}",
+            "warnings": [],
+            "destinations": {},
+        }
+
+    mocker.patch.object(imputation_tool, "deliver_artifact", side_effect=fake_deliver_artifact)
+    deliver_many = mocker.spy(io_module, "deliver_many")
+
+    result = await imputation_tool._toolkit_imputation(
+        session_id="sess_imp", run_id=run_id, config={}
+    )
+
+    assert deliver_many.call_count == 1
+    assert delivered_modules == {
+        f"{run_id}_imputation_report.html": "imputation",
+        f"{run_id}_imputation_report.xlsx": "imputation",
+        f"value_{run_id}.png": "imputation/plots",
+    }
+    assert result["artifact_url"] == f"https://example.com/{run_id}_imputation_report.html"
+    assert result["plot_urls"] == {f"value_{run_id}.png": f"https://example.com/value_{run_id}.png"}
+
+
 @pytest.mark.asyncio
 async def test_outliers_disabled_html_when_no_outliers(mocker):
     """When outlier detection finds 0 outliers, HTML/XLSX should be disabled, not missing."""
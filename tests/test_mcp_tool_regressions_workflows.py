@@ -783,3 +783,35 @@ async def test_auto_heal_worker_marks_failed_when_result_status_is_error(mocker)
     assert job is not None
     assert job["state"] == "failed"
     assert job["error"]["terminal_result_status"] == "error"
+
+
+@pytest.mark.asyncio
+async def test_toolkit_drift_detection_compares_numeric_means_and_dtypes(mocker):
+    base_df = pd.DataFrame(
+        {"value": [1.0, 3.0], "count": [1, 2], "flag": [True, False], "label": ["a", "b"]}
+    )
+    target_df = pd.DataFrame(
+        {"value": [2.0, 6.0], "count": [1.0, 2.0], "flag": [True, True], "extra": [0, 0]}
+    )
+    frames = iter([base_df, target_df])
+
+    mocker.patch.object(drift_tool, "load_input", side_effect=lambda *_, **__: next(frames))
+    mocker.patch.object(drift_tool, "save_output", return_value="gs://dummy/drift.csv")
+    mocker.patch.object(drift_tool, "append_to_run_history", return_value=None)
+
+    result = await drift_tool._toolkit_drift_detection(
+        base_path="gs://bucket/base.csv",
+        target_path="gs://bucket/target.csv",
+        run_id="drift_metrics",
+    )
+
+    assert list(result["numeric_drift"]) == ["value", "count", "flag"]
+    assert result["numeric_drift"]["value"] == {
+        "base_mean": 2.0,
+        "target_mean": 4.0,
+        "diff_pct": 1.0,
+    }
+    assert result["numeric_drift"]["flag"]["target_mean"] == 1.0
+    assert result["dtype_changes"] == {"count": {"base": "int64", "target": "float64"}}
+    assert result["added_columns"] == ["extra"]
+    assert result["removed_columns"] == ["label"]
@@ -0,0 +1,113 @@
+"""
+test_outlier_handling.py — Core logic tests for M06 Outlier Handling.
+"""
+
+import pandas as pd
+
+from analyst_toolkit.m05_detect_outliers.detect_outliers import detect_outliers
+from analyst_toolkit.m06_outlier_handling.outlier_handler import handle_outliers
+
+
+def _detect(df: pd.DataFrame) -> dict:
+    return detect_outliers(df, {"detection_specs": {"__default__": {"method": "iqr"}}})
+
+
+def test_clip_strategy_clamps_only_flagged_values():
+    """Clip writes bounds into flagged cells and leaves the input frame untouched."""
+    df = pd.DataFrame({"val": [1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0, 8.0, 9.0, 100.0]})
+    detection = _detect(df)
+    upper = detection["outlier_log"].iloc[0]["upper_bound"]
+
+    handled, log = handle_outliers(df, detection, {"handling_specs": {"val": {"strategy": "clip"}}})
+
+    assert handled["val"].iloc[-1] == upper
+    assert handled["val"].iloc[:-1].tolist() == df["val"].iloc[:-1].tolist()
+    assert df["val"].iloc[-1] == 100.0
+    assert log.iloc[0]["outliers_handled"] == 1
+
+
+def test_median_on_integer_column_upcasts_like_pandas():
+    """A fractional replacement on an int column upcasts instead of truncating."""
+    df = pd.DataFrame({"val": [1, 2, 3, 4, 5, 6, 7, 8, 100, 200]})
+    detection = _detect(df)
+
+    handled, _ = handle_outliers(df, detection, {"handling_specs": {"val": {"strategy": "median"}}})
+
+    assert handled["val"].dtype.kind == "f"
+    assert handled["val"].iloc[-1] == 5.5
+
+
+def test_constant_strategy_on_float_column():
+    """Constant fills land only on flagged rows."""
+    df = pd.DataFrame({"val": [1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0, 8.0, 9.0, -100.0]})
+    detection = _detect(df)
+
+    handled, _ = handle_outliers(
+        df, detection, {"handling_specs": {"val": {"strategy": "constant", "fill_value": 0}}}
+    )
+
+    assert handled["val"].tolist() == [1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0, 8.0, 9.0, 0.0]
+
+
+def test_in_place_strategies_leave_input_frame_untouched():
+    """Handled columns are copied on write, including the ``.loc`` fallback path."""
+    df = pd.DataFrame(
+        {
+            "val": [1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0, 8.0, 9.0, 100.0],
+            "cnt": pd.array([1, 2, 3, 4, 5, 6, 7, 8, 9, 100], dtype="Int64"),
+        }
+    )
+    original = df.copy()
+    specs = {
+        "val": {"strategy": "median"},
+        "cnt": {"strategy": "constant", "fill_value": 0},
+    }
+
+    handled, log = handle_outliers(df, _detect(df), {"handling_specs": specs})
+
+    pd.testing.assert_frame_equal(df, original)
+    assert handled["val"].iloc[-1] == 5.5
+    assert handled["cnt"].iloc[-1] == 0
+    assert len(log) == 2
+
+
+def test_global_drop_removes_rows_flagged_in_any_column():
+    """Global drop removes every row with at least one flag and logs the count."""
+    df = pd.DataFrame(
+        {
+            "a": [1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0, 8.0, 9.0, 100.0],
+            "b": [-50.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0, 8.0, 9.0, 10.0],
+        },
+        index=list("abcdefghij"),
+    )
+
+    handled, log = handle_outliers(
+        df, _detect(df), {"handling_specs": {"__global__": {"strategy": "drop"}}}
+    )
+
+    assert list(handled.index) == list("bcdefghi")
+    assert log.iloc[0]["outliers_handled"] == 2
+
+
+def test_handling_pipeline_reports_changes_against_untouched_input():
+    """The pipeline's audit compares against the caller's frame, which stays unmodified."""
+    from analyst_toolkit.m06_outlier_handling.run_handling_pipeline import (
+        run_outlier_handling_pipeline,
+    )
+
+    df = pd.DataFrame({"val": [1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0, 8.0, 9.0, 100.0]})
+    original = df.copy()
+
+    handled = run_outlier_handling_pipeline(
+        config={
+            "handling_specs": {"val": {"strategy": "clip"}},
+            "settings": {"show_inline": False},
+            "logging": "off",
+        },
+        df=df,
+        detection_results=_detect(df),
+        run_id="handling_alias",
+    )
+
+    pd.testing.assert_frame_equal(df, original)
+    assert handled["val"].iloc[-1] < 100.0
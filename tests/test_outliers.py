@@ -2,6 +2,8 @@
 test_outliers.py — Core logic tests for M05 Outlier Detection.
 """
 
+from pathlib import Path
+
 import pandas as pd
 import pytest
 
@@ -53,3 +55,270 @@ def test_outlier_flags_fill_false_for_null_rows():
 
     assert list(flags.columns) == ["val_iqr_outlier"]
     assert flags["val_iqr_outlier"].tolist() == [False, False, False, False, False, True]
+
+
+def test_mixed_methods_build_flags_and_rows_in_one_pass():
+    """Per-column methods are honored and rows with any flag are returned once."""
+    df = pd.DataFrame(
+        {
+            "a": [1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0, 8.0, 9.0, 50.0],
+            "b": [10] * 9 + [1000],
+            "skip": [1, 2, 3, 4, 5, 6, 7, 8, 9, 99],
+        }
+    )
+    config = {
+        "detection_specs": {
+            "a": {"method": "iqr"},
+            "b": {"method": "zscore", "zscore_threshold": 2.0},
+        }
+    }
+
+    results = detect_outliers(df, config)
+
+    assert results["outlier_log"]["column"].tolist() == ["a", "b"]
+    assert list(results["outlier_flags"].columns) == ["a_iqr_outlier", "b_zscore_outlier"]
+    assert results["outlier_rows"].index.tolist() == [9]
+
+
+def test_outlier_rows_are_independent_of_the_input_frame():
+    """Editing the reported outlier rows leaves the input untouched and raises no warning."""
+    import warnings
+
+    df = pd.DataFrame({"val": [1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0, 8.0, 9.0, 100.0]})
+    rows = detect_outliers(df, {"detection_specs": {"val": {"method": "iqr"}}})["outlier_rows"]
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        rows.loc[9, "val"] = 0.0
+
+    assert df["val"].iloc[-1] == 100.0
+
+
+def test_compiled_flag_kernel_matches_numpy(monkeypatch):
+    """The optional numba sweep flags the same cells as the NumPy path."""
+    pytest.importorskip("numba")
+    import numpy as np
+
+    from analyst_toolkit.m05_detect_outliers import outlier_kernels
+
+    rng = np.random.default_rng(0)
+    values = np.asfortranarray(rng.normal(size=(500, 4)))
+    values[::7, 1] = np.nan
+    lower = np.array([-1.0, -2.0, np.nan, 0.0])
+    upper = np.array([1.0, 2.0, np.nan, np.inf])
+
+    expected_mask, expected_counts = outlier_kernels._flag_numpy(values, lower, upper)
+    monkeypatch.setattr(outlier_kernels, "KERNEL_MIN_CELLS", 0)
+
+    for layout in (values, np.ascontiguousarray(values)):
+        mask, counts = outlier_kernels.flag_outside_bounds(layout, lower, upper)
+        assert np.array_equal(mask, expected_mask)
+        assert counts.tolist() == expected_counts.tolist()
+
+
+def test_outlier_plots_are_saved_without_pyplot_figures(tmp_path):
+    """Plots render straight to PNG and leave no figures registered with pyplot."""
+    import matplotlib.pyplot as plt
+
+    from analyst_toolkit.m05_detect_outliers.plot_outliers import generate_outlier_plots
+
+    df = pd.DataFrame({"val": [1, 2, 3, 4, 5, 6, 7, 8, 9, 20], "grp": list("ab") * 5})
+    outlier_log = detect_outliers(df, {"detection_specs": {"val": {"method": "iqr"}}})[
+        "outlier_log"
+    ]
+    open_before = plt.get_fignums()
+
+    paths = generate_outlier_plots(
+        df, outlier_log, {"plot_save_dir": str(tmp_path), "run_id": "t", "hue": "grp"}
+    )
+
+    assert len(paths["val"]) == 3
+    assert all(Path(p).stat().st_size > 0 for p in paths["val"])
+    assert plt.get_fignums() == open_before
+
+
+def test_violin_plots_use_fixed_seed_sample_for_large_frames(tmp_path, monkeypatch):
+    """Violins draw from a capped sample while box plots keep every row."""
+    from analyst_toolkit.m05_detect_outliers import plot_outliers
+
+    _, sns = plot_outliers._import_plotting()
+    monkeypatch.setattr(plot_outliers, "VIOLIN_SAMPLE_ROWS", 5)
+    seen = {}
+    monkeypatch.setattr(sns, "violinplot", lambda data, **_: seen.setdefault("violin", len(data)))
+    monkeypatch.setattr(sns, "boxplot", lambda data, **_: seen.setdefault("box", len(data)))
+    df = pd.DataFrame({"val": [1, 2, 3, 4, 5, 6, 7, 8, 9, 20]})
+    outlier_log = detect_outliers(df, {"detection_specs": {"val": {"method": "iqr"}}})[
+        "outlier_log"
+    ]
+
+    plot_outliers.generate_outlier_plots(
+        df, outlier_log, {"plot_save_dir": str(tmp_path), "plot_types": ["box", "violin"]}
+    )
+
+    assert seen == {"box": 10, "violin": 5}
+
+
+def test_outlier_plots_skip_missing_and_all_null_columns(tmp_path):
+    """Columns absent from the frame or entirely null produce no plots."""
+    from analyst_toolkit.m05_detect_outliers.plot_outliers import generate_outlier_plots
+
+    df = pd.DataFrame({"val": [1.0, 2.0, 30.0], "empty": [None, None, None]})
+    outlier_log = pd.DataFrame([{"column": "empty"}, {"column": "gone"}])
+
+    assert generate_outlier_plots(df, outlier_log, {"plot_save_dir": str(tmp_path)}) == {}
+    assert generate_outlier_plots(df, pd.DataFrame(), {"plot_save_dir": str(tmp_path)}) == {}
+
+
+def test_constant_columns_skip_bound_estimation(monkeypatch):
+    """Constant and all-null columns never reach the quantile/std pass."""
+    from analyst_toolkit.m05_detect_outliers import detect_outliers as detect_module
+
+    seen = []
+    resolve = detect_module._resolve_bounds_parallel
+
+    def spy(values, methods, factors):
+        seen.append(list(methods))
+        return resolve(values, methods, factors)
+
+    monkeypatch.setattr(detect_module, "_resolve_bounds_parallel", spy)
+    df = pd.DataFrame(
+        {
+            "flag": [1] * 10,
+            "empty": [None] * 10,
+            "val": [1, 2, 3, 4, 5, 6, 7, 8, 9, 20],
+        },
+        dtype=float,
+    )
+    config = {"detection_specs": {"__default__": {"method": "iqr"}}}
+
+    results = detect_outliers(df, config)
+
+    assert seen == [[None, None, "iqr"]]
+    assert results["outlier_log"]["column"].tolist() == ["val"]
+    assert list(results["outlier_flags"].columns) == ["val_iqr_outlier"]
+
+
+def test_threaded_bounds_match_serial(monkeypatch):
+    """Column-block threading yields the same bounds as the single-pass path."""
+    import numpy as np
+
+    from analyst_toolkit.m05_detect_outliers import detect_outliers as detect_module
+
+    rng = np.random.default_rng(0)
+    values = rng.normal(size=(200, 5))
+    values[::7, 2] = np.nan
+    methods = ["iqr", "zscore", "iqr", None, "zscore"]
+    factors = np.array([1.5, 3.0, 2.0, np.nan, 2.5])
+    serial = detect_module._resolve_bounds(values, methods, factors)
+
+    monkeypatch.setattr(detect_module, "PARALLEL_MIN_CELLS", 0)
+    monkeypatch.setattr(detect_module.os, "cpu_count", lambda: 3)
+    threaded = detect_module._resolve_bounds_parallel(values, methods, factors)
+
+    np.testing.assert_array_equal(threaded[0], serial[0])
+    np.testing.assert_array_equal(threaded[1], serial[1])
+
+
+def test_detection_modules_import_without_plotting_stack():
+    """Importing the detection pipeline does not pull in matplotlib or seaborn."""
+    import os
+    import subprocess
+    import sys
+
+    code = (
+        "import sys; import analyst_toolkit.m05_detect_outliers.run_detection_pipeline; "
+        "sys.exit(int(any(m in sys.modules for m in ('matplotlib', 'seaborn'))))"
+    )
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+    assert subprocess.run([sys.executable, "-c", code], env=env).returncode == 0
+
+
+def test_grid_layout_writes_one_figure_per_column(tmp_path):
+    """The grid layout fuses every plot kind for a column into a single PNG."""
+    from analyst_toolkit.m05_detect_outliers.plot_outliers import plot_outlier_grid
+
+    df = pd.DataFrame(
+        {
+            "a": [1, 2, 3, 4, 5, 6, 7, 8, 9, 20],
+            "b": [1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0, 8.0, 9.0, -30.0],
+            "grp": list("ab") * 5,
+        }
+    )
+    outlier_log = detect_outliers(df, {"detection_specs": {"__default__": {"method": "iqr"}}})[
+        "outlier_log"
+    ]
+
+    paths = plot_outlier_grid(df, outlier_log, {"plot_save_dir": str(tmp_path), "hue": "grp"})
+
+    assert sorted(paths) == ["a", "b"]
+    assert all(len(p) == 1 and p[0].endswith("_grid_default.png") for p in paths.values())
+    assert len(list(tmp_path.glob("*.png"))) == 2
+
+
+def test_numpy_flag_sweep_handles_partial_blocks(monkeypatch):
+    """The blocked NumPy sweep matches a plain comparison across block boundaries."""
+    import numpy as np
+
+    from analyst_toolkit.m05_detect_outliers import outlier_kernels
+
+    monkeypatch.setattr(outlier_kernels, "_NUMPY_BLOCK_ROWS", 7)
+    rng = np.random.default_rng(1)
+    values = rng.normal(size=(30, 3))
+    values[4, 1] = np.nan
+    lower = np.array([-1.0, np.nan, -0.5])
+    upper = np.array([1.0, 0.5, np.nan])
+
+    mask, counts = outlier_kernels._flag_numpy(values, lower, upper)
+
+    with np.errstate(invalid="ignore"):
+        expected = (values < lower) | (values > upper)
+    np.testing.assert_array_equal(mask, expected)
+    np.testing.assert_array_equal(counts, expected.sum(axis=0))
+
+
+def test_numeric_column_selection_matches_select_dtypes():
+    """Column selection keeps select_dtypes('number') semantics and frame order."""
+    import numpy as np
+
+    from analyst_toolkit.m05_detect_outliers.detect_outliers import _numeric_columns
+
+    df = pd.DataFrame(
+        {
+            "i": [1],
+            "flag": [True],
+            "label": ["x"],
+            "nullable": pd.array([1], dtype="Int64"),
+            "when": pd.to_datetime(["2024-01-01"]),
+            "small": np.array([1], dtype=np.uint8),
+            "f": [1.0],
+        }
+    )
+
+    for exclude in ([], ["f", "missing"]):
+        expected = df.select_dtypes(include=["number"]).columns.drop(exclude, errors="ignore")
+        assert _numeric_columns(df, exclude).equals(expected)
+
+
+def test_timedelta_bounds_are_logged_as_timedeltas_and_clip():
+    """Timedelta columns log Timedelta bounds, so clipping compares like with like."""
+    from analyst_toolkit.m06_outlier_handling.outlier_handler import handle_outliers
+
+    df = pd.DataFrame(
+        {
+            "lag": pd.to_timedelta([1, 2, 2, 3, 2, 3, 4, 60], unit="s"),
+            "x": [1.0, 2.0, 2.0, 3.0, 2.0, 3.0, 4.0, 100.0],
+        }
+    )
+    results = detect_outliers(df, {"detection_specs": {"__default__": {"method": "iqr"}}})
+
+    log = results["outlier_log"].set_index("column")
+    assert log.loc["lag", "lower_bound"] == pd.Timedelta("0.125s")
+    assert log.loc["lag", "upper_bound"] == pd.Timedelta("5.125s")
+    assert log.loc["x", "upper_bound"] == pytest.approx(5.125)
+
+    handled, _ = handle_outliers(
+        df, results, {"handling_specs": {"__default__": {"strategy": "clip"}}}
+    )
+    assert handled["lag"].dtype == df["lag"].dtype
+    assert handled["lag"].max() == pd.Timedelta("5.125s")
+    assert handled["x"].max() == pytest.approx(5.125)
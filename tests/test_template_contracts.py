@@ -6,6 +6,7 @@ from pathlib import Path
 
 import yaml
 
+import analyst_toolkit.mcp_server.templates as templates_module
 from analyst_toolkit.mcp_server.config_models import CONFIG_MODELS
 from analyst_toolkit.mcp_server.config_normalizers import normalize_module_config
 from analyst_toolkit.mcp_server.io import coerce_config
@@ -14,6 +15,7 @@ from analyst_toolkit.mcp_server.templates import (
     list_config_template_specs,
     list_template_resources,
     read_template_resource,
+    refresh_template_spec_cache,
 )
 from analyst_toolkit.mcp_server.tools.auto_heal import _INPUT_SCHEMA as AUTO_HEAL_INPUT_SCHEMA
 from analyst_toolkit.mcp_server.tools.data_dictionary import (
@@ -87,6 +89,27 @@ def test_golden_templates_have_known_top_level_sections():
         assert any(k != "description" for k in cfg), name
 
 
+def test_golden_configs_are_parsed_once_and_returned_as_copies(monkeypatch):
+    refresh_template_spec_cache()
+    loads = []
+    safe_load = templates_module.safe_load_yaml
+
+    def counting_safe_load(stream):
+        loads.append(stream)
+        return safe_load(stream)
+
+    monkeypatch.setattr(templates_module, "safe_load_yaml", counting_safe_load)
+    try:
+        first = get_golden_configs()
+        first["fraud_detection"]["description"] = "mutated"
+        second = get_golden_configs()
+    finally:
+        refresh_template_spec_cache()
+
+    assert len(loads) == len(second)
+    assert second["fraud_detection"]["description"] != "mutated"
+
+
 def test_public_module_templates_match_current_config_contracts():
     for spec in list_config_template_specs():
         if not spec.tool or not spec.config_root or spec.tool not in CONFIG_MODELS:
@@ -5,7 +5,7 @@ test_validation.py — Core logic tests for M02 Validation.
 import pandas as pd
 import pytest
 
-from analyst_toolkit.m02_validation.validate_data import run_validation_suite
+from analyst_toolkit.m02_validation.validate_data import compile_schema, run_validation_suite
 
 
 def test_validation_suite_checks():
@@ -43,3 +43,68 @@ def test_validation_suite_checks():
     # Verify categorical check failure for 'gender'
     assert results["categorical_values"]["passed"] is False
     assert "gender" in results["categorical_values"]["details"]
+
+
+def test_compile_schema_flags_rules_and_caches_by_schema():
+    """Compiled validators report per-rule pass/fail and are reused for identical schemas."""
+    df = pd.DataFrame({"age": [25, None, 150], "gender": ["M", "F", None]})
+    schema_cfg = {
+        "rules": {
+            "expected_columns": ["age", "gender"],
+            "expected_types": {"age": "float64"},
+            "numeric_ranges": {"age": {"min": 0, "max": 120}},
+            "categorical_values": {"gender": ["M", "F"], "missing_col": ["x"]},
+        }
+    }
+
+    validator = compile_schema(schema_cfg)
+    flags = validator(df)
+
+    assert flags == {
+        "schema_conformity": True,
+        "dtype_enforcement.age": True,
+        "categorical_values.gender": True,
+        "numeric_ranges.age": False,
+    }
+    assert compile_schema({"rules": dict(schema_cfg["rules"])}) is validator
+
+
+def test_compile_schema_treats_column_names_as_data():
+    """Column names from config are bound as constants, never spliced into source."""
+    col = "x'] = 1; import os; r['y"
+    df = pd.DataFrame({col: [1, 2]})
+
+    flags = compile_schema({"rules": {"numeric_ranges": {col: {"min": 0, "max": 1}}}})(df)
+
+    assert flags[f"numeric_ranges.{col}"] is False
+
+
+def test_run_validation_suite_reuses_results_for_same_frame_only_when_requested():
+    """Identity-keyed result reuse applies to the same frame object and rule set."""
+    df = pd.DataFrame({"age": [25, 150]})
+    config = {"schema_validation": {"rules": {"numeric_ranges": {"age": {"min": 0, "max": 120}}}}}
+
+    first = run_validation_suite(df, config=config, cache_results=True)
+    reused = run_validation_suite(df, config=config, reuse_cached=True)
+
+    assert reused is not first
+    assert reused["numeric_ranges"] is first["numeric_ranges"]
+    reused.pop("summary")
+    assert "summary" in run_validation_suite(df, config=config, reuse_cached=True)
+    assert run_validation_suite(df, config=config) is not first
+    assert run_validation_suite(df.copy(), config=config, reuse_cached=True) is not first
+
+
+def test_run_validation_suite_caches_only_when_asked():
+    """Plain runs leave nothing behind, so violating-row frames are not pinned."""
+    from analyst_toolkit.m02_validation import validate_data
+
+    df = pd.DataFrame({"age": [25, 150]})
+    config = {"schema_validation": {"rules": {"numeric_ranges": {"age": {"min": 0, "max": 120}}}}}
+
+    first = run_validation_suite(df, config=config)
+
+    assert not any(ref() is df for ref, _ in validate_data._RESULT_CACHE.values())
+    again = run_validation_suite(df, config=config, reuse_cached=True)
+    assert again is not first
+    assert again["numeric_ranges"] is not first["numeric_ranges"]
@@ -4,6 +4,8 @@ import pandas as pd
 
 from analyst_toolkit.m02_validation.validate_data import run_validation_suite
 from analyst_toolkit.mcp_server.config_normalizers import (
+    adapt_final_audit_config_to_dataframe,
+    adapt_validation_config_to_dataframe,
     normalize_final_audit_config,
     normalize_validation_config,
 )
@@ -78,3 +80,22 @@ def test_validation_and_final_audit_have_check_level_parity():
     checks = ["schema_conformity", "dtype_enforcement", "categorical_values", "numeric_ranges"]
     for check in checks:
         assert validation_results[check]["passed"] == final_results[check]["passed"]
+
+
+def test_normalizers_leave_nested_input_sections_untouched():
+    config = {
+        "schema_validation": {"rules": {"expected_columns": ["id"]}},
+        "certification": {"schema_validation": {"rules": {"expected_columns": ["id"]}}},
+        "rules": {"expected_types": {"id": "int64"}},
+    }
+    df = pd.DataFrame({"id": [1], "id_outlier_flag": [False]})
+    snapshot = {
+        "schema_validation": {"rules": {"expected_columns": ["id"]}},
+        "certification": {"schema_validation": {"rules": {"expected_columns": ["id"]}}},
+        "rules": {"expected_types": {"id": "int64"}},
+    }
+
+    adapt_validation_config_to_dataframe(config, df)
+    adapt_final_audit_config_to_dataframe(config, df)
+
+    assert config == snapshot